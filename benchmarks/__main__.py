@@ -0,0 +1,87 @@
+"""
+Render-time benchmarks for every block and templatetag.
+
+Run from the project root with `python -m benchmarks`. Results are printed and written to a JSON file, which can be
+passed back with `--compare` to see the change against an earlier run.
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+from benchmarks.environment import setup_database, setup_django
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default='benchmark-results.json', help="JSON file to write the results to")
+    parser.add_argument('--compare', help="JSON file from an earlier run to compare the results with")
+    parser.add_argument('--filter', default='', help="Only run benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timing runs per benchmark")
+    parser.add_argument(
+        '--enable', action='append', default=[], metavar='SETTING',
+        help="Enable a WAGTAILNHSUKFRONTEND_ setting for the run, e.g. --enable PAGE_TREE_INDEX",
+    )
+    return parser.parse_args()
+
+
+def get_meta(args):
+    import django
+    import wagtail
+
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'wagtail': wagtail.__version__,
+        'enabled_settings': args.enable,
+        'repeat': args.repeat,
+    }
+
+
+def main():
+    args = parse_args()
+    setup_django()
+
+    from django.conf import settings
+    for name in args.enable:
+        setattr(settings, 'WAGTAILNHSUKFRONTEND_{}'.format(name), True)
+
+    teardown = setup_database()
+    try:
+        from django.test import RequestFactory
+
+        from benchmarks import blocks, tags
+        from benchmarks.runner import measure
+
+        baseline = {}
+        if args.compare:
+            with open(args.compare) as f:
+                baseline = json.load(f)['results']
+
+        request = RequestFactory().get('/')
+        results = {}
+        for suite in [blocks, tags]:
+            for name, func in suite.get_cases(request):
+                if args.filter not in name:
+                    continue
+                results[name] = result = measure(func, repeat=args.repeat)
+
+                line = '{:<44} {:>10.3f}ms {:>10.3f}ms cold {:>4} queries {:>4} cold'.format(
+                    name, result['median_ms'], result['cold_ms'], result['queries'], result['cold_queries'],
+                )
+                if name in baseline:
+                    line += '   {:+.1%}'.format(result['median_ms'] / baseline[name]['median_ms'] - 1)
+                print(line)
+                sys.stdout.flush()
+    finally:
+        teardown()
+
+    with open(args.output, 'w') as f:
+        json.dump({'meta': get_meta(args), 'results': results}, f, indent=2)
+    print('Results written to {}'.format(args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""
+Render-time benchmarks for every block in `wagtailnhsukfrontend.blocks`.
+
+Each block is rendered with a small, a typical and a pathological value. `n` is the number of list items, stream
+children or paragraphs, depending on the block.
+"""
+from wagtail.core.models import Page
+from wagtail.images import get_image_model
+
+from wagtailnhsukfrontend import blocks
+
+SIZES = {
+    'small': 1,
+    'typical': 5,
+    'pathological': 50,
+}
+
+IMAGE_ID = 1
+INTERNAL_PAGE_ID = 4
+
+
+def paragraphs(n):
+    return ''.join('<p>Paragraph {} with <a href="https://www.nhs.uk">a link</a>.</p>'.format(i) for i in range(n))
+
+
+def action_link(n):
+    return {'text': 'Find your nearest A&E', 'external_url': '', 'new_window': False, 'internal_page': INTERNAL_PAGE_ID}
+
+
+def callout(n):
+    return {'title': 'Important', 'visually_hidden_prefix': False, 'heading_level': 3, 'body': paragraphs(n)}
+
+
+def inset_text(n):
+    return {'body': paragraphs(n)}
+
+
+def panel(n):
+    return {'label': 'Panel', 'heading_level': 3, 'body': paragraphs(n)}
+
+
+def panel_list(n):
+    return {'panels': [{'left_panel': panel(1), 'right_panel': panel(1)} for i in range(n)]}
+
+
+def do_list(n):
+    return {'heading_level': 3, 'label': '', 'do': [paragraphs(1) for i in range(n)]}
+
+
+def dont_list(n):
+    return {'heading_level': 3, 'label': '', 'dont': [paragraphs(1) for i in range(n)]}
+
+
+def image(n):
+    return {'content_image': IMAGE_ID, 'alt_text': 'Test card', 'caption': 'Caption'}
+
+
+def promo(n):
+    return {
+        'url': 'https://www.nhs.uk',
+        'heading': 'Promo',
+        'description': 'Description',
+        'content_image': IMAGE_ID,
+        'alt_text': 'Test card',
+        'size': '',
+        'heading_level': 3,
+    }
+
+
+def promo_group(n):
+    return {
+        'column': 'one-half',
+        'size': '',
+        'heading_level': 3,
+        'promos': [promo(1) for i in range(n)],
+    }
+
+
+def summary_list(n):
+    return {
+        'rows': [{'key': 'Key {}'.format(i), 'value': paragraphs(1)} for i in range(n)],
+        'no_border': False,
+    }
+
+
+def card_basic(n):
+    return {'heading': 'Card', 'heading_level': 3, 'heading_size': '', 'body': paragraphs(n)}
+
+
+def card_clickable(n):
+    return dict(card_basic(n), internal_page=INTERNAL_PAGE_ID, url='')
+
+
+def card_image(n):
+    return dict(card_basic(n), content_image=IMAGE_ID, alt_text='Test card', url='', internal_page=None)
+
+
+def card_feature(n):
+    return {'feature_heading': 'Feature', 'heading_level': 3, 'heading_size': '', 'body': paragraphs(n)}
+
+
+def card_group(n):
+    cards = [
+        ('card_basic', card_basic),
+        ('card_clickable', card_clickable),
+        ('card_image', card_image),
+        ('card_feature', card_feature),
+    ]
+    return {
+        'column': 'one-half',
+        'body': [{'type': cards[i % 4][0], 'value': cards[i % 4][1](1)} for i in range(n)],
+    }
+
+
+def details_body(n):
+    children = [
+        ('richtext', paragraphs),
+        ('inset_text', inset_text),
+        ('image', image),
+        ('warning_callout', callout),
+        ('summary_list', summary_list),
+        ('action_link', action_link),
+    ]
+    return [{'type': children[i % 6][0], 'value': children[i % 6][1](1)} for i in range(n)]
+
+
+def details(n):
+    return {'title': 'Details', 'body': details_body(n)}
+
+
+def expander_group(n):
+    return {'expanders': [details(2) for i in range(n)]}
+
+
+def care_card(n):
+    return {'type': 'primary', 'heading_level': 3, 'title': 'Care card', 'body': details_body(n)}
+
+
+BLOCKS = [
+    (blocks.ActionLinkBlock, action_link),
+    (blocks.WarningCalloutBlock, callout),
+    (blocks.InsetTextBlock, inset_text),
+    (blocks.PanelBlock, panel),
+    (blocks.GreyPanelBlock, panel),
+    (blocks.PanelListBlock, panel_list),
+    (blocks.DoBlock, do_list),
+    (blocks.DontBlock, dont_list),
+    (blocks.ImageBlock, image),
+    (blocks.PromoBlock, promo),
+    (blocks.PromoGroupBlock, promo_group),
+    (blocks.SummaryListBlock, summary_list),
+    (blocks.CardBasicBlock, card_basic),
+    (blocks.CardClickableBlock, card_clickable),
+    (blocks.CardImageBlock, card_image),
+    (blocks.CardFeatureBlock, card_feature),
+    (blocks.CardGroupBlock, card_group),
+    (blocks.DetailsBlock, details),
+    (blocks.ExpanderBlock, details),
+    (blocks.ExpanderGroupBlock, expander_group),
+    (blocks.CareCardBlock, care_card),
+]
+
+# Blocks whose value has nothing that grows with `n`
+FIXED_SIZE_BLOCKS = {blocks.ActionLinkBlock, blocks.ImageBlock, blocks.PromoBlock}
+
+
+def get_cases(request):
+    """
+    Yield `(name, func)` pairs, where calling `func` renders a block.
+    Values are converted with `to_python` up front, so only rendering is timed.
+    """
+    page = Page.objects.get(id=INTERNAL_PAGE_ID).specific
+    context = {'page': page, 'request': request}
+
+    # Make sure the benchmark images exist before any values refer to them
+    get_image_model().objects.get(id=IMAGE_ID)
+
+    for block_class, make_value in BLOCKS:
+        block = block_class()
+        sizes = ['small'] if block_class in FIXED_SIZE_BLOCKS else SIZES
+        for size in sizes:
+            value = block.to_python(make_value(SIZES[size]))
+            yield (
+                'blocks.{}.{}'.format(block_class.__name__, size),
+                lambda block=block, value=value: block.render(value, context),
+            )
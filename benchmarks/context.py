@@ -0,0 +1,143 @@
+"""
+Compare the cost of FlattenValueContext with a context which looks up the fields of a block's value instead of
+copying them.
+
+The lookup context made no consistent difference: get_context and render times were within noise of each other, as
+rendering is dominated by the templates. So NHS.UK blocks keep FlattenValueContext, and the alternative only lives
+here, to measure against if the block context changes.
+
+Run from the project root with `python -m benchmarks.context`
+"""
+import timeit
+
+from benchmarks.environment import setup_django
+
+setup_django()
+
+from wagtailnhsukfrontend.blocks import CareCardBlock, ExpanderGroupBlock, FlattenValueContext  # noqa: E402
+
+
+class StructValueContext(dict):
+    """
+    A template context which looks up the fields of a StructValue, and then the parent context, without copying either.
+    Values set on the context itself take precedence over both.
+    """
+
+    def __init__(self, value, parent_context=None):
+        super().__init__()
+        self.value = value
+        self.parent_context = parent_context if parent_context is not None else {}
+
+    def __getitem__(self, key):
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key in self.value:
+            return self.value[key]
+        return self.parent_context[key]
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.value or key in self.parent_context
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        # Ordered like a flattened context, so that copying this context with dict() gives the same result
+        return dict.fromkeys([*self.parent_context, *self.value, *dict.keys(self)]).keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+
+def get_lazy_context(self, value, parent_context=None):
+    """Equivalent to `FlattenValueContext.get_context`, with a StructValueContext instead of a copy."""
+    context = StructValueContext(value, parent_context)
+    context.update({
+        'self': value,
+        self.TEMPLATE_VAR: value,
+    })
+    return context
+
+
+PARENT_CONTEXT = {'page': None, 'request': None, **{'var_{}'.format(i): i for i in range(30)}}
+
+
+def care_card_value():
+    return CareCardBlock().to_python({
+        'type': 'urgent',
+        'heading_level': 3,
+        'title': 'Care card',
+        'body': [
+            {
+                'type': 'details',
+                'value': {
+                    'title': 'Details',
+                    'body': [
+                        {
+                            'type': 'summary_list',
+                            'value': {
+                                'rows': [{'key': 'Key {}'.format(i), 'value': '<p>Value</p>'} for i in range(10)],
+                                'no_border': False,
+                            },
+                        },
+                    ],
+                },
+            },
+        ],
+    })
+
+
+def expander_group_value():
+    return ExpanderGroupBlock().to_python({
+        'expanders': [
+            {
+                'title': 'Expander {}'.format(i),
+                'body': [
+                    {'type': 'richtext', 'value': '<p>Body</p>'},
+                    {'type': 'inset_text', 'value': {'body': '<p>Inset text</p>'}},
+                ],
+            }
+            for i in range(30)
+        ],
+    })
+
+
+def time(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def run(label):
+    results = {}
+    for name, block, value in [
+        ('CareCardBlock', CareCardBlock(), care_card_value()),
+        ('ExpanderGroupBlock (30 expanders)', ExpanderGroupBlock(), expander_group_value()),
+    ]:
+        results[name] = (
+            time(lambda: block.get_context(value, dict(PARENT_CONTEXT)), 10000),
+            time(lambda: block.render(value, PARENT_CONTEXT), 20),
+        )
+        print('{:<10} {:<36} get_context {:>8.2f}us   render {:>8.2f}ms'.format(
+            label, name, results[name][0] * 1e6, results[name][1] * 1e3,
+        ))
+    return results
+
+
+def main():
+    run('flatten')
+
+    # Swap the implementation for every NHS block, including the nested ones, for the second run
+    FlattenValueContext.get_context = get_lazy_context
+    run('lazy')
+
+
+if __name__ == '__main__':
+    main()
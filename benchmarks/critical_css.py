@@ -0,0 +1,103 @@
+"""
+Compare pages rendered with the critical CSS inlined against pages with an ordinary stylesheet link.
+
+For each testapp page this reports the render time, the gzipped size of the HTML, and the gzipped size of the package
+CSS which blocks the first paint. It also checks the critical CSS against the rendered markup above `<main>`, reporting any
+rules that markup uses which the critical CSS is missing.
+
+Build the assets with `python setup.py build` first, then run from the project root with
+`python -m benchmarks.critical_css`
+"""
+import gzip
+import os
+import sys
+import timeit
+from unittest import mock
+
+from benchmarks.environment import setup_database, setup_django
+
+PAGES = [
+    '/',
+    '/page-1/page-2/',
+    '/pagination/pagination-page-2/',
+    '/promo-hub/',
+]
+
+BUNDLE = 'css/wagtail-nhsuk-frontend.min.css'
+
+
+def gzipped_size(content):
+    return len(gzip.compress(content.encode() if isinstance(content, str) else content))
+
+
+def selectors(css):
+    """Return the set of (at-rule, selector) pairs in a stylesheet."""
+    from wagtailnhsukfrontend.critical_css import COMMENT, parse_css, split_selectors
+
+    found = set()
+
+    def walk(rules, at_rule):
+        for prelude, body in rules:
+            if isinstance(body, list):
+                walk(body, prelude)
+            elif not prelude.startswith('@'):
+                found.update((at_rule, selector) for selector in split_selectors(prelude))
+
+    walk(parse_css(COMMENT.sub('', css))[0], '')
+    return found
+
+
+def main():
+    setup_django()
+
+    from django.test import Client
+
+    from wagtailnhsukfrontend.assets import STATIC_DIR, get_critical_css
+    from wagtailnhsukfrontend.critical_css import CRITICAL_ELEMENTS, UsedSelectors, extract_critical_css
+
+    critical_css = get_critical_css(BUNDLE)
+    if critical_css is None:
+        sys.exit('Build the assets with `python setup.py build` first')
+    with open(os.path.join(STATIC_DIR, BUNDLE)) as f:
+        full_css = f.read()
+    critical_selectors = selectors(critical_css)
+
+    print('Full stylesheet {:>8} bytes gzipped'.format(gzipped_size(full_css)))
+    print('Critical CSS    {:>8} bytes gzipped'.format(gzipped_size(critical_css)))
+    print()
+    print('{:<32} {:>22} {:>22} {:>22} {:>8}'.format(
+        'page', 'render (link/inline)', 'html gz (link/inline)', 'css gz (link/inline)', 'missing',
+    ))
+
+    teardown = setup_database()
+    try:
+        client = Client()
+        for url in PAGES:
+            def render():
+                return client.get(url).content.decode()
+
+            with mock.patch('wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_critical_css', return_value=None):
+                link_html = render()
+                link_time = min(timeit.repeat(render, number=10, repeat=3)) / 10
+            inline_html = render()
+            inline_time = min(timeit.repeat(render, number=10, repeat=3)) / 10
+
+            used = UsedSelectors(elements=CRITICAL_ELEMENTS)
+            used.add_markup(inline_html[:inline_html.index('<main')])
+            missing = selectors(extract_critical_css(full_css, used)) - critical_selectors
+
+            print('{:<32} {:>9.2f}ms/{:>7.2f}ms {:>10}/{:>10} {:>10}/{:>10} {:>8}'.format(
+                url,
+                link_time * 1e3, inline_time * 1e3,
+                gzipped_size(link_html), gzipped_size(inline_html),
+                gzipped_size(full_css), 0,
+                len(missing),
+            ))
+            for at_rule, selector in sorted(missing):
+                print('    missing: {} {}'.format(at_rule, selector))
+    finally:
+        teardown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TESTAPP_DIR = os.path.join(ROOT_DIR, 'testapp')
+
+
+def setup_django():
+    """Configure django with the testapp settings."""
+    if TESTAPP_DIR not in sys.path:
+        sys.path.insert(0, TESTAPP_DIR)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'testapp.settings.dev')
+
+    import django
+    django.setup()
+
+
+def setup_database():
+    """
+    Create a test database with the testapp fixture loaded, and a temporary MEDIA_ROOT so that generated
+    renditions don't end up in the testapp.
+    Returns a function which tears both down again.
+    """
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.test.utils import setup_databases, setup_test_environment, teardown_databases
+
+    media_root = tempfile.mkdtemp()
+    shutil.copytree(
+        os.path.join(TESTAPP_DIR, 'media', 'original_images'),
+        os.path.join(media_root, 'original_images'),
+    )
+    settings.MEDIA_ROOT = media_root
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    call_command('loaddata', os.path.join(TESTAPP_DIR, 'testdata.json'), verbosity=0)
+
+    def teardown():
+        teardown_databases(old_config, verbosity=0)
+        shutil.rmtree(media_root)
+
+    return teardown
@@ -0,0 +1,104 @@
+"""
+Time the review dates report on a site with 100,000 pages using `ReviewDateMixin`, a tenth of them due for review.
+
+Reports how long the first row and the whole report take to stream, and the peak memory used while streaming.
+
+Run from the project root with `python -m benchmarks.review_dates`
+"""
+from datetime import timedelta
+import random
+import time
+import tracemalloc
+
+from benchmarks.environment import setup_database, setup_django
+
+PAGES = 100000
+DUE_FRACTION = 0.1
+BATCH_SIZE = 5000
+
+
+def create_pages(count):
+    """
+    Add `count` HomePages under the home page. Wagtail creates pages one at a time, so the rows are inserted in
+    bulk instead.
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from django.db import connection
+    from django.utils import timezone
+    from wagtail.core.models import Page
+
+    from home.models import HomePage
+
+    home = Page.objects.get(id=3)
+    content_type = ContentType.objects.get_for_model(HomePage)
+    now = timezone.now()
+    rng = random.Random(0)
+    first_step = home.numchild + 1
+
+    pages = [
+        Page(
+            title='Review page {}'.format(i),
+            slug='review-page-{}'.format(i),
+            path=Page._get_path(home.path, home.depth + 1, first_step + i),
+            depth=home.depth + 1,
+            url_path='{}review-page-{}/'.format(home.url_path, i),
+            content_type=content_type,
+            locale_id=home.locale_id,
+            live=True,
+        )
+        for i in range(count)
+    ]
+    Page.objects.bulk_create(pages, batch_size=BATCH_SIZE)
+    Page.objects.filter(id=home.id).update(numchild=home.numchild + count)
+
+    def review_date(i):
+        if rng.random() < DUE_FRACTION:
+            return now + timedelta(days=rng.randint(-365, 29))
+        return now + timedelta(days=rng.randint(31, 730))
+
+    ids = Page.objects.filter(path__startswith=home.path, depth=home.depth + 1, slug__startswith='review-page-')
+    fields = HomePage._meta.local_concrete_fields
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        HomePage._meta.db_table,
+        ', '.join(field.column for field in fields),
+        ', '.join(['%s'] * len(fields)),
+    )
+    rows = []
+    for i, page_id in enumerate(ids.values_list('id', flat=True).iterator()):
+        page = HomePage(page_ptr_id=page_id, next_review_date=review_date(i), hero_heading='Review', body='[]')
+        rows.append([field.get_db_prep_save(field.pre_save(page, True), connection) for field in fields])
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), BATCH_SIZE):
+            cursor.executemany(sql, rows[start:start + BATCH_SIZE])
+
+
+def main():
+    setup_django()
+
+    from wagtailnhsukfrontend.review_dates import get_review_dates_report
+
+    teardown = setup_database()
+    try:
+        start = time.perf_counter()
+        create_pages(PAGES)
+        print('Created {} pages in {:.1f}s'.format(PAGES, time.perf_counter() - start))
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        rows = get_review_dates_report().iterator(chunk_size=2000)
+        next(rows)
+        first_row = time.perf_counter() - start
+        count = 1 + sum(1 for row in rows)
+        total = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print('{} rows: first after {:.0f}ms, all after {:.0f}ms, peak memory {:.1f}MB'.format(
+            count, first_row * 1e3, total * 1e3, peak / 1e6,
+        ))
+    finally:
+        teardown()
+
+
+if __name__ == '__main__':
+    main()
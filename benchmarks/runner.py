@@ -0,0 +1,40 @@
+import statistics
+import timeit
+
+from django.db import connection, reset_queries
+from django.test.utils import CaptureQueriesContext
+
+from wagtailnhsukfrontend.cache import get_cache
+
+
+def count_queries(func):
+    # The query log is a bounded deque, so it has to be emptied for CaptureQueriesContext to count correctly
+    reset_queries()
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return len(queries)
+
+
+def measure(func, repeat=5):
+    """
+    Time `func` and return a dict of results, in milliseconds per call.
+    The first call is made with an empty cache and is reported separately as `cold_ms`.
+    """
+    get_cache().clear()
+    cold = timeit.timeit(func, number=1)
+    get_cache().clear()
+    cold_queries = count_queries(func)
+    queries = count_queries(func)
+
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [time / number for time in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        'cold_ms': cold * 1e3,
+        'min_ms': min(times) * 1e3,
+        'median_ms': statistics.median(times) * 1e3,
+        'cold_queries': cold_queries,
+        'queries': queries,
+        'calls': number * repeat,
+    }
@@ -0,0 +1,104 @@
+"""
+Time searches of the built-in search index on a site with 50,000 pages.
+
+Each page has a search description of words drawn from a vocabulary with a Zipf-like distribution, so a few words
+appear on most pages and most words on only a few, as in real text. Reports how long the index takes to build, and
+the median time of single-term and multi-term searches of the default site, as the results view makes them,
+including looking up the first page of results.
+
+Run from the project root with `python -m benchmarks.search`
+"""
+import itertools
+import random
+import statistics
+import time
+
+from benchmarks.environment import setup_database, setup_django
+
+PAGES = 50000
+VOCABULARY = 20000
+WORDS_PER_PAGE = 60
+SEARCHES = 50
+BATCH_SIZE = 5000
+
+
+WORDS = ['word{}'.format(i) for i in range(VOCABULARY)]
+CUMULATIVE_WEIGHTS = list(itertools.accumulate(1 / rank for rank in range(1, VOCABULARY + 1)))
+
+
+def get_words(rng, count):
+    return rng.choices(WORDS, cum_weights=CUMULATIVE_WEIGHTS, k=count)
+
+
+def create_pages(count, rng):
+    """
+    Add `count` pages under the home page. Wagtail creates pages one at a time, so the rows are inserted in
+    bulk instead.
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from wagtail.core.models import Page
+
+    home = Page.objects.get(id=3)
+    content_type = ContentType.objects.get_for_model(Page)
+    first_step = home.numchild + 1
+
+    pages = [
+        Page(
+            title='Search page {}'.format(i),
+            slug='search-page-{}'.format(i),
+            path=Page._get_path(home.path, home.depth + 1, first_step + i),
+            depth=home.depth + 1,
+            url_path='{}search-page-{}/'.format(home.url_path, i),
+            content_type=content_type,
+            locale_id=home.locale_id,
+            live=True,
+            search_description=' '.join(get_words(rng, WORDS_PER_PAGE)),
+        )
+        for i in range(count)
+    ]
+    Page.objects.bulk_create(pages, batch_size=BATCH_SIZE)
+    Page.objects.filter(id=home.id).update(numchild=home.numchild + count)
+
+
+def time_searches(queries, root_page):
+    from wagtailnhsukfrontend.search.index import search
+
+    times = []
+    for query in queries:
+        start = time.perf_counter()
+        results = search(query, root_page=root_page)
+        len(results)
+        results[:10]
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    setup_django()
+
+    from wagtail.core.models import Site
+
+    from wagtailnhsukfrontend.search.index import rebuild_index
+
+    teardown = setup_database()
+    try:
+        rng = random.Random(0)
+        start = time.perf_counter()
+        create_pages(PAGES, rng)
+        print('Created {} pages in {:.1f}s'.format(PAGES, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        count = rebuild_index()
+        print('Indexed {} pages in {:.1f}s'.format(count, time.perf_counter() - start))
+
+        # Searched like the results view, within the default site
+        site = Site.objects.get(is_default_site=True)
+        for name, terms in [('1 term', 1), ('2 terms', 2), ('3 terms', 3)]:
+            queries = [' '.join(get_words(rng, terms)) for i in range(SEARCHES)]
+            print('{}: median {:.1f}ms'.format(name, time_searches(queries, site.root_page) * 1e3))
+    finally:
+        teardown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare the time to the first byte of each testapp page with and without `StreamingPageMiddleware`.
+
+Run from the project root with `python -m benchmarks.streaming`
+"""
+import time
+
+from benchmarks.environment import setup_database, setup_django
+
+PAGES = [
+    '/',
+    '/page-1/page-2/',
+    '/pagination/pagination-page-2/',
+    '/promo-hub/',
+]
+
+REPEAT = 20
+
+
+def time_response(handler, environ):
+    """Return the time to the first chunk of the response and to the whole response, in seconds."""
+    start = time.perf_counter()
+    response = handler(dict(environ), lambda status, headers: None)
+    content = iter(response)
+    next(content)
+    first = time.perf_counter() - start
+    for chunk in content:
+        pass
+    # Sends request_finished, as a WSGI server would
+    response.close()
+    return first, time.perf_counter() - start
+
+
+def main():
+    setup_django()
+
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.test import RequestFactory
+    from django.test.utils import override_settings
+
+    teardown = setup_database()
+    try:
+        middleware = {
+            'default': settings.MIDDLEWARE,
+            'streaming': settings.MIDDLEWARE + ['wagtailnhsukfrontend.middleware.StreamingPageMiddleware'],
+        }
+        results = {}
+        for name, classes in middleware.items():
+            with override_settings(MIDDLEWARE=classes):
+                # Served by django's WSGI handler, as the test client collects the context of every template it renders
+                handler = WSGIHandler()
+                for url in PAGES:
+                    environ = RequestFactory()._base_environ(PATH_INFO=url)
+                    time_response(handler, environ)
+                    timings = [time_response(handler, environ) for i in range(REPEAT)]
+                    results[name, url] = [min(timing) for timing in zip(*timings)]
+
+        print('{:<32} {:>30} {:>26}'.format('page', 'first byte (default/streaming)', 'last byte'))
+        for url in PAGES:
+            default, streaming = results['default', url], results['streaming', url]
+            print('{:<32} {:>14.2f}ms/{:>7.2f}ms {:>14.2f}ms/{:>7.2f}ms'.format(
+                url, default[0] * 1e3, streaming[0] * 1e3, default[1] * 1e3, streaming[1] * 1e3,
+            ))
+    finally:
+        teardown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Render-time benchmarks for the templatetags in `nhsukfrontend_tags` and `nhsukfrontendsettings_tags`.
+
+The navigation tags are benchmarked on a small, a typical and a pathological part of the page tree, e.g. a breadcrumb
+12 pages deep and a contents list with 200 siblings. The header and footer are benchmarked with a site per size,
+each with its own settings.
+"""
+from django.template import Context, Template
+from django.test import RequestFactory
+from wagtail.core.models import Page, Site
+from wagtail.images import get_image_model
+
+from home.models import ChildPage
+from wagtailnhsukfrontend.settings.models import (
+    FooterLinks,
+    FooterSettings,
+    HeaderSettings,
+    NavigationLink,
+)
+
+HOME_PAGE_ID = 3
+
+# Fixture pages, used for the small cases
+BREADCRUMB_PAGE_ID = 5
+PAGINATION_PAGE_ID = 9
+
+SIBLING_COUNTS = {
+    'typical': 20,
+    'pathological': 200,
+}
+
+BREADCRUMB_DEPTHS = {
+    'typical': 5,
+    'pathological': 12,
+}
+
+HEADER_LINK_COUNTS = {
+    'typical': 8,
+    'pathological': 50,
+}
+
+FOOTER_LINK_COUNTS = {
+    'typical': 9,
+    'pathological': 50,
+}
+
+CHUNK_LENGTHS = {
+    'small': 1,
+    'typical': 6,
+    'pathological': 200,
+}
+
+
+def create_child_pages(parent, count, title):
+    pages = []
+    for i in range(count):
+        pages.append(parent.add_child(instance=ChildPage(
+            title='{} {}'.format(title, i),
+            slug='{}-{}'.format(title.lower().replace(' ', '-'), i),
+        )))
+    return pages
+
+
+def create_pages():
+    """
+    Add the typical and pathological page trees, returning the page to render the navigation tags on for each size.
+    """
+    home = Page.objects.get(id=HOME_PAGE_ID)
+    breadcrumb_pages = {'small': Page.objects.get(id=BREADCRUMB_PAGE_ID)}
+    sibling_pages = {'small': Page.objects.get(id=PAGINATION_PAGE_ID)}
+
+    for size, depth in BREADCRUMB_DEPTHS.items():
+        page = home
+        # The site root is the first breadcrumb, so `depth` breadcrumbs need `depth - 1` pages above the current one
+        for i in range(depth):
+            page = create_child_pages(page, 1, 'Depth {} {}'.format(size, i))[0]
+        breadcrumb_pages[size] = page
+
+    for size, count in SIBLING_COUNTS.items():
+        parent = create_child_pages(home, 1, 'Siblings {}'.format(size))[0]
+        siblings = create_child_pages(parent, count, 'Sibling {}'.format(size))
+        sibling_pages[size] = siblings[count // 2]
+
+    return breadcrumb_pages, sibling_pages
+
+
+def create_sites():
+    """
+    Add a site for the typical and pathological header and footer, returning the hostname to request for each size.
+    """
+    home = Page.objects.get(id=HOME_PAGE_ID)
+    hostnames = {'small': Site.objects.get(is_default_site=True).hostname}
+
+    for size in ['typical', 'pathological']:
+        site = Site.objects.create(hostname='{}.localhost'.format(size), root_page=home)
+
+        header = HeaderSettings.objects.create(site=site, service_name='Benchmark', show_search=True)
+        NavigationLink.objects.bulk_create([
+            NavigationLink(setting=header, label='Link {}'.format(i), page=home, sort_order=i)
+            for i in range(HEADER_LINK_COUNTS[size])
+        ])
+
+        footer = FooterSettings.objects.create(site=site)
+        FooterLinks.objects.bulk_create([
+            FooterLinks(setting=footer, link_url='https://www.nhs.uk', link_label='Link {}'.format(i), sort_order=i)
+            for i in range(FOOTER_LINK_COUNTS[size])
+        ])
+
+        hostnames[size] = site.hostname
+
+    return hostnames
+
+
+def render_case(source, page, request, **context):
+    template = Template(source)
+    context = Context(dict(context, page=page, request=request))
+    return lambda: template.render(context)
+
+
+def get_cases(request):
+    """
+    Yield `(name, func)` pairs, where calling `func` renders a template using one tag.
+    """
+    factory = RequestFactory()
+    breadcrumb_pages, sibling_pages = create_pages()
+    hostnames = create_sites()
+
+    for size, page in breadcrumb_pages.items():
+        yield 'tags.breadcrumb.{}'.format(size), render_case(
+            '{% load nhsukfrontend_tags %}{% breadcrumb %}', page, request,
+        )
+
+    for size, page in sibling_pages.items():
+        yield 'tags.pagination.{}'.format(size), render_case(
+            '{% load nhsukfrontend_tags %}{% pagination %}', page, request,
+        )
+        yield 'tags.contents_list.{}'.format(size), render_case(
+            '{% load nhsukfrontend_tags %}{% contents_list %}', page, request,
+        )
+
+    page = breadcrumb_pages['small']
+    yield 'tags.nhsuk_pageurl.small', render_case(
+        '{% load nhsukfrontend_tags %}{% nhsuk_pageurl page %}', page, request,
+    )
+    yield 'tags.nhsuk_rendition.small', render_case(
+        '{% load nhsukfrontend_tags %}{% nhsuk_rendition image "width-640" as rendition %}{{ rendition.url }}',
+        page, request, image=get_image_model().objects.first(),
+    )
+    yield 'tags.promo_group_column_class.small', render_case(
+        '{% load nhsukfrontend_tags %}{% promo_group_column_class 3 %}', page, request,
+    )
+    for size, length in CHUNK_LENGTHS.items():
+        yield 'tags.chunk.{}'.format(size), render_case(
+            '{% load nhsukfrontend_tags %}{% for row in items|chunk:3 %}{{ row|length }}{% endfor %}',
+            page, request, items=list(range(length)),
+        )
+
+    for size, hostname in hostnames.items():
+        site_request = factory.get('/', HTTP_HOST=hostname)
+        yield 'tags.header.{}'.format(size), render_case(
+            '{% load nhsukfrontendsettings_tags %}{% header %}', page, site_request,
+        )
+        yield 'tags.footer.{}'.format(size), render_case(
+            '{% load nhsukfrontendsettings_tags %}{% footer %}', page, site_request,
+        )
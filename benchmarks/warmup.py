@@ -0,0 +1,80 @@
+"""
+Compare the first requests served by a new process with and without `warm_up()`.
+
+Each mode runs in a fresh process, which loads the testapp fixture into a test database and then times its first
+and second request to each testapp page. Templates are cached by django's cached loader, as they are with DEBUG off.
+
+Run from the project root with `python -m benchmarks.warmup`
+"""
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks.environment import setup_database, setup_django
+
+PAGES = [
+    '/',
+    '/page-1/page-2/',
+    '/pagination/pagination-page-2/',
+    '/promo-hub/',
+]
+
+MODES = ['cold', 'warm']
+
+
+def run(mode):
+    """Time the first and second request to each page, returning `{url: [first, second]}` in seconds."""
+    setup_django()
+
+    from django.conf import settings
+    # Turn DEBUG off before the template engines are created, so that they use the cached loader
+    settings.DEBUG = False
+    teardown = setup_database()
+    try:
+        from django.test import Client
+
+        from wagtailnhsukfrontend.warmup import uses_cached_loader, warm_up
+
+        assert uses_cached_loader()
+        timings = {}
+        if mode == 'warm':
+            timings['warm_up'] = sum(warm_up(prime_settings=True).values())
+
+        client = Client()
+        for url in PAGES:
+            timings[url] = []
+            for i in range(2):
+                start = time.perf_counter()
+                client.get(url)
+                timings[url].append(time.perf_counter() - start)
+        return timings
+    finally:
+        teardown()
+
+
+def main():
+    if len(sys.argv) == 2 and sys.argv[1] in MODES:
+        print(json.dumps(run(sys.argv[1])))
+        return
+
+    results = {}
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.warmup', mode],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True,
+        ).stdout
+        results[mode] = json.loads(output.splitlines()[-1])
+
+    print('warm_up() took {:.1f}ms'.format(results['warm']['warm_up'] * 1e3))
+    print()
+    print('{:<32} {:>22} {:>22}'.format('page', 'first request (cold/warm)', 'second request'))
+    for url in PAGES:
+        cold, warm = results['cold'][url], results['warm'][url]
+        print('{:<32} {:>11.1f}ms/{:>7.1f}ms {:>13.1f}ms/{:>6.1f}ms'.format(
+            url, cold[0] * 1e3, warm[0] * 1e3, cold[1] * 1e3, warm[1] * 1e3,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Compare the HTML rendered with django's template loader against `wagtailnhsukfrontend.loaders.Loader`, which
+collapses the whitespace in the package's templates.
+
+Reports the size, gzipped size and render time of a group of 12 cards, and the size of each testapp page.
+
+Run from the project root with `python -m benchmarks.whitespace`
+"""
+import gzip
+import timeit
+
+from benchmarks.environment import setup_database, setup_django
+
+PAGES = [
+    '/',
+    '/page-1/page-2/',
+    '/pagination/pagination-page-2/',
+    '/promo-hub/',
+]
+
+CARDS = 12
+
+LOADERS = {
+    'default': 'django.template.loaders.app_directories.Loader',
+    'collapsed': 'wagtailnhsukfrontend.loaders.Loader',
+}
+
+
+def templates(loader):
+    from django.conf import settings
+
+    return [
+        dict(
+            settings.TEMPLATES[0],
+            APP_DIRS=False,
+            OPTIONS=dict(settings.TEMPLATES[0]['OPTIONS'], loaders=[
+                ('django.template.loaders.cached.Loader', ['django.template.loaders.filesystem.Loader', loader]),
+            ]),
+        ),
+    ]
+
+
+def main():
+    setup_django()
+
+    from django.test import Client, RequestFactory
+    from django.test.utils import override_settings
+    from wagtail.core.models import Page
+
+    from benchmarks.blocks import INTERNAL_PAGE_ID, card_group
+    from wagtailnhsukfrontend.blocks import CardGroupBlock
+
+    teardown = setup_database()
+    try:
+        block = CardGroupBlock()
+        value = block.to_python(card_group(CARDS))
+        context = {'page': Page.objects.get(id=INTERNAL_PAGE_ID).specific, 'request': RequestFactory().get('/')}
+        client = Client()
+
+        results = {}
+        for name, loader in LOADERS.items():
+            with override_settings(TEMPLATES=templates(loader)):
+                html = block.render(value, context)
+                seconds = min(timeit.repeat(lambda: block.render(value, context), number=20, repeat=3)) / 20
+                pages = {url: client.get(url).content for url in PAGES}
+            results[name] = (html.encode(), seconds, pages)
+
+        print('{:<32} {:>20} {:>20} {:>20}'.format('', 'bytes (default/collapsed)', 'gzipped', 'render'))
+        (default, default_time, default_pages), (collapsed, collapsed_time, collapsed_pages) = results.values()
+        print('{:<32} {:>11}/{:>9} {:>11}/{:>8} {:>10.2f}ms/{:>6.2f}ms'.format(
+            '{} card group'.format(CARDS),
+            len(default), len(collapsed),
+            len(gzip.compress(default)), len(gzip.compress(collapsed)),
+            default_time * 1e3, collapsed_time * 1e3,
+        ))
+        for url in PAGES:
+            default, collapsed = default_pages[url], collapsed_pages[url]
+            print('{:<32} {:>11}/{:>9} {:>11}/{:>8}'.format(
+                url,
+                len(default), len(collapsed),
+                len(gzip.compress(default)), len(gzip.compress(collapsed)),
+            ))
+    finally:
+        teardown()
+
+
+if __name__ == '__main__':
+    main()
@@ -9,26 +9,18 @@ INSTALL_REQUIRES = [
 ]
 
 
-class CompileCSSCommand(build):
-    """Combine CSS from the frontend library with our wagtail-specific fixes"""
+class BuildAssetsCommand(build):
+    """Build the CSS and JS bundles, with content-hashed names and gzip/brotli variants"""
 
     def run(self):
-        filepath_base = 'wagtailnhsukfrontend/static/wagtailnhsukfrontend/css/'
-        filenames = [
-            'nhsuk-5.0.0.min.css',
-            'fixes.css',
-        ]
-
-        with open(filepath_base + 'wagtail-nhsuk-frontend.min.css', 'w') as outfile:
-            for fname in filenames:
-                with open(filepath_base + fname) as infile:
-                    for line in infile:
-                        outfile.write(line)
+        from wagtailnhsukfrontend.assets import build_assets
+        build_assets()
+        super().run()
 
 
 setup(
     cmdclass={
-        'build': CompileCSSCommand,
+        'build': BuildAssetsCommand,
     },
     name="wagtail-nhsuk-frontend",
     version="0.7.0",
@@ -39,6 +31,9 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/nhsuk/wagtail-nhsuk-frontend",
     install_requires=INSTALL_REQUIRES,
-    packages=find_packages(),
+    extras_require={
+        'brotli': ['brotli'],
+    },
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     include_package_data=True,
 )
@@ -0,0 +1,23 @@
+# Generated by Django 3.1.14 on 2026-10-17 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0020_image_priority'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='homepage',
+            name='last_review_date',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='homepage',
+            name='next_review_date',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 3.1.14 on 2026-10-17 01:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0021_review_date_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConditionPage',
+            fields=[
+                ('homepage_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='home.homepage')),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=('home.homepage',),
+        ),
+        migrations.CreateModel(
+            name='ArchivedHomePage',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('home.homepage',),
+        ),
+    ]
@@ -2,6 +2,7 @@ from wagtail.admin.edit_handlers import StreamFieldPanel
 from wagtail.core.models import Page
 from wagtail.core.fields import StreamField
 
+from wagtailnhsukfrontend.prefetch import prefetch_renditions
 from wagtailnhsukfrontend.mixins import (
     HeroMixin,
     ReviewDateMixin,
@@ -60,6 +61,26 @@ class HomePage(HeroMixin, ReviewDateMixin, Page):
 
     settings_panels = Page.settings_panels + ReviewDateMixin.settings_panels
 
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        prefetch_renditions(self.body)
+        return context
+
+
+class ConditionPage(HomePage):
+    """
+    A page type extending HomePage, to show the review dates report listing its pages once
+    """
+
+
+class ArchivedHomePage(HomePage):
+    """
+    A proxy of HomePage, to show the review dates report listing its pages once
+    """
+
+    class Meta:
+        proxy = True
+
 
 class ChildPage(Page):
     pass
@@ -85,3 +106,8 @@ class HubsPage(Page):
     content_panels = Page.content_panels + [
         StreamFieldPanel('body'),
     ]
+
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        prefetch_renditions(self.body)
+        return context
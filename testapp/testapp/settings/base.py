@@ -28,6 +28,7 @@ INSTALLED_APPS = [
 
     'wagtailnhsukfrontend',
     'wagtailnhsukfrontend.settings',
+    'wagtailnhsukfrontend.search',
 
     'wagtail.contrib.forms',
     'wagtail.contrib.redirects',
@@ -62,6 +63,8 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'wagtail.contrib.redirects.middleware.RedirectMiddleware',
+    'wagtailnhsukfrontend.middleware.PreloadMiddleware',
+    'wagtailnhsukfrontend.middleware.TagContextMiddleware',
 ]
 
 ROOT_URLCONF = 'testapp.urls'
@@ -2,8 +2,18 @@ import pytest
 
 from django.core.management import call_command
 
+from wagtailnhsukfrontend.cache import get_cache
+
 
 @pytest.fixture(scope='session')
 def django_db_setup(django_db_setup, django_db_blocker):
     with django_db_blocker.unblock():
         call_command('loaddata', 'testapp/testdata.json')
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Tests roll back the database, so nothing cached by one test should leak into another."""
+    get_cache().clear()
+    yield
+    get_cache().clear()
@@ -0,0 +1,82 @@
+import gzip
+import json
+import os
+
+import pytest
+from django.template import Context, Template
+
+from wagtailnhsukfrontend import assets
+
+BUNDLES = {
+    'css/bundle.min.css': ['css/a.css', 'css/b.css'],
+}
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css' / 'a.css').write_bytes(b'a{color:red}')
+    (tmp_path / 'css' / 'b.css').write_bytes(b'b{color:blue}\n')
+    return tmp_path
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_build_assets(static_dir):
+    manifest = assets.build_assets(str(static_dir), BUNDLES)
+
+    hashed = manifest['css/bundle.min.css']
+    assert hashed.startswith('css/bundle.min.')
+    assert hashed.endswith('.css')
+    assert json.loads((static_dir / 'manifest.json').read_text()) == manifest
+
+    content = b'a{color:red}\nb{color:blue}\n'
+    for name in ['css/bundle.min.css', hashed]:
+        assert read(static_dir / name) == content
+        assert gzip.decompress(read(static_dir / (name + '.gz'))) == content
+
+
+def test_build_assets_brotli(static_dir):
+    brotli = pytest.importorskip('brotli')
+    hashed = assets.build_assets(str(static_dir), BUNDLES)['css/bundle.min.css']
+
+    assert brotli.decompress(read(static_dir / (hashed + '.br'))) == b'a{color:red}\nb{color:blue}\n'
+
+
+def test_hash_changes_with_content(static_dir):
+    old = assets.build_assets(str(static_dir), BUNDLES)['css/bundle.min.css']
+    assert assets.build_assets(str(static_dir), BUNDLES)['css/bundle.min.css'] == old
+
+    (static_dir / 'css' / 'b.css').write_bytes(b'b{color:green}\n')
+    new = assets.build_assets(str(static_dir), BUNDLES)['css/bundle.min.css']
+
+    assert new != old
+    # Files from the earlier build are removed
+    assert not os.path.exists(static_dir / old)
+    assert not os.path.exists(static_dir / (old + '.gz'))
+
+
+def test_nhsuk_static_uses_manifest(monkeypatch):
+    monkeypatch.setattr(
+        'wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_manifest',
+        lambda: {'css/wagtail-nhsuk-frontend.min.css': 'css/wagtail-nhsuk-frontend.min.0123456789ab.css'},
+    )
+    template = Template(
+        "{% load nhsukfrontend_tags %}"
+        "{% nhsuk_static 'css/wagtail-nhsuk-frontend.min.css' %} {% nhsuk_static 'js/nhsuk-5.0.0.min.js' %}"
+    )
+
+    assert template.render(Context()) == (
+        '/static/wagtailnhsukfrontend/css/wagtail-nhsuk-frontend.min.0123456789ab.css '
+        '/static/wagtailnhsukfrontend/js/nhsuk-5.0.0.min.js'
+    )
+
+
+def test_build_assets_critical_css(static_dir):
+    assets.build_assets(str(static_dir), BUNDLES, critical_css={'css/bundle.min.css': 'css/critical.css'})
+
+    # The header template has links, but nothing uses <b>
+    assert (static_dir / 'css' / 'critical.css').read_text() == 'a{color:red}'
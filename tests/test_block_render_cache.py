@@ -0,0 +1,145 @@
+from unittest import mock
+
+import pytest
+from wagtail.core.blocks import StreamBlock
+from wagtail.core.models import Page
+
+from wagtailnhsukfrontend import blocks
+from wagtailnhsukfrontend.blocks import ActionLinkBlock, CardGroupBlock, CareCardBlock, ExpanderBlock, InsetTextBlock
+
+
+@pytest.fixture
+def block_cache(settings):
+    settings.WAGTAILNHSUKFRONTEND_BLOCK_CACHE = True
+
+
+def render_count(block, value):
+    """Render a block value and return the number of times its template was rendered."""
+    with mock.patch('wagtail.core.blocks.base.render_to_string', return_value='html') as render_to_string:
+        block.render(value)
+    return render_to_string.call_count
+
+
+def test_identical_blocks_render_once(block_cache):
+    block = InsetTextBlock()
+
+    assert render_count(block, block.to_python({'body': '<p>Hello</p>'})) == 1
+    assert render_count(block, block.to_python({'body': '<p>Hello</p>'})) == 0
+    assert render_count(block, block.to_python({'body': '<p>Goodbye</p>'})) == 1
+
+
+def test_stream_ids_are_ignored(block_cache):
+    block = CareCardBlock()
+
+    def care_card(block_id):
+        return block.to_python({
+            'type': 'primary',
+            'heading_level': 3,
+            'title': 'Care card',
+            'body': [{'type': 'richtext', 'value': '<p>Hello</p>', 'id': block_id}],
+        })
+
+    assert render_count(block, care_card('a')) == 1
+    assert render_count(block, care_card('b')) == 0
+
+
+@pytest.mark.django_db
+def test_blocks_with_internal_pages_are_not_cached(db, django_db_setup, block_cache):
+    block = ActionLinkBlock()
+    value = block.to_python({
+        'text': 'Link',
+        'internal_page': Page.objects.get(url_path='/home/page-1/').pk,
+    })
+
+    assert render_count(block, value) == 1
+    assert render_count(block, value) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('remove_page', [
+    lambda page: page.unpublish(),
+    lambda page: page.delete(),
+], ids=['unpublished', 'deleted'])
+def test_rich_text_page_links_are_rendered_again_after_the_page_is_removed(db, django_db_setup, block_cache, remove_page):
+    page = Page.objects.get(url_path='/home/page-1/')
+    block = InsetTextBlock()
+    value = block.to_python({'body': '<p><a linktype="page" id="{}">Page 1</a></p>'.format(page.pk)})
+    assert render_count(block, value) == 1
+    assert render_count(block, value) == 0
+
+    remove_page(page.specific)
+
+    assert render_count(block, value) == 1
+
+
+class PageInsetTextBlock(InsetTextBlock):
+
+    class Meta:
+        cache_render = False
+
+
+class PageCareCardBlock(CareCardBlock):
+    body = StreamBlock([('page_inset_text', PageInsetTextBlock())])
+
+
+@pytest.mark.parametrize('block, value', [
+    (PageInsetTextBlock(), {'body': '<p>Hello</p>'}),
+    # The parent block's cached HTML would contain the child's
+    (
+        PageCareCardBlock(),
+        {'type': 'primary', 'heading_level': 3, 'title': 'Care card', 'body': [
+            {'type': 'page_inset_text', 'value': {'body': '<p>Hello</p>'}},
+        ]},
+    ),
+])
+def test_blocks_can_turn_the_cache_off(block_cache, block, value):
+    value = block.to_python(value)
+
+    assert render_count(block, value) == 1
+    assert render_count(block, value) == 1
+
+
+def test_block_cache_is_opt_in():
+    block = InsetTextBlock()
+
+    assert render_count(block, block.to_python({'body': '<p>Hello</p>'})) == 1
+    assert render_count(block, block.to_python({'body': '<p>Hello</p>'})) == 1
+
+
+def test_blocks_are_rendered_again_after_an_asset_build(block_cache, monkeypatch):
+    block = InsetTextBlock()
+    value = block.to_python({'body': '<p>Hello</p>'})
+    assert render_count(block, value) == 1
+
+    monkeypatch.setattr('wagtailnhsukfrontend.blocks.get_manifest_version', lambda: 'new-build')
+
+    assert render_count(block, value) == 1
+
+
+@pytest.mark.parametrize('block, value, edited_template', [
+    (
+        CardGroupBlock(),
+        {'column': '', 'body': [{'type': 'card_basic', 'value': {'heading': 'Card', 'heading_level': 3, 'body': ''}}]},
+        'wagtailnhsukfrontend/card.html',
+    ),
+    (
+        CareCardBlock(),
+        {'type': 'primary', 'heading_level': 3, 'title': 'Care card', 'body': []},
+        'wagtailnhsukfrontend/inset_text.html',
+    ),
+    # Expanders include the details template
+    (
+        ExpanderBlock(),
+        {'title': 'Expander', 'body': []},
+        'wagtailnhsukfrontend/details.html',
+    ),
+])
+def test_blocks_are_rendered_again_after_a_child_template_changes(block_cache, monkeypatch, block, value, edited_template):
+    value = block.to_python(value)
+    assert render_count(block, value) == 1
+    assert render_count(block, value) == 0
+
+    blocks.get_template_version(edited_template)
+    monkeypatch.setitem(blocks._template_versions, edited_template, 'edited')
+
+    assert render_count(block, value) == 1
@@ -0,0 +1,80 @@
+from django.template import Context, Template
+
+from wagtailnhsukfrontend.critical_css import UsedSelectors, extract_critical_css
+
+CSS = (
+    '@charset "UTF-8";'
+    '/* comment */'
+    'html{box-sizing:border-box}'
+    '@font-face{font-family:Frutiger;src:url(https://assets.nhs.uk/fonts/frutiger.woff2)}'
+    '.used,.unused{color:red}'
+    '.used a:hover{color:blue}'
+    '.used table{color:green}'
+    '.used:not(.unused)[type=search]::after{content:"{"}'
+    '#header .used{margin:0}'
+    '#footer .used{margin:0}'
+    '@media (min-width:40em){.used{padding:0}.unused{padding:0}}'
+    '@media (min-width:60em){.unused{padding:0}}'
+    '@media print{.used{display:none}}'
+    '@keyframes spin{0%{opacity:0}to{opacity:1}}'
+)
+
+
+def test_extract_critical_css():
+    used = UsedSelectors(elements=['html', 'a'], classes=['used'], ids=['header'])
+
+    assert extract_critical_css(CSS, used) == (
+        'html{box-sizing:border-box}'
+        '@font-face{font-family:Frutiger;src:url(https://assets.nhs.uk/fonts/frutiger.woff2)}'
+        '.used{color:red}'
+        '.used a:hover{color:blue}'
+        '.used:not(.unused)[type=search]::after{content:"{"}'
+        '#header .used{margin:0}'
+        '@media (min-width:40em){.used{padding:0}}'
+    )
+
+
+def test_used_selectors_from_templates(tmp_path):
+    (tmp_path / 'page.html').write_text(
+        '<header class="used{% if x %} used--modifier{% endif %}" id="header">'
+        '{% include "included.html" %}{% include "missing.html" %}</header>'
+    )
+    (tmp_path / 'included.html').write_text('<a class="link {{ extra_class }}" href="{{ href }}">Link</a>')
+
+    used = UsedSelectors.from_templates(['page.html'], templates_dir=str(tmp_path))
+
+    assert {'header', 'a', 'html', 'body'} <= used.elements
+    assert {'used', 'used--modifier', 'link'} <= used.classes
+    assert used.ids == {'header'}
+
+
+def test_nhsuk_critical_css(monkeypatch):
+    monkeypatch.setattr('wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_manifest', lambda: {})
+    monkeypatch.setattr('wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_critical_css', lambda path: '.a>.b{}')
+    template = Template('{% load nhsukfrontend_tags %}{% nhsuk_critical_css %}')
+
+    href = '/static/wagtailnhsukfrontend/css/wagtail-nhsuk-frontend.min.css'
+    assert template.render(Context()) == (
+        '<style>.a>.b{}</style>'
+        '<link rel="preload" href="' + href + '" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        '<noscript><link rel="stylesheet" type="text/css" href="' + href + '"></noscript>'
+    )
+
+
+def test_nhsuk_critical_css_before_build(monkeypatch):
+    monkeypatch.setattr('wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_manifest', lambda: {})
+    monkeypatch.setattr('wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_critical_css', lambda path: None)
+    template = Template('{% load nhsukfrontend_tags %}{% nhsuk_critical_css %}')
+
+    assert template.render(Context()) == (
+        '<link rel="stylesheet" type="text/css" href="/static/wagtailnhsukfrontend/css/wagtail-nhsuk-frontend.min.css">'
+    )
+
+
+def test_used_selectors_from_icons(tmp_path):
+    (tmp_path / 'page.html').write_text("<button>{% nhsuk_icon 'search' %}</button>")
+
+    used = UsedSelectors.from_templates(['page.html'], templates_dir=str(tmp_path))
+
+    assert {'svg', 'use'} <= used.elements
+    assert {'nhsuk-icon', 'nhsuk-icon__search'} <= used.classes
@@ -0,0 +1,65 @@
+from io import StringIO
+
+import pytest
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from wagtail.images import get_image_model
+
+from wagtailnhsukfrontend.images import SRCSET_FILTER_SPECS
+from wagtailnhsukfrontend.management.commands import generate_nhsuk_renditions
+
+
+def generate_renditions():
+    stdout = StringIO()
+    call_command('generate_nhsuk_renditions', processes=1, stdout=stdout)
+    return stdout.getvalue()
+
+
+@pytest.mark.django_db
+def test_generate_renditions(db, django_db_setup):
+    image = get_image_model().objects.get()
+    image.renditions.all().delete()
+
+    output = generate_renditions()
+
+    assert 'Generated renditions for 1 images' in output
+    assert set(image.renditions.values_list('filter_spec', flat=True)) == set(SRCSET_FILTER_SPECS)
+
+
+@pytest.mark.django_db
+def test_generate_renditions_skips_existing_renditions(db, django_db_setup):
+    generate_renditions()
+
+    assert 'All renditions have already been generated.' in generate_renditions()
+
+
+@pytest.mark.django_db
+def test_find_wanted_renditions_does_not_load_chosen_objects(db, django_db_setup, django_assert_max_num_queries):
+    image = get_image_model().objects.get()
+    command = generate_nhsuk_renditions.Command()
+
+    # One query for each model with a StreamField or hero image, however many images, pages and snippets they choose
+    with django_assert_max_num_queries(len(apps.get_models())) as captured:
+        wanted = command.find_wanted_renditions()
+
+    assert set(SRCSET_FILTER_SPECS) <= wanted[image.pk]
+    assert not any('FROM "wagtailimages_image"' in query['sql'] for query in captured.captured_queries)
+
+
+@pytest.mark.django_db
+def test_corrupt_and_deleted_images_are_reported(db, django_db_setup, settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    file_name = default_storage.save('original_images/corrupt.jpg', ContentFile(b'not an image'))
+    corrupt = get_image_model().objects.create(title='Corrupt', file=file_name, width=100, height=100)
+
+    image_id, errors = generate_nhsuk_renditions.generate_renditions(corrupt.pk, ['width-320', 'width-640'])
+    assert image_id == corrupt.pk
+    assert len(errors) == 2
+    assert errors[0].startswith('width-320: ')
+
+    corrupt.delete()
+    assert generate_nhsuk_renditions.generate_renditions(corrupt.pk, ['width-320']) == (
+        corrupt.pk, ['The image has been deleted'],
+    )
@@ -0,0 +1,102 @@
+import pytest
+from django.template import Context, Template
+from django.test import RequestFactory
+from wagtail.core.models import Page, Site
+
+from wagtailnhsukfrontend.settings.models import HeaderSettings
+from wagtailnhsukfrontend.settings.templatetags.nhsukfrontendsettings_tags import header
+
+
+def get_header_context(**kwargs):
+    """Get the header context that will be passed to the header template."""
+    fake_context = {
+        'request': RequestFactory().get('/fake/url/'),
+    }
+    # The header tag is an inclusion_tag which returns a new context.
+    return header(fake_context, **kwargs)
+
+
+@pytest.mark.django_db
+def test_header_primary_links(db, django_db_setup):
+    template_context = get_header_context()
+
+    assert template_context['primary_links'] == [
+        {'label': 'Breadcrumb Test Page 1', 'url': '/page-1/'},
+        {'label': 'Breadcrumb Test Page 2', 'url': '/page-1/page-2/'},
+        {'label': 'Pagination', 'url': '/pagination/pagination-page-1/'},
+    ]
+
+
+@pytest.mark.django_db
+def test_header_search_kwargs(db, django_db_setup):
+    template_context = get_header_context(search_action='/s/', search_field_name='q')
+
+    assert template_context['search_action'] == '/s/'
+    assert template_context['search_field_name'] == 'q'
+
+
+@pytest.mark.django_db
+def test_header_cached_context_makes_no_queries(db, django_db_setup, django_assert_num_queries):
+    get_header_context()
+    request = RequestFactory().get('/fake/url/')
+    Site.find_for_request(request)
+
+    with django_assert_num_queries(0):
+        header({'request': request})
+
+
+@pytest.mark.django_db
+def test_header_cache_invalidated_by_settings_save(db, django_db_setup):
+    get_header_context()
+
+    settings = HeaderSettings.objects.get()
+    settings.service_name = 'New service name'
+    settings.save()
+
+    assert get_header_context()['service_name'] == 'New service name'
+
+
+@pytest.mark.django_db
+def test_header_cache_invalidated_by_page_move(db, django_db_setup):
+    get_header_context()
+
+    page = Page.objects.get(url_path='/home/page-1/page-2/')
+    page.move(Page.objects.get(url_path='/home/pagination/'), pos='last-child')
+
+    assert get_header_context()['primary_links'][1]['url'] == '/pagination/page-2/'
+
+
+@pytest.mark.django_db
+def test_header_fragment_cache(db, django_db_setup, settings, django_assert_num_queries):
+    settings.WAGTAILNHSUKFRONTEND_FRAGMENT_CACHE = True
+    template = Template('{% load nhsukfrontendsettings_tags %}{% header search_action="/s/" %}')
+    request = RequestFactory().get('/fake/url/')
+    html = template.render(Context({'request': request}))
+
+    with django_assert_num_queries(0):
+        assert template.render(Context({'request': request})) == html
+
+    settings_object = HeaderSettings.objects.get()
+    settings_object.service_name = 'New service name'
+    settings_object.save()
+
+    assert 'New service name' in template.render(Context({'request': request}))
+
+
+@pytest.mark.django_db
+def test_header_fragment_cache_is_per_asset_build(db, django_db_setup, settings, monkeypatch):
+    settings.WAGTAILNHSUKFRONTEND_FRAGMENT_CACHE = True
+    template = Template('{% load nhsukfrontendsettings_tags %}{% header search_action="/s/" %}')
+    request = RequestFactory().get('/fake/url/')
+    template.render(Context({'request': request}))
+
+    monkeypatch.setattr(
+        'wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_manifest',
+        lambda: {'icons/nhsuk-icons.svg': 'icons/nhsuk-icons.0123456789ab.svg'},
+    )
+    monkeypatch.setattr(
+        'wagtailnhsukfrontend.settings.templatetags.nhsukfrontendsettings_tags.get_manifest_version',
+        lambda: 'new-build',
+    )
+
+    assert 'icons/nhsuk-icons.0123456789ab.svg' in template.render(Context({'request': request}))
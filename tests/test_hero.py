@@ -0,0 +1,55 @@
+from bs4 import BeautifulSoup
+from django.test import Client
+import pytest
+from wagtail.core.models import Page
+
+from wagtailnhsukfrontend.images import HERO_IMAGE_SETS
+
+
+@pytest.fixture
+def hero_page(db):
+    page = Page.objects.get(url_path='/home/').specific
+    page.hero_image_id = 1
+    page.hero_text = 'Hero text'
+    page.save()
+    return page
+
+
+def get_urls(css_value):
+    return [part.split("'")[0] for part in css_value.split("url('")[1:]]
+
+
+@pytest.mark.django_db
+def test_hero_image_set(hero_page, client: Client):
+    soup = BeautifulSoup(client.get('/').content, 'html.parser')
+    style = soup.select_one('.nhsuk-hero--image')['style']
+    declarations = dict(declaration.split(': ', 1) for declaration in style.rstrip(';').split('; ')[1:])
+
+    assert style.startswith("background-image: url('")
+    assert declarations['background-image'].startswith('var(--nhsuk-hero-image, ')
+    for name, (media, image_set) in HERO_IMAGE_SETS.items():
+        value = declarations['--nhsuk-hero-image-{}'.format(name)]
+        assert value.startswith('image-set(')
+        assert len(get_urls(value)) == len(image_set)
+
+
+@pytest.mark.django_db
+def test_hero_preload(hero_page, client: Client):
+    response = client.get('/')
+    soup = BeautifulSoup(response.content, 'html.parser')
+    style = soup.select_one('.nhsuk-hero--image')['style']
+    links = soup.select('head link[rel=preload][as=image]')
+
+    assert [link['media'] for link in links] == [media for media, image_set in HERO_IMAGE_SETS.values()]
+    for link in links:
+        assert link['imagesrcset'] in style.replace("url('", '').replace("')", '')
+    assert response['Link'].count('rel=preload; as=image') == len(HERO_IMAGE_SETS)
+    assert '<{}>'.format(links[0]['href']) in response['Link']
+
+
+@pytest.mark.django_db
+def test_no_hero_preload_without_image(client: Client):
+    response = client.get('/')
+
+    assert 'as=image' not in response['Link']
+    assert BeautifulSoup(response.content, 'html.parser').select('head link[as=image]') == []
@@ -0,0 +1,44 @@
+import os
+import re
+
+from django.template import Context, Template
+
+from wagtailnhsukfrontend.assets import get_icon_sprite
+from wagtailnhsukfrontend.critical_css import TEMPLATES_DIR
+
+
+def render(source):
+    return Template('{% load nhsukfrontend_tags %}' + source).render(Context())
+
+
+def test_nhsuk_icon(monkeypatch):
+    monkeypatch.setattr(
+        'wagtailnhsukfrontend.templatetags.nhsukfrontend_tags.get_manifest',
+        lambda: {'icons/nhsuk-icons.svg': 'icons/nhsuk-icons.0123456789ab.svg'},
+    )
+
+    assert render("{% nhsuk_icon 'search' %}") == (
+        '<svg class="nhsuk-icon nhsuk-icon__search" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" '
+        'aria-hidden="true" focusable="false">'
+        '<use href="/static/wagtailnhsukfrontend/icons/nhsuk-icons.0123456789ab.svg#nhsuk-icon-search"></use>'
+        '</svg>'
+    )
+
+
+def test_nhsuk_icon_inline(settings):
+    settings.WAGTAILNHSUKFRONTEND_INLINE_ICONS = True
+
+    assert '<use href="#nhsuk-icon-search"></use>' in render("{% nhsuk_icon 'search' %}")
+    assert 'id="nhsuk-icon-search"' in render("{% nhsuk_icon_sprite %}")
+
+
+def test_sprite_has_every_icon_used_in_templates():
+    icons = set()
+    for directory, _, filenames in os.walk(TEMPLATES_DIR):
+        for filename in filenames:
+            with open(os.path.join(directory, filename)) as f:
+                icons.update(re.findall(r"{% nhsuk_icon '([\w-]+)' %}", f.read()))
+
+    assert icons
+    for icon in icons:
+        assert 'id="nhsuk-icon-{}"'.format(icon) in get_icon_sprite()
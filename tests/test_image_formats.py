@@ -0,0 +1,66 @@
+from io import StringIO
+
+from bs4 import BeautifulSoup
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from wagtail.images import get_image_model
+
+from wagtailnhsukfrontend.blocks import CardImageBlock, ImageBlock
+from wagtailnhsukfrontend.images import SRCSET_FILTER_SPECS, get_image_formats, get_srcset_filter_specs
+
+
+@pytest.fixture
+def image_formats(settings):
+    # Pillow isn't always built with WebP support, and the markup is the same for any format
+    settings.WAGTAILNHSUKFRONTEND_IMAGE_FORMATS = ['png']
+
+
+def render(block_class, value):
+    block = block_class()
+    return BeautifulSoup(block.render(block.to_python(value)), 'html.parser')
+
+
+@pytest.mark.django_db
+def test_picture_sources(image_formats):
+    soup = render(ImageBlock, {'content_image': 1, 'alt_text': 'Image'})
+
+    source = soup.select_one('picture > source')
+    assert source['type'] == 'image/png'
+    srcset = [candidate.split() for candidate in source['srcset'].split(', ')]
+    assert [width for url, width in srcset] == ['320w', '510w', '640w', '767w', '1019w', '1125w', '1534w']
+    assert all(url.endswith('.png') for url, width in srcset)
+    assert soup.select_one('picture > img')['src'].endswith('.jpg')
+    # Without the same sizes as the <img>, browsers would choose a source for the full width of the screen
+    assert source['sizes'] == soup.select_one('picture > img')['sizes']
+
+
+def test_unsupported_formats_are_rejected(settings):
+    # Wagtail 2.12's format filter doesn't support AVIF
+    settings.WAGTAILNHSUKFRONTEND_IMAGE_FORMATS = ['webp', 'avif']
+
+    with pytest.raises(ImproperlyConfigured, match='avif'):
+        get_image_formats()
+
+
+@pytest.mark.django_db
+def test_no_picture_without_formats():
+    soup = render(CardImageBlock, {'content_image': 1, 'alt_text': 'Card', 'heading': 'Card', 'heading_level': 3})
+
+    assert soup.find('picture') is None
+    assert soup.find('img') is not None
+
+
+@pytest.mark.django_db
+def test_generate_renditions_report(image_formats):
+    image = get_image_model().objects.get()
+    image.renditions.all().delete()
+    stdout = StringIO()
+
+    call_command('generate_nhsuk_renditions', processes=1, report=True, stdout=stdout)
+
+    assert set(image.renditions.values_list('filter_spec', flat=True)) == set(
+        SRCSET_FILTER_SPECS + get_srcset_filter_specs('png')
+    )
+    report = stdout.getvalue().splitlines()[-1].split()
+    assert report[:2] == ['png', '7']
@@ -0,0 +1,42 @@
+from bs4 import BeautifulSoup
+import pytest
+from wagtail.images import get_image_model
+
+from wagtailnhsukfrontend.blocks import BasePromoBlock, CardImageBlock, ImageBlock
+
+BLOCKS = [
+    (ImageBlock, {'alt_text': 'Image'}),
+    (CardImageBlock, {'heading': 'Card', 'heading_level': 3, 'alt_text': 'Card'}),
+    (BasePromoBlock, {'url': 'https://example.com/', 'heading': 'Promo', 'alt_text': 'Promo'}),
+]
+
+
+def render_img(block_class, value):
+    block = block_class()
+    html = block.render(block.to_python(value))
+    return BeautifulSoup(html, 'html.parser').find('img')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('block_class, value', BLOCKS)
+def test_images_are_lazy_loaded(block_class, value):
+    image = get_image_model().objects.get(id=1)
+    rendition = image.get_rendition('width-320')
+
+    img = render_img(block_class, dict(value, content_image=image.pk))
+
+    assert img['width'] == str(rendition.width)
+    assert img['height'] == str(rendition.height)
+    assert img['loading'] == 'lazy'
+    assert img['decoding'] == 'async'
+    assert not img.has_attr('fetchpriority')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('block_class, value', BLOCKS)
+def test_priority_images_are_eager(block_class, value):
+    img = render_img(block_class, dict(value, content_image=1, priority=True))
+
+    assert img['loading'] == 'eager'
+    assert img['fetchpriority'] == 'high'
+    assert not img.has_attr('decoding')
@@ -0,0 +1,68 @@
+import pytest
+from django.test import RequestFactory
+from wagtail.core.models import Page, Site
+
+from wagtailnhsukfrontend.templatetags.nhsukfrontend_tags import breadcrumb, contents_list, pagination
+
+
+@pytest.fixture
+def page_tree_index(settings):
+    settings.WAGTAILNHSUKFRONTEND_PAGE_TREE_INDEX = True
+
+
+def get_fake_context(url_path):
+    request = RequestFactory().get('/fake/url/')
+    Site.find_for_request(request)
+    return {
+        'page': Page.objects.get(url_path=url_path),
+        'request': request,
+    }
+
+
+@pytest.mark.django_db
+def test_page_tree_breadcrumb(db, django_db_setup, page_tree_index):
+    breadcrumb_pages = breadcrumb(get_fake_context('/home/page-1/page-2/'))['breadcrumb_pages']
+
+    assert breadcrumb_pages == [
+        Page.objects.get(url_path='/home/'),
+        Page.objects.get(url_path='/home/page-1/'),
+    ]
+    assert [page.title for page in breadcrumb_pages] == ['Home', 'Page 1']
+
+
+@pytest.mark.django_db
+def test_page_tree_pagination_skips_unpublished_pages(db, django_db_setup, page_tree_index):
+    template_context = pagination(get_fake_context('/home/pagination/pagination-page-2/'))
+
+    assert template_context['prev_url'] == '/pagination/pagination-page-1/'
+    assert template_context['next_url'] == '/pagination/pagination-page-3/'
+
+
+@pytest.mark.django_db
+def test_page_tree_contents_list(db, django_db_setup, page_tree_index):
+    page_tree_links = contents_list(get_fake_context('/home/pagination/pagination-page-3/'))['links']
+
+    assert len(page_tree_links) == 4
+    assert page_tree_links[2]['is_current'] is True
+
+
+@pytest.mark.django_db
+def test_page_tree_makes_no_queries(db, django_db_setup, page_tree_index, django_assert_num_queries):
+    fake_context = get_fake_context('/home/pagination/pagination-page-2/')
+    breadcrumb(fake_context)
+
+    with django_assert_num_queries(0):
+        breadcrumb(fake_context)
+        pagination(fake_context)
+        contents_list(fake_context)
+
+
+@pytest.mark.django_db
+def test_page_tree_updated_on_unpublish(db, django_db_setup, page_tree_index):
+    fake_context = get_fake_context('/home/pagination/pagination-page-2/')
+    assert len(contents_list(fake_context)['links']) == 4
+
+    Page.objects.get(url_path='/home/pagination/pagination-page-3/').unpublish()
+
+    assert len(contents_list(fake_context)['links']) == 3
+    assert pagination(fake_context)['next_url'] == '/pagination/pagination-page-4/'
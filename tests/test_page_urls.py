@@ -0,0 +1,48 @@
+import pytest
+from django.test import RequestFactory
+from wagtail.core.models import Page, Site
+
+from wagtailnhsukfrontend.page_urls import get_page_url, get_page_urls
+
+
+@pytest.mark.django_db
+def test_page_urls_match_get_url(db, django_db_setup):
+    request = RequestFactory().get('/fake/url/')
+    pages = Page.objects.filter(url_path__startswith='/home/pagination/')
+
+    assert get_page_urls(pages, request) == {page.pk: page.get_url(request) for page in pages}
+
+
+@pytest.mark.django_db
+def test_cached_page_urls_make_no_queries(db, django_db_setup, django_assert_num_queries):
+    request = RequestFactory().get('/fake/url/')
+    pages = list(Page.objects.filter(url_path__startswith='/home/pagination/'))
+    get_page_urls(pages, request)
+
+    with django_assert_num_queries(0):
+        get_page_urls(pages, request)
+
+
+@pytest.mark.django_db
+def test_page_url_invalidated_by_slug_change(db, django_db_setup):
+    page = Page.objects.get(url_path='/home/page-1/page-2/')
+    assert get_page_url(page) == '/page-1/page-2/'
+
+    parent = Page.objects.get(url_path='/home/page-1/').specific
+    parent.slug = 'renamed'
+    parent.save_revision().publish()
+
+    page.refresh_from_db()
+    assert get_page_url(page) == '/renamed/page-2/'
+
+
+@pytest.mark.django_db
+def test_page_urls_cached_per_site(db, django_db_setup):
+    page = Page.objects.get(url_path='/home/page-1/')
+    Site.objects.create(hostname='other.example.com', root_page=Page.objects.get(url_path='/home/promo-hub/'))
+
+    request = RequestFactory().get('/fake/url/', HTTP_HOST='other.example.com')
+    assert get_page_url(page, request) == 'http://localhost/page-1/'
+
+    request = RequestFactory().get('/fake/url/', HTTP_HOST='localhost')
+    assert get_page_url(page, request) == '/page-1/'
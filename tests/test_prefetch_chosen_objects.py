@@ -0,0 +1,122 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+from wagtail.core.blocks import PageChooserBlock
+from wagtail.images.blocks import ImageChooserBlock
+
+from home.models import HomePage, HubsPage
+from wagtailnhsukfrontend.blocks import CardClickableBlock, ImageBlock
+from wagtailnhsukfrontend.prefetch import prefetch_chosen_objects, walk_blocks
+
+PAGE_IDS = [4, 5, 7, 8]
+MISSING_PAGE_ID = 9999
+IMAGE_ID = 1
+
+
+def clickable_card(page_id):
+    return {'heading': 'Card', 'heading_level': 3, 'body': '', 'internal_page': page_id, 'url': ''}
+
+
+def get_body():
+    """A lazily converted hub page body, with pages chosen at the top level and in a card group."""
+    stream_block = HubsPage.body.field.stream_block
+    return stream_block.to_python([
+        {'type': 'card_clickable', 'value': clickable_card(PAGE_IDS[0])},
+        {'type': 'card_image', 'value': {
+            'heading': 'Card', 'heading_level': 3, 'body': '', 'content_image': 1, 'alt_text': 'Card',
+            'internal_page': PAGE_IDS[1], 'url': '',
+        }},
+        {'type': 'card_group', 'value': {'column': '', 'body': [
+            {'type': 'card_clickable', 'value': clickable_card(page_id)}
+            for page_id in PAGE_IDS * 8 + [MISSING_PAGE_ID]
+        ]}},
+    ])
+
+
+def image(caption):
+    return {'content_image': IMAGE_ID, 'alt_text': 'Image', 'caption': caption}
+
+
+def details(caption):
+    return {'title': 'Details', 'body': [{'type': 'image', 'value': image(caption)}]}
+
+
+def get_body_with_images():
+    """A lazily converted home page body, with images chosen at the top level and in nested ListBlocks and streams."""
+    stream_block = HomePage.body.field.stream_block
+    return stream_block.to_python([
+        {'type': 'image', 'value': image('Top level')},
+        {'type': 'expander_group', 'value': {'expanders': [details('Expander'), details('Expander')]}},
+        {'type': 'care_card', 'value': {'type': 'primary', 'heading_level': 3, 'title': 'Care card', 'body': [
+            {'type': 'image', 'value': image('Care card')},
+            {'type': 'details', 'value': details('Details in a care card')},
+        ]}},
+    ])
+
+
+def get_chosen_values(body, block_class):
+    return [
+        value for block, value in walk_blocks(body.stream_block, body)
+        if isinstance(block, block_class)
+    ]
+
+
+def get_chosen_pages(body):
+    return get_chosen_values(body, PageChooserBlock)
+
+
+@pytest.mark.django_db
+def test_chosen_pages_are_loaded_in_one_query(django_assert_num_queries):
+    body = get_body()
+
+    # The pages, and the card's image
+    with django_assert_num_queries(2):
+        prefetch_chosen_objects(body)
+
+    with django_assert_num_queries(0):
+        pages = get_chosen_pages(body)
+    assert [page.id if page else None for page in pages] == PAGE_IDS[:2] + PAGE_IDS * 8 + [None]
+
+
+@pytest.mark.django_db
+def test_chosen_pages_are_loaded_by_type_without_prefetching():
+    with CaptureQueriesContext(connection) as queries:
+        get_chosen_pages(get_body())
+
+    # One per block type which chooses a page, and one for the card's image
+    assert len(queries) == 4
+
+
+@pytest.mark.django_db
+def test_nested_images_are_loaded_in_one_query(django_assert_num_queries):
+    body = get_body_with_images()
+
+    with django_assert_num_queries(1):
+        prefetch_chosen_objects(body)
+
+    with django_assert_num_queries(0):
+        images = get_chosen_values(body, ImageChooserBlock)
+    assert [image.id for image in images] == [IMAGE_ID] * 5
+
+
+@pytest.mark.django_db
+def test_promo_group_images_are_loaded_with_the_pages(django_assert_num_queries):
+    promo = {'url': 'https://www.nhs.uk', 'heading': 'Promo', 'content_image': IMAGE_ID, 'alt_text': 'Promo'}
+    body = HubsPage.body.field.stream_block.to_python([
+        {'type': 'card_clickable', 'value': clickable_card(PAGE_IDS[0])},
+        {'type': 'promo_group', 'value': {'column': 'one-half', 'size': '', 'heading_level': 3, 'promos': [promo] * 6}},
+    ])
+
+    with django_assert_num_queries(2):
+        prefetch_chosen_objects(body)
+
+    with django_assert_num_queries(0):
+        assert len(get_chosen_values(body, ImageChooserBlock)) == 6
+
+
+def test_prefetch_chooser_blocks_deconstruct_as_wagtail_blocks():
+    page_path, args, kwargs = CardClickableBlock().child_blocks['internal_page'].deconstruct()
+    image_path, args, kwargs = ImageBlock().child_blocks['content_image'].deconstruct()
+
+    assert page_path == 'wagtail.core.blocks.PageChooserBlock'
+    assert image_path == 'wagtail.images.blocks.ImageChooserBlock'
@@ -0,0 +1,39 @@
+import pytest
+from django.test import Client
+from wagtail.core.models import Page
+
+from wagtailnhsukfrontend.images import SRCSET_FILTER_SPECS, get_rendition
+from wagtailnhsukfrontend.prefetch import prefetch_renditions
+
+
+def get_hub_page_body():
+    body = Page.objects.get(url_path='/home/promo-hub/').specific.body
+    # Convert the lazy stream value so that only rendition queries are counted
+    list(body)
+    return body
+
+
+def get_card_images(body):
+    return [child.value['content_image'] for child in body if child.block_type == 'card_image']
+
+
+@pytest.mark.django_db
+def test_prefetch_renditions_is_one_query(db, django_db_setup, client: Client, django_assert_num_queries):
+    # Render the page once so that the renditions exist
+    client.get('/promo-hub/')
+    body = get_hub_page_body()
+
+    with django_assert_num_queries(1):
+        prefetch_renditions(body)
+
+
+@pytest.mark.django_db
+def test_prefetched_renditions_are_used(db, django_db_setup, client: Client, django_assert_num_queries):
+    client.get('/promo-hub/')
+    body = get_hub_page_body()
+    prefetch_renditions(body)
+
+    with django_assert_num_queries(0):
+        for image in get_card_images(body):
+            for filter_spec in SRCSET_FILTER_SPECS:
+                assert get_rendition(image, filter_spec).filter_spec == filter_spec
@@ -0,0 +1,47 @@
+import re
+
+from django.test import Client
+import pytest
+
+from wagtailnhsukfrontend.images import HERO_IMAGE_SETS
+from wagtailnhsukfrontend.templatetags.nhsukfrontend_tags import nhsuk_static
+
+
+def get_links(response):
+    return re.split(r', (?=<)', response['Link'])
+
+
+@pytest.mark.django_db
+def test_page_preloads_assets(client: Client):
+    response = client.get('/')
+
+    assert get_links(response) == [
+        '<{}>; rel=preload; as=style'.format(nhsuk_static('css/wagtail-nhsuk-frontend.min.css')),
+        '<{}>; rel=preload; as=script'.format(nhsuk_static('js/wagtail-nhsuk-frontend.min.js')),
+    ]
+
+
+@pytest.mark.django_db
+def test_preload_assets_setting(client: Client, settings):
+    settings.WAGTAILNHSUKFRONTEND_PRELOAD_ASSETS = [('css/wagtail-nhsuk-frontend.min.css', 'style')]
+
+    assert len(get_links(client.get('/'))) == 1
+
+
+@pytest.mark.django_db
+def test_assets_are_preloaded_before_the_hero(client: Client):
+    page = client.get('/').context['page']
+    page.hero_image_id = 1
+    page.save()
+
+    links = get_links(client.get('/'))
+
+    assert len(links) == 2 + len(HERO_IMAGE_SETS)
+    assert 'as=style' in links[0]
+    assert 'as=image' in links[-1]
+
+
+@pytest.mark.django_db
+def test_other_responses_are_unchanged(client: Client):
+    assert not client.get('/does-not-exist/').has_header('Link')
+    assert not client.get('/admin/login/').has_header('Link')
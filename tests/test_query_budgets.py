@@ -0,0 +1,115 @@
+import pytest
+from django.template import Context, Template
+from django.test import RequestFactory
+from wagtail.core.models import Page
+from wagtail.images import get_image_model
+
+from wagtailnhsukfrontend.blocks import ActionLinkBlock, CardGroupBlock
+from wagtailnhsukfrontend.images import SRCSET_FILTER_SPECS
+from wagtailnhsukfrontend.query_budgets import get_query_budget
+from wagtailnhsukfrontend.settings.models import (
+    FooterLinks,
+    FooterSettings,
+    HeaderSettings,
+    NavigationLink,
+)
+from wagtailnhsukfrontend.settings.templatetags import nhsukfrontendsettings_tags
+from wagtailnhsukfrontend.templatetags import nhsukfrontend_tags
+
+# Components are rendered with this many links or cards, so that a query per item goes over budget
+ITEMS = 10
+
+
+@pytest.fixture
+def within_budget(django_assert_max_num_queries):
+    """
+    Render a component with an empty cache and fail if it makes more queries than its declared budget.
+    """
+    def check(component, render):
+        budget = get_query_budget(component)
+        assert budget is not None, "{!r} has no query budget".format(component)
+        with django_assert_max_num_queries(budget):
+            render()
+    return check
+
+
+def tag_renderer(library, tag, page):
+    template = Template('{{% load {} %}}{{% {} %}}'.format(library, tag))
+    request = RequestFactory().get(page.url)
+    return lambda: template.render(Context({'page': page, 'request': request}))
+
+
+def get_page(url_path):
+    return Page.objects.get(url_path=url_path).specific
+
+
+def test_header(db, django_db_setup, within_budget):
+    home = get_page('/home/')
+    header = HeaderSettings.objects.get()
+    NavigationLink.objects.bulk_create([
+        NavigationLink(setting=header, label='Link {}'.format(i), page=home, sort_order=10 + i)
+        for i in range(ITEMS)
+    ])
+
+    within_budget(
+        nhsukfrontendsettings_tags.header,
+        tag_renderer('nhsukfrontendsettings_tags', 'header', home),
+    )
+
+
+def test_footer(db, django_db_setup, within_budget):
+    footer = FooterSettings.objects.get()
+    FooterLinks.objects.bulk_create([
+        FooterLinks(setting=footer, link_url='https://www.nhs.uk', link_label='Link {}'.format(i), sort_order=10 + i)
+        for i in range(ITEMS)
+    ])
+
+    within_budget(
+        nhsukfrontendsettings_tags.footer,
+        tag_renderer('nhsukfrontendsettings_tags', 'footer', get_page('/home/')),
+    )
+
+
+@pytest.mark.parametrize('tag, url_path', [
+    ('breadcrumb', '/home/page-1/page-2/'),
+    ('pagination', '/home/pagination/pagination-page-2/'),
+    ('contents_list', '/home/pagination/pagination-page-2/'),
+])
+def test_navigation_tags(db, django_db_setup, within_budget, tag, url_path):
+    within_budget(
+        getattr(nhsukfrontend_tags, tag),
+        tag_renderer('nhsukfrontend_tags', tag, get_page(url_path)),
+    )
+
+
+def test_card_group_block(db, django_db_setup, within_budget):
+    page = get_page('/home/page-1/')
+    image = get_image_model().objects.get()
+    # Generating a missing rendition is a one-off cost, so the budget assumes they all exist
+    for filter_spec in SRCSET_FILTER_SPECS:
+        image.get_rendition(filter_spec)
+    card = {'heading': 'Card', 'heading_level': 3, 'heading_size': '', 'body': '<p>Body</p>', 'url': ''}
+    raw_value = {
+        'column': 'one-third',
+        'body': (
+            [
+                {'type': 'card_clickable', 'value': dict(card, internal_page=page.pk)}
+                for i in range(ITEMS)
+            ] + [
+                {'type': 'card_image', 'value': dict(card, internal_page=page.pk, content_image=image.pk, alt_text='')}
+                for i in range(ITEMS)
+            ]
+        ),
+    }
+    block = CardGroupBlock()
+
+    # Converting the value is included, as that's where the chosen pages and images are fetched
+    within_budget(block, lambda: block.render(block.to_python(raw_value), {'page': page, 'request': None}))
+
+
+def test_action_link_block(db, django_db_setup, within_budget):
+    page = get_page('/home/page-1/')
+    block = ActionLinkBlock()
+    raw_value = {'text': 'Link', 'external_url': '', 'new_window': False, 'internal_page': page.pk}
+
+    within_budget(block, lambda: block.render(block.to_python(raw_value), {'page': page, 'request': None}))
@@ -0,0 +1,94 @@
+import csv
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+import pytest
+
+from home.models import ArchivedHomePage, ConditionPage, HomePage
+from wagtailnhsukfrontend import review_dates
+from wagtailnhsukfrontend.review_dates import get_review_date_models, get_review_dates_report
+
+
+@pytest.fixture
+def review_pages():
+    """The home page, overdue by a day, and children of it due for review at different times."""
+    now = timezone.now()
+    home = HomePage.objects.get(id=3)
+    home.next_review_date = now - timedelta(days=1)
+    home.save()
+
+    pages = {'home': home}
+    for name, days, live in [('soon', 10, True), ('later', 60, True), ('unset', None, True), ('draft', -5, False)]:
+        page = HomePage(
+            title=name,
+            hero_heading=name,
+            hero_text=name,
+            live=live,
+            next_review_date=now + timedelta(days=days) if days is not None else None,
+        )
+        home.add_child(instance=page)
+        pages[name] = page
+    return pages
+
+
+@pytest.mark.django_db
+def test_review_date_models():
+    assert get_review_date_models() == [HomePage]
+
+
+@pytest.mark.django_db
+def test_subclass_and_proxy_pages_are_listed_once(review_pages):
+    now = timezone.now()
+    pages = []
+    for model in [ConditionPage, ArchivedHomePage]:
+        page = model(title=model.__name__, hero_heading='Page', hero_text='Page', next_review_date=now)
+        review_pages['home'].add_child(instance=page)
+        pages.append(page)
+
+    ids = [row['id'] for row in get_review_dates_report()]
+
+    assert sorted(ids) == sorted([review_pages['home'].id, review_pages['soon'].id] + [page.id for page in pages])
+
+
+@pytest.mark.django_db
+def test_report_lists_overdue_pages_first(review_pages):
+    rows = list(get_review_dates_report())
+
+    assert [row['id'] for row in rows] == [review_pages['home'].id, review_pages['soon'].id]
+    assert rows[0]['page_type'] == 'home page'
+
+
+@pytest.mark.django_db
+def test_report_combines_models(review_pages, monkeypatch):
+    monkeypatch.setattr(review_dates, 'get_review_date_models', lambda: [HomePage, HomePage])
+
+    rows = list(get_review_dates_report())
+
+    assert [row['id'] for row in rows] == [review_pages['home'].id] * 2 + [review_pages['soon'].id] * 2
+
+
+@pytest.mark.django_db
+def test_report_command(review_pages):
+    stdout = StringIO()
+
+    call_command('report_nhsuk_review_dates', days=90, stdout=stdout)
+
+    rows = list(csv.reader(StringIO(stdout.getvalue())))
+    assert rows[0][0] == 'Status'
+    assert [(row[0], row[4]) for row in rows[1:]] == [('Overdue', 'Home'), ('Due', 'soon'), ('Due', 'later')]
+
+
+@pytest.mark.django_db
+def test_report_view(review_pages, admin_client):
+    url = reverse('wagtailnhsukfrontend_review_dates')
+
+    response = admin_client.get(url)
+    assert response.status_code == 200
+    assert [row['id'] for row in response.context['rows']] == [review_pages['home'].id, review_pages['soon'].id]
+
+    response = admin_client.get(url, {'export': 'csv'})
+    rows = list(csv.reader(StringIO(b''.join(response.streaming_content).decode())))
+    assert [row[0] for row in rows] == ['Status', 'Overdue', 'Due']
@@ -0,0 +1,180 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+import pytest
+from wagtail.core.models import Page, PageViewRestriction
+
+from home.models import ChildPage, HomePage
+from wagtailnhsukfrontend.search.index import search, tokenize
+from wagtailnhsukfrontend.search.models import IndexedPage, IndexEntry
+
+
+def add_page(title, body=None, search_description='', parent_id=3):
+    page = HomePage(
+        title=title,
+        hero_heading=title,
+        hero_text=title,
+        search_description=search_description,
+        body=json.dumps(body or []),
+    )
+    Page.objects.get(id=parent_id).add_child(instance=page)
+    page.save_revision().publish()
+    return page
+
+
+def get_terms(page):
+    return set(IndexEntry.objects.filter(page_id=page.id).values_list('term', flat=True))
+
+
+def test_tokenize():
+    assert tokenize('The NHS App, and the NHS website') == ['nhs', 'app', 'nhs', 'website']
+
+
+@pytest.mark.django_db
+def test_nested_block_text_is_indexed():
+    page = add_page('Flu', body=[
+        {'type': 'care_card', 'value': {'type': 'urgent', 'heading_level': 3, 'title': 'Ask for an urgent appointment', 'body': [
+            {'type': 'richtext', 'value': '<p>If you have a <b>high&nbsp;temperature</b></p>'},
+            {'type': 'details', 'value': {'title': 'Shivering', 'body': [
+                {'type': 'richtext', 'value': '<p>Chills and aches</p>'},
+            ]}},
+        ]}},
+        {'type': 'expander_group', 'value': {'expanders': [
+            {'title': 'Vaccines', 'body': [{'type': 'richtext', 'value': '<p>Yearly jab</p>'}]},
+        ]}},
+        {'type': 'summary_list', 'value': {'rows': [{'key': 'Incubation', 'value': 'Two days'}], 'no_border': False}},
+    ])
+
+    terms = get_terms(page)
+    assert {'urgent', 'high', 'temperature', 'shivering', 'chills', 'vaccines', 'jab', 'incubation', 'two'} <= terms
+    assert not {'p', 'b', 'nbsp'} & terms
+
+
+@pytest.mark.django_db
+def test_pages_are_indexed_on_publish_and_removed_on_unpublish():
+    page = add_page('Hay fever')
+    assert get_terms(page) == {'hay', 'fever'}
+
+    page.title = 'Hay fever and pollen'
+    page.save_revision().publish()
+    assert get_terms(page) == {'hay', 'fever', 'pollen'}
+
+    page.unpublish()
+    assert not IndexedPage.objects.filter(page_id=page.id).exists()
+    assert not IndexEntry.objects.filter(page_id=page.id).exists()
+
+
+@pytest.mark.django_db
+def test_private_pages_are_not_indexed():
+    parent = add_page('Staff')
+    PageViewRestriction.objects.create(page=parent, restriction_type=PageViewRestriction.LOGIN)
+    child = add_page('Rota', parent_id=parent.id)
+
+    assert not IndexedPage.objects.filter(page_id=child.id).exists()
+
+
+@pytest.mark.django_db
+def test_restricting_a_published_page_removes_its_subtree():
+    parent = add_page('Staff')
+    child = add_page('Rota', parent_id=parent.id)
+    assert [result.page_id for result in search('rota')[:10]] == [child.id]
+
+    restriction = PageViewRestriction.objects.create(page=parent, restriction_type=PageViewRestriction.LOGIN)
+    assert len(search('rota')) == 0
+    assert len(search('staff')) == 0
+
+    restriction.delete()
+    assert [result.page_id for result in search('rota')[:10]] == [child.id]
+
+
+@pytest.mark.django_db
+def test_moving_a_page_under_a_restricted_page_removes_it():
+    parent = add_page('Staff')
+    PageViewRestriction.objects.create(page=parent, restriction_type=PageViewRestriction.LOGIN)
+    page = add_page('Rota')
+    assert len(search('rota')) == 1
+
+    page.move(parent, pos='last-child')
+
+    assert len(search('rota')) == 0
+
+
+@pytest.mark.django_db
+def test_search_matches_every_term_and_ranks_by_weight():
+    in_description = add_page('Sore throat', search_description='Treating a cough at home')
+    in_body = add_page('Colds', body=[{'type': 'inset_text', 'value': {'body': '<p>A cough lasting weeks at home</p>'}}])
+    add_page('Cough', body=[{'type': 'inset_text', 'value': {'body': '<p>Seeing a GP</p>'}}])
+
+    results = search('cough home')
+
+    assert len(results) == 2
+    assert [result.page_id for result in results[:2]] == [in_description.id, in_body.id]
+    assert results[0].score > results[1].score
+    assert len(search('cough dentist')) == 0
+    assert len(search('the')) == 0
+
+
+@pytest.mark.django_db
+def test_search_within_root_page():
+    parent = add_page('Conditions')
+    child = add_page('Asthma', parent_id=parent.id)
+    add_page('Asthma inhalers')
+
+    assert [result.page_id for result in search('asthma', root_page=parent)[:10]] == [child.id]
+
+
+@pytest.mark.django_db
+def test_search_within_a_site_root():
+    home = Page.objects.get(id=3)
+    page = add_page('Asthma')
+    other_root = Page.get_first_root_node().add_child(instance=ChildPage(title='Other site'))
+    other_page = add_page('Asthma', parent_id=other_root.id)
+
+    assert [result.page_id for result in search('asthma', root_page=home)[:10]] == [page.id]
+    assert len(search('asthma', root_page=home)) == 1
+    assert len(search('asthma')) == 2
+
+    other_root.delete()
+    assert [result.page_id for result in search('asthma', root_page=home)[:10]] == [page.id]
+    assert other_page.id not in [result.page_id for result in search('asthma')[:10]]
+
+
+@pytest.mark.django_db
+def test_search_view(client):
+    pages = [add_page('Measles {}'.format(i)) for i in range(12)]
+
+    response = client.get(reverse('nhsuk_search'), {'search-field': 'measles'})
+
+    assert response.status_code == 200
+    assert response.context['paginator'].count == 12
+    assert len(response.context['results']) == 10
+    assert response.context['next_url'] == '?q=measles&p=2'
+    assert response.context['next_label'] == '2 of 2'
+    assert pages[0].url in response.content.decode()
+
+    response = client.get(reverse('nhsuk_search'), {'q': 'measles', 'p': 2})
+    assert len(response.context['results']) == 2
+    assert response.context['prev_label'] == '1 of 2'
+
+
+@pytest.mark.django_db
+def test_search_view_without_results(client):
+    response = client.get(reverse('nhsuk_search'), {'q': 'unknown'})
+
+    assert response.status_code == 200
+    assert 'No results found for unknown' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_rebuild_command():
+    page = add_page('Chickenpox')
+    IndexedPage.objects.all().delete()
+    stdout = StringIO()
+
+    call_command('update_nhsuk_search_index', batch_size=2, stdout=stdout)
+
+    assert IndexedPage.objects.filter(page_id=page.id).exists()
+    assert stdout.getvalue() == 'Indexed {} pages\n'.format(Page.objects.live().filter(depth__gt=1).count())
+    assert [result.page_id for result in search('chickenpox')[:1]] == [page.id]
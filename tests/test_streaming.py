@@ -0,0 +1,169 @@
+from asgiref.sync import async_to_sync
+from django.conf import settings as django_settings
+from django.contrib import messages
+from django.contrib.auth.models import User
+from django.contrib.messages.storage.base import Message
+from django.contrib.messages.storage.cookie import MessageEncoder
+from django.template.loader import get_template
+from django.test import AsyncClient, Client
+import pytest
+from wagtail.core.blocks import StreamValue
+from wagtail.core.models import Page
+
+from wagtailnhsukfrontend.streaming import uses_csrf_token
+
+PAGES = [
+    '/',
+    '/page-1/page-2/',
+    '/pagination/pagination-page-2/',
+    '/promo-hub/',
+]
+
+
+@pytest.fixture
+def streaming(settings):
+    settings.MIDDLEWARE = settings.MIDDLEWARE + ['wagtailnhsukfrontend.middleware.StreamingPageMiddleware']
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url', PAGES)
+def test_streamed_page_is_the_same(url, client: Client, settings):
+    html = client.get(url).content
+
+    settings.MIDDLEWARE = settings.MIDDLEWARE + ['wagtailnhsukfrontend.middleware.StreamingPageMiddleware']
+    # A client loads the middleware once
+    response = Client().get(url)
+
+    assert response.streaming
+    assert b''.join(response.streaming_content) == html
+
+
+@pytest.mark.django_db
+def test_header_is_sent_before_the_body(client: Client, streaming):
+    response = client.get('/')
+    children = list(Page.objects.get(url_path='/home/').specific.body)
+    chunks = [chunk.decode() for chunk in response.streaming_content]
+
+    # The head and header, each block, then the rest of the page
+    assert len(chunks) == len(children) + 2
+    assert '</header>' in chunks[0]
+    assert 'class="block-' not in chunks[0]
+    for chunk, child in zip(chunks[1:-1], children):
+        assert 'class="block-{}"'.format(child.block_type) in chunk
+    assert '</footer>' in chunks[-1]
+
+
+@pytest.mark.django_db
+def test_streamed_response_keeps_headers(client: Client, streaming):
+    response = client.get('/')
+
+    assert response['Content-Type'] == 'text/html; charset=utf-8'
+    assert 'rel=preload' in response['Link']
+
+
+@pytest.mark.django_db
+def test_other_responses_are_not_streamed(client: Client, streaming):
+    assert not client.get('/does-not-exist/').streaming
+    assert not client.get('/admin/login/').streaming
+
+
+def get_normal_and_streamed(url, settings, setup=lambda client: None):
+    normal_client = Client()
+    setup(normal_client)
+    normal = normal_client.get(url)
+
+    settings.MIDDLEWARE = settings.MIDDLEWARE + ['wagtailnhsukfrontend.middleware.StreamingPageMiddleware']
+    streaming_client = Client()
+    setup(streaming_client)
+    streamed = streaming_client.get(url)
+    b''.join(streamed.streaming_content)
+    return normal, streamed
+
+
+def log_in(client):
+    client.force_login(User.objects.create_user('streaming-{}'.format(len(User.objects.all()))))
+
+
+@pytest.mark.django_db
+def test_anonymous_streamed_pages_set_no_cookies(settings):
+    normal, streamed = get_normal_and_streamed('/', settings)
+
+    assert streamed.streaming
+    # The page doesn't use a CSRF token, so the CSRF cookie isn't set just because it's streamed
+    assert set(streamed.cookies) == set(normal.cookies) == set()
+
+
+@pytest.mark.django_db
+def test_pages_are_not_streamed_to_visitors_with_a_session(client: Client, streaming):
+    log_in(client)
+
+    assert not client.get('/').streaming
+
+
+@pytest.mark.django_db
+def test_pages_using_a_csrf_token_are_not_streamed(client: Client, streaming, monkeypatch):
+    monkeypatch.setattr('wagtailnhsukfrontend.middleware.uses_csrf_token', lambda template: True)
+
+    assert not client.get('/').streaming
+
+
+def test_uses_csrf_token():
+    assert uses_csrf_token(get_template('admin/login.html'))
+    assert not uses_csrf_token(get_template('home/home_page.html'))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('logged_in', [False, True])
+def test_streamed_sessions_have_the_same_vary_header_and_cookies(settings, logged_in):
+    settings.WAGTAILNHSUKFRONTEND_STREAM_SESSIONS = True
+
+    normal, streamed = get_normal_and_streamed('/', settings, log_in if logged_in else lambda client: None)
+
+    assert streamed.streaming
+    assert 'Cookie' in normal['Vary']
+    assert streamed['Vary'] == normal['Vary']
+    assert set(streamed.cookies) >= set(normal.cookies)
+    assert django_settings.CSRF_COOKIE_NAME in streamed.cookies
+
+
+@pytest.mark.django_db
+def test_pages_with_messages_are_not_streamed(client: Client, settings, streaming):
+    settings.WAGTAILNHSUKFRONTEND_STREAM_SESSIONS = True
+    settings.MESSAGE_STORAGE = 'django.contrib.messages.storage.session.SessionStorage'
+    session = client.session
+    session['_messages'] = MessageEncoder().encode([Message(messages.INFO, 'Saved')])
+    session.save()
+
+    assert not client.get('/').streaming
+
+
+@pytest.mark.django_db
+def test_post_requests_are_not_streamed(client: Client, streaming):
+    assert not client.post('/').streaming
+
+
+@pytest.mark.django_db
+def test_errors_while_streaming_are_raised(client: Client, streaming, monkeypatch):
+    def render(self, context=None):
+        raise ValueError('Broken block')
+
+    monkeypatch.setattr(StreamValue.StreamChild, 'render', render)
+    response = client.get('/')
+    chunks = iter(response.streaming_content)
+
+    assert b'</header>' in next(chunks)
+    # The server closes the connection without ending the response, so it can't be mistaken for a whole page
+    with pytest.raises(ValueError):
+        next(chunks)
+
+
+@pytest.mark.django_db
+def test_pages_are_not_streamed_under_asgi(client: Client, settings):
+    html = client.get('/').content
+    settings.MIDDLEWARE = settings.MIDDLEWARE + ['wagtailnhsukfrontend.middleware.StreamingPageMiddleware']
+
+    # The template queries the database, which it can't do while django iterates a streaming response under ASGI
+    response = async_to_sync(AsyncClient().get)('/')
+
+    assert not response.streaming
+    assert response.content == html
@@ -0,0 +1,58 @@
+from asgiref.sync import async_to_sync
+from django.template import Context, Template
+from django.test import AsyncClient, Client, RequestFactory
+import pytest
+from wagtail.core.models import Page
+
+from wagtailnhsukfrontend.tag_contexts import LOADERS, TAG_CONTEXTS, load_tag_contexts
+
+PAGES = [
+    '/',
+    '/page-1/page-2/',
+    '/pagination/pagination-page-2/',
+    '/promo-hub/',
+]
+
+TAGS = Template(
+    '{% load nhsukfrontend_tags nhsukfrontendsettings_tags %}'
+    '{% header %}{% breadcrumb %}{% pagination %}{% contents_list %}{% footer %}'
+)
+
+
+def render_tags(page, tag_contexts=None):
+    request = RequestFactory().get(page.url)
+    context = {'page': page, 'request': request}
+    if tag_contexts:
+        context[TAG_CONTEXTS] = async_to_sync(load_tag_contexts)(request, page, tag_contexts)
+    return TAGS.render(Context(context))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url', PAGES)
+def test_pages_render_the_same_under_asgi(url, client: Client):
+    response = async_to_sync(AsyncClient().get)(url)
+
+    assert response.status_code == 200
+    assert set(response.context[TAG_CONTEXTS].contexts) == {'header', 'footer', 'breadcrumb'}
+    assert response.content == client.get(url).content
+
+
+@pytest.mark.django_db
+def test_tags_render_loaded_contexts(django_assert_max_num_queries):
+    page = Page.objects.get(url_path='/home/pagination/pagination-page-2/').specific
+    html = render_tags(page)
+
+    with django_assert_max_num_queries(0):
+        assert render_tags(page, list(LOADERS)) == html
+
+
+@pytest.mark.django_db
+def test_contexts_loaded_for_another_page_are_ignored():
+    page = Page.objects.get(url_path='/home/pagination/pagination-page-2/').specific
+    other_page = Page.objects.get(url_path='/home/page-1/')
+    request = RequestFactory().get(page.url)
+    tag_contexts = async_to_sync(load_tag_contexts)(request, other_page, ['breadcrumb'])
+
+    html = TAGS.render(Context({'page': page, 'request': request, TAG_CONTEXTS: tag_contexts}))
+
+    assert html == render_tags(page)
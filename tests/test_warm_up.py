@@ -0,0 +1,51 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import engines
+from wagtail.core.models import Site
+
+from wagtailnhsukfrontend.settings.context import get_header_context
+from wagtailnhsukfrontend.warmup import get_template_names, uses_cached_loader, warm_up
+
+
+@pytest.fixture
+def cached_loader(settings):
+    settings.TEMPLATES = [
+        dict(
+            settings.TEMPLATES[0],
+            APP_DIRS=False,
+            OPTIONS=dict(settings.TEMPLATES[0]['OPTIONS'], loaders=[
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ]),
+        ),
+    ]
+
+
+def test_template_names():
+    names = get_template_names()
+
+    assert 'wagtailnhsukfrontend/header.html' in names
+    assert 'wagtailnhsukfrontend/header/search.html' in names
+
+
+def test_warm_up_fills_the_template_cache(cached_loader):
+    assert uses_cached_loader()
+
+    warm_up()
+
+    loader = engines['django'].engine.template_loaders[0]
+    assert set(get_template_names()) <= set(loader.get_template_cache)
+
+
+def test_warm_up_command_primes_settings(db, django_db_setup, django_assert_num_queries):
+    site = Site.objects.get(is_default_site=True)
+    stdout = StringIO()
+    call_command('warm_up_nhsuk', prime_settings=True, stdout=stdout, stderr=StringIO())
+
+    assert [line.split()[0] for line in stdout.getvalue().splitlines()] == ['templates', 'blocks', 'settings', 'total']
+    with django_assert_num_queries(0):
+        get_header_context(site)
@@ -0,0 +1,65 @@
+from django.test import Client
+import pytest
+
+from wagtailnhsukfrontend.loaders import collapse_whitespace
+
+PAGES = [
+    '/',
+    '/page-1/page-2/',
+    '/pagination/pagination-page-2/',
+    '/promo-hub/',
+]
+
+
+def use_whitespace_loader(settings):
+    settings.TEMPLATES = [
+        dict(
+            settings.TEMPLATES[0],
+            APP_DIRS=False,
+            OPTIONS=dict(settings.TEMPLATES[0]['OPTIONS'], loaders=[
+                'django.template.loaders.filesystem.Loader',
+                'wagtailnhsukfrontend.loaders.Loader',
+            ]),
+        ),
+    ]
+
+
+def normalize(html):
+    return ' '.join(html.split())
+
+
+def test_collapse_whitespace():
+    assert collapse_whitespace('<p>\n    Some   text\n  <b>bold</b> {{ a }}  {{ b }}\n</p>\n') == (
+        '<p>\nSome text\n<b>bold</b> {{ a }} {{ b }}\n</p>\n'
+    )
+
+
+def test_collapse_whitespace_after_silent_tags():
+    source = '<div>\n  {% if a %}\n    {{ a }}\n  {% else %}\n    b\n  {% endif %}\n  c\n</div>'
+
+    assert collapse_whitespace(source) == '<div>\n{% if a %}{{ a }}\n{% else %}b\n{% endif %}c\n</div>'
+
+
+def test_collapse_whitespace_keeps_words_apart():
+    # Without the whitespace after `{% endif %}`, "a" and "c" would be joined when the condition is false
+    source = 'a{% if b %}\n  b\n{% endif %}\n  c'
+
+    assert collapse_whitespace(source) == 'a{% if b %}\nb\n{% endif %}\nc'
+
+
+def test_collapse_whitespace_preserves_pre():
+    source = '<div>\n  <pre>\n  indented\n    more\n</pre>\n  <script>\nvar a = 1\n  </script>\n</div>'
+
+    assert collapse_whitespace(source) == '<div>\n<pre>\n  indented\n    more\n</pre>\n<script>\nvar a = 1\n  </script>\n</div>'
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url', PAGES)
+def test_pages_only_lose_whitespace(url, client: Client, settings):
+    html = client.get(url).content.decode()
+
+    use_whitespace_loader(settings)
+    collapsed = client.get(url).content.decode()
+
+    assert len(collapsed) < len(html)
+    assert normalize(collapsed) == normalize(html)
@@ -0,0 +1,21 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class WagtailNHSUKFrontendAppConfig(AppConfig):
+    name = 'wagtailnhsukfrontend'
+    label = 'wagtailnhsukfrontend'
+    verbose_name = "Wagtail NHSUK Frontend"
+
+    def ready(self):
+        from wagtailnhsukfrontend.signal_handlers import register_signal_handlers
+        register_signal_handlers()
+
+        # Raises ImproperlyConfigured for formats which would make every image fail to render
+        from wagtailnhsukfrontend.images import get_image_formats
+        get_image_formats()
+
+        if getattr(settings, 'WAGTAILNHSUKFRONTEND_WARM_UP', False):
+            # The database isn't ready yet, so the settings caches can't be primed here
+            from wagtailnhsukfrontend.warmup import warm_up
+            warm_up()
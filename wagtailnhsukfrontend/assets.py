@@ -0,0 +1,151 @@
+"""
+Build the CSS and JS bundles with content-hashed filenames, a manifest, and precompressed variants.
+
+This module doesn't import django, so that `setup.py build` can use it.
+"""
+import functools
+import gzip
+import hashlib
+import json
+import os
+import re
+
+from wagtailnhsukfrontend.critical_css import CRITICAL_TEMPLATES, UsedSelectors, extract_critical_css
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'wagtailnhsukfrontend')
+
+# Paths are relative to STATIC_DIR
+BUNDLES = {
+    'css/wagtail-nhsuk-frontend.min.css': [
+        'css/nhsuk-5.0.0.min.css',
+        'css/fixes.css',
+    ],
+    'js/wagtail-nhsuk-frontend.min.js': [
+        'js/nhsuk-5.0.0.min.js',
+    ],
+    # A bundle of just itself only gets a hashed copy
+    'icons/nhsuk-icons.svg': [
+        'icons/nhsuk-icons.svg',
+    ],
+}
+
+ICON_SPRITE = 'icons/nhsuk-icons.svg'
+
+# The critical CSS for each bundle, see `wagtailnhsukfrontend.critical_css`
+CRITICAL_CSS = {
+    'css/wagtail-nhsuk-frontend.min.css': 'css/wagtail-nhsuk-frontend-critical.min.css',
+}
+
+MANIFEST_NAME = 'manifest.json'
+
+HASH_LENGTH = 12
+
+
+def hashed_name(name, content):
+    """
+    Insert a hash of `content` before the extension of `name`, e.g. `css/bundle.min.css` -> `css/bundle.min.<hash>.css`
+    """
+    root, ext = os.path.splitext(name)
+    return '{}.{}{}'.format(root, hashlib.md5(content).hexdigest()[:HASH_LENGTH], ext)
+
+
+def is_hashed_version(filename, name):
+    """Return True if `filename` is a hashed version of `name` from any build."""
+    root, ext = os.path.splitext(os.path.basename(name))
+    pattern = r'{}\.[0-9a-f]{{{}}}{}(\.gz|\.br)?$'.format(re.escape(root), HASH_LENGTH, re.escape(ext))
+    return re.match(pattern, filename) is not None
+
+
+def write_file(path, content):
+    """Write a file along with gzip and (if the brotli package is installed) brotli compressed variants."""
+    with open(path, 'wb') as f:
+        f.write(content)
+    with open(path + '.gz', 'wb') as f:
+        # mtime=0 keeps the output the same for the same input
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(content))
+
+
+def build_assets(static_dir=STATIC_DIR, bundles=BUNDLES, critical_css=CRITICAL_CSS, critical_templates=CRITICAL_TEMPLATES):
+    """
+    Concatenate each bundle's source files, write it under both its plain and hashed names, and write a manifest
+    mapping one to the other. Hashed files left over from earlier builds are removed.
+    The critical CSS for a bundle is extracted from the rules used by `critical_templates`.
+    Returns the manifest.
+    """
+    manifest = {}
+    used = UsedSelectors.from_templates(critical_templates)
+    for name, sources in bundles.items():
+        content = b''
+        for source in sources:
+            with open(os.path.join(static_dir, source), 'rb') as f:
+                content += f.read()
+            # Files don't always end with a newline, and CSS comments must not run into the next file
+            if not content.endswith(b'\n'):
+                content += b'\n'
+
+        directory = os.path.join(static_dir, os.path.dirname(name))
+        for filename in os.listdir(directory):
+            if is_hashed_version(filename, name):
+                os.remove(os.path.join(directory, filename))
+
+        manifest[name] = hashed_name(name, content)
+        if sources != [name]:
+            write_file(os.path.join(static_dir, name), content)
+        write_file(os.path.join(static_dir, manifest[name]), content)
+
+        if name in critical_css:
+            # Critical CSS is inlined in the page, so it doesn't need a hashed name or compressed variants
+            with open(os.path.join(static_dir, critical_css[name]), 'w') as f:
+                f.write(extract_critical_css(content.decode(), used))
+
+    with open(os.path.join(static_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return manifest
+
+
+@functools.lru_cache()
+def get_manifest(static_dir=STATIC_DIR):
+    """
+    Return the manifest from the last build, or an empty dict if the assets haven't been built.
+    """
+    try:
+        with open(os.path.join(static_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+@functools.lru_cache()
+def get_manifest_version(static_dir=STATIC_DIR):
+    """
+    Return a hash of the manifest. Cached HTML which includes hashed asset URLs keeps this in its cache key, as a
+    build removes the files it names.
+    """
+    return hashlib.md5(json.dumps(get_manifest(static_dir), sort_keys=True).encode()).hexdigest()
+
+
+@functools.lru_cache()
+def get_critical_css(name, static_dir=STATIC_DIR):
+    """
+    Return the critical CSS for the bundle `name`, or None if the assets haven't been built.
+    """
+    try:
+        with open(os.path.join(static_dir, CRITICAL_CSS[name])) as f:
+            return f.read()
+    except (KeyError, FileNotFoundError):
+        return None
+
+
+@functools.lru_cache()
+def get_icon_sprite(static_dir=STATIC_DIR):
+    with open(os.path.join(static_dir, ICON_SPRITE)) as f:
+        return f.read()
@@ -1,9 +1,18 @@
+import hashlib
+import json
+
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.forms.utils import ErrorList
+from django.template.loader import get_template
+from django.template.loader_tags import ExtendsNode, IncludeNode
+from django.utils.safestring import mark_safe
 from wagtail.core.blocks import (
     BooleanBlock,
     CharBlock,
     ChoiceBlock,
+    ChooserBlock,
     IntegerBlock,
     RichTextBlock,
     StreamBlock,
@@ -14,6 +23,30 @@ from wagtail.core.blocks import (
 )
 from wagtail.images.blocks import ImageChooserBlock
 
+from wagtailnhsukfrontend.assets import get_manifest_version
+from wagtailnhsukfrontend.cache import get_cache, get_generation, get_timeout, make_key
+from wagtailnhsukfrontend.images import get_image_formats, get_srcset_filter_specs
+from wagtailnhsukfrontend.page_urls import PAGE_URL_CACHE
+from wagtailnhsukfrontend.prefetch import PrefetchChooserBlock, prefetch_renditions, walk_blocks
+
+# A hash of each block template's source, so that cached blocks are re-rendered when a template they use changes
+_template_versions = {}
+
+
+class PrefetchPageChooserBlock(PrefetchChooserBlock, PageChooserBlock):
+    """A PageChooserBlock whose pages are loaded in bulk by `prefetch_renditions`"""
+
+
+class PrefetchImageChooserBlock(PrefetchChooserBlock, ImageChooserBlock):
+    """An ImageChooserBlock whose images are loaded in bulk by `prefetch_renditions`"""
+
+
+# Deconstruct the blocks above as the wagtail blocks they extend, so that using them doesn't change any migrations
+DECONSTRUCT_ALIASES = {
+    PrefetchPageChooserBlock: 'wagtail.core.blocks.PageChooserBlock',
+    PrefetchImageChooserBlock: 'wagtail.images.blocks.ImageChooserBlock',
+}
+
 
 class FlattenValueContext:
     """NHS.UK StructBlock mixin that flattens `value` for re-usability of templates"""
@@ -24,17 +57,191 @@ class FlattenValueContext:
         return context
 
 
-class ActionLinkBlock(FlattenValueContext, StructBlock):
+def _without_stream_ids(prep_value):
+    """Remove the ids of StreamBlock children from a block's prep value, as they don't change how it renders."""
+    if isinstance(prep_value, list):
+        return [_without_stream_ids(item) for item in prep_value]
+    if isinstance(prep_value, dict):
+        is_stream_child = 'type' in prep_value and 'value' in prep_value
+        return {
+            key: _without_stream_ids(item)
+            for key, item in prep_value.items()
+            if not (is_stream_child and key == 'id')
+        }
+    return prep_value
+
+
+def get_template_version(template_name):
+    """Return a hash of a template's source."""
+    if template_name not in _template_versions:
+        source = get_template(template_name).template.source
+        _template_versions[template_name] = hashlib.md5(source.encode()).hexdigest()
+    return _template_versions[template_name]
+
+
+def get_template_names(template_name, names=None):
+    """
+    Return the names of a template and of every template it includes or extends by a literal name, e.g.
+    `{% include './details.html' %}`.
+    """
+    if names is None:
+        names = []
+    names.append(template_name)
+    nodelist = get_template(template_name).template.nodelist
+    for node in nodelist.get_nodes_by_type(IncludeNode) + nodelist.get_nodes_by_type(ExtendsNode):
+        expression = node.template if isinstance(node, IncludeNode) else node.parent_name
+        if isinstance(expression.var, str) and expression.var not in names:
+            get_template_names(expression.var, names)
+    return names
+
+
+def get_block_template_names(block, names=None):
+    """Return the names of the templates used to render a block and each of its child blocks."""
+    if names is None:
+        names = []
+    template_name = getattr(block.meta, 'template', None)
+    if template_name and template_name not in names:
+        names.extend(name for name in get_template_names(template_name) if name not in names)
+    if hasattr(block, 'child_blocks'):
+        children = block.child_blocks.values()
+    elif hasattr(block, 'child_block'):
+        children = [block.child_block]
+    else:
+        children = []
+    for child in children:
+        get_block_template_names(child, names)
+    return names
+
+
+class CachedRender:
+    """
+    NHS.UK StructBlock mixin that caches the rendered template when `WAGTAILNHSUKFRONTEND_BLOCK_CACHE` is enabled.
+    Blocks are cached by a hash of their value, so identical blocks on different pages are only rendered once.
+    The parent context isn't part of the key, so a block whose template uses it should set `cache_render = False`
+    on its Meta.
+    """
+
+    def get_render_version(self):
+        """
+        Return a hash of the templates which render this block: its own, its child blocks' and every template they
+        include, so that editing any of them re-renders the block.
+        """
+        if not hasattr(self, '_render_template_names'):
+            self._render_template_names = get_block_template_names(self)
+        return hashlib.md5(''.join(
+            name + get_template_version(name) for name in self._render_template_names
+        ).encode()).hexdigest()
+
+    def get_render_cache_key(self, value):
+        """
+        Return the cache key for a rendered value, or None if it shouldn't be cached.
+        """
+        images = []
+        has_page_links = False
+        for block, block_value in walk_blocks(self, value):
+            if not getattr(block.meta, 'cache_render', True):
+                # The block, or a child block, renders something from the page or request in the parent context
+                return None
+            if isinstance(block, ImageChooserBlock):
+                if block_value:
+                    images.append([
+                        block_value.pk,
+                        block_value.file_hash,
+                        block_value.focal_point_x,
+                        block_value.focal_point_y,
+                        block_value.focal_point_width,
+                        block_value.focal_point_height,
+                    ])
+            elif isinstance(block, ChooserBlock) and block_value:
+                # Links to pages, documents etc. depend on the request and on the chosen object
+                return None
+            elif isinstance(block, RichTextBlock) and block_value and 'linktype="page"' in block_value.source:
+                has_page_links = True
+
+        content = json.dumps(
+            [
+                self.__class__.__module__,
+                self.__class__.__name__,
+                self.get_render_version(),
+                # Icons link to the hashed sprite
+                get_manifest_version(),
+                _without_stream_ids(self.get_prep_value(value)),
+                images,
+                get_image_formats() if images else None,
+                # Rich text page links are expanded to the page URL
+                get_generation(PAGE_URL_CACHE) if has_page_links else None,
+            ],
+            cls=DjangoJSONEncoder,
+            sort_keys=True,
+        )
+        return make_key('block', hashlib.sha1(content.encode()).hexdigest())
+
+    def render(self, value, context=None):
+        if not getattr(settings, 'WAGTAILNHSUKFRONTEND_BLOCK_CACHE', False) or not self.get_template():
+            return super().render(value, context)
+
+        key = self.get_render_cache_key(value)
+        if key is None:
+            return super().render(value, context)
+
+        cache = get_cache()
+        html = cache.get(key)
+        if html is None:
+            html = super().render(value, context)
+            cache.set(key, str(html), get_timeout())
+        return mark_safe(html)
+
+
+def image_priority_block():
+    """
+    Return the `priority` field of the blocks with an image. Each block needs its own instance of the field.
+    """
+    return BooleanBlock(
+        label='High priority',
+        required=False,
+        help_text='Load the image straight away. Use this for an image near the top of the page, other images are loaded as they are scrolled into view.',
+    )
+
+
+class SrcsetImage:
+    """NHS.UK StructBlock mixin for blocks which render `content_image` at each of the srcset widths"""
+
+    def get_prefetch_renditions(self, value):
+        if value.get('content_image'):
+            yield from self.get_content_image_renditions(value['content_image'])
+
+    def get_raw_prefetch_renditions(self, raw_value):
+        """Like `get_prefetch_renditions`, for the block's raw JSON value, with image ids instead of images"""
+        if raw_value.get('content_image'):
+            yield from self.get_content_image_renditions(raw_value['content_image'])
+
+    def get_content_image_renditions(self, image):
+        yield image, get_srcset_filter_specs()
+        for image_format in get_image_formats():
+            yield image, get_srcset_filter_specs(image_format)
+
+
+class PrefetchRenditions:
+    """NHS.UK StructBlock mixin that fetches the image renditions for all of its child blocks in one query"""
+
+    def get_context(self, value, parent_context=None):
+        prefetch_renditions(value, block=self)
+        return super().get_context(value, parent_context)
+
+
+class ActionLinkBlock(CachedRender, FlattenValueContext, StructBlock):
 
     text = CharBlock(label="Link text", required=True)
     external_url = URLBlock(label="URL", required=False)
     new_window = BooleanBlock(required=False, label="Open in new window")
-    internal_page = PageChooserBlock(label="Internal Page", required=False)
+    internal_page = PrefetchPageChooserBlock(label="Internal Page", required=False)
 
     class Meta:
         icon = 'link'
         template = 'wagtailnhsukfrontend/action_link.html'
         help_text = 'Enter a URL or select and Internal Page'
+        # Internal page, site root paths
+        query_budget = 2
 
     def clean(self, value):
 
@@ -60,7 +267,7 @@ class ActionLinkBlock(FlattenValueContext, StructBlock):
         return super().clean(value)
 
 
-class WarningCalloutBlock(FlattenValueContext, StructBlock):
+class WarningCalloutBlock(CachedRender, FlattenValueContext, StructBlock):
 
     title = CharBlock(required=True, default='Important')
     visually_hidden_prefix = BooleanBlock(required=False, label='Visually hidden prefix', help_text='If the title doesn\'t contain the word \"Important\" select this to add a visually hidden \"Important\", to aid screen readers.')
@@ -72,7 +279,7 @@ class WarningCalloutBlock(FlattenValueContext, StructBlock):
         template = 'wagtailnhsukfrontend/warning_callout.html'
 
 
-class InsetTextBlock(FlattenValueContext, StructBlock):
+class InsetTextBlock(CachedRender, FlattenValueContext, StructBlock):
 
     body = RichTextBlock(required=True)
 
@@ -81,7 +288,7 @@ class InsetTextBlock(FlattenValueContext, StructBlock):
         template = 'wagtailnhsukfrontend/inset_text.html'
 
 
-class PanelBlock(FlattenValueContext, StructBlock):
+class PanelBlock(CachedRender, FlattenValueContext, StructBlock):
 
     label = CharBlock(required=False)
     heading_level = IntegerBlock(min_value=2, max_value=6, default=3, help_text='The heading level affects users with screen readers. Ignore this if there is no label. Default=3, Min=2, Max=6.')
@@ -93,7 +300,7 @@ class PanelBlock(FlattenValueContext, StructBlock):
         help_text = 'This component is now deprecated and will be removed from future versions, please use the feature card block'
 
 
-class GreyPanelBlock(FlattenValueContext, StructBlock):
+class GreyPanelBlock(CachedRender, FlattenValueContext, StructBlock):
 
     label = CharBlock(label='heading', required=False)
     heading_level = IntegerBlock(min_value=2, max_value=6, default=3, help_text='The heading level affects users with screen readers. Ignore this if there is no heading. Default=3, Min=2, Max=6.')
@@ -105,7 +312,7 @@ class GreyPanelBlock(FlattenValueContext, StructBlock):
         help_text = 'This component is now deprecated and will be removed from future versions, please use the feature card block'
 
 
-class PanelListBlock(FlattenValueContext, StructBlock):
+class PanelListBlock(CachedRender, FlattenValueContext, StructBlock):
 
     panels = ListBlock(StructBlock([
         ('left_panel', PanelBlock()),
@@ -118,7 +325,7 @@ class PanelListBlock(FlattenValueContext, StructBlock):
         help_text = 'This component is now deprecated and will be removed from future versions, please use the card group block'
 
 
-class DoBlock(FlattenValueContext, StructBlock):
+class DoBlock(CachedRender, FlattenValueContext, StructBlock):
 
     heading_level = IntegerBlock(required=True, min_value=2, max_value=6, default=3, help_text='The heading level affects users with screen readers. Default=3, Min=2, Max=6.')
     label = CharBlock(label='Heading', required=False, help_text='Adding a label here will overwrite the default of Do')
@@ -129,7 +336,7 @@ class DoBlock(FlattenValueContext, StructBlock):
         template = 'wagtailnhsukfrontend/do_list.html'
 
 
-class DontBlock(FlattenValueContext, StructBlock):
+class DontBlock(CachedRender, FlattenValueContext, StructBlock):
 
     heading_level = IntegerBlock(required=True, min_value=2, max_value=6, default=3, help_text='The heading level affects users with screen readers. Default=3, Min=2, Max=6.')
     label = CharBlock(label='Heading', required=False, help_text='Adding a label here will overwrite the default of Don\'t')
@@ -140,24 +347,26 @@ class DontBlock(FlattenValueContext, StructBlock):
         template = 'wagtailnhsukfrontend/dont_list.html'
 
 
-class ImageBlock(FlattenValueContext, StructBlock):
+class ImageBlock(SrcsetImage, CachedRender, FlattenValueContext, StructBlock):
 
-    content_image = ImageChooserBlock(required=True)
+    content_image = PrefetchImageChooserBlock(required=True)
     alt_text = CharBlock(required=False, help_text="Only leave this blank if the image is decorative.")
     caption = CharBlock(required=False)
+    priority = image_priority_block()
 
     class Meta:
         icon = 'image'
         template = 'wagtailnhsukfrontend/image.html'
 
 
-class BasePromoBlock(FlattenValueContext, StructBlock):
+class BasePromoBlock(SrcsetImage, CachedRender, FlattenValueContext, StructBlock):
 
     url = URLBlock(label="URL", required=True)
     heading = CharBlock(required=True)
     description = CharBlock(required=False)
-    content_image = ImageChooserBlock(label="Image", required=False)
+    content_image = PrefetchImageChooserBlock(label="Image", required=False)
     alt_text = CharBlock(required=False)
+    priority = image_priority_block()
 
     class Meta:
         icon = 'pick'
@@ -179,7 +388,7 @@ class PromoBlock(BasePromoBlock):
         help_text = 'This component is now deprecated and will be removed from future versions, please use the card block'
 
 
-class PromoGroupBlock(FlattenValueContext, StructBlock):
+class PromoGroupBlock(PrefetchRenditions, CachedRender, FlattenValueContext, StructBlock):
 
     column = ChoiceBlock([
         ('one-half', 'One-half'),
@@ -215,7 +424,7 @@ class SummaryListRowBlock(StructBlock):
     value = RichTextBlock()
 
 
-class SummaryListBlock(FlattenValueContext, StructBlock):
+class SummaryListBlock(CachedRender, FlattenValueContext, StructBlock):
 
     rows = ListBlock(SummaryListRowBlock)
     no_border = BooleanBlock(default=False, required=False)
@@ -225,7 +434,7 @@ class SummaryListBlock(FlattenValueContext, StructBlock):
         template = 'wagtailnhsukfrontend/summary_list.html'
 
 
-class CardBasicBlock(FlattenValueContext, StructBlock):
+class CardBasicBlock(CachedRender, FlattenValueContext, StructBlock):
 
     heading = CharBlock(required=True)
     heading_level = IntegerBlock(min_value=2, max_value=6, default=3, help_text='The heading level affects users with screen readers. Ignore this if there is no label. Default=3, Min=2, Max=6.')
@@ -250,7 +459,7 @@ class CardBasicBlock(FlattenValueContext, StructBlock):
 
 class CardClickableBlock(CardBasicBlock):
 
-    internal_page = PageChooserBlock(label="Internal Page", required=False, help_text='Interal Page Link for the card')
+    internal_page = PrefetchPageChooserBlock(label="Internal Page", required=False, help_text='Interal Page Link for the card')
     url = URLBlock(label="URL", required=False, help_text='External Link for the card')
 
     class Meta:
@@ -283,12 +492,13 @@ class CardClickableBlock(CardBasicBlock):
         return super().clean(value)
 
 
-class CardImageBlock(CardBasicBlock):
+class CardImageBlock(SrcsetImage, CardBasicBlock):
 
-    content_image = ImageChooserBlock(label='Image', required=True)
+    content_image = PrefetchImageChooserBlock(label='Image', required=True)
     alt_text = CharBlock(required=True)
     url = URLBlock(label="URL", required=False, help_text='Optional, if there is a link the entire card will be clickable.')
-    internal_page = PageChooserBlock(label="Internal Page", required=False, help_text='Optional, if there is a link the entire card will be clickable.')
+    internal_page = PrefetchPageChooserBlock(label="Internal Page", required=False, help_text='Optional, if there is a link the entire card will be clickable.')
+    priority = image_priority_block()
 
     class Meta:
         label = 'Card with an image'
@@ -316,7 +526,7 @@ class CardImageBlock(CardBasicBlock):
         return super().clean(value)
 
 
-class CardFeatureBlock(FlattenValueContext, StructBlock):
+class CardFeatureBlock(CachedRender, FlattenValueContext, StructBlock):
 
     feature_heading = CharBlock(required=True)
     heading_level = IntegerBlock(min_value=2, max_value=6, default=3, help_text='The heading level affects users with screen readers. Ignore this if there is no label. Default=3, Min=2, Max=6.')
@@ -339,7 +549,7 @@ class CardFeatureBlock(FlattenValueContext, StructBlock):
         template = 'wagtailnhsukfrontend/card.html'
 
 
-class CardGroupBlock(FlattenValueContext, StructBlock):
+class CardGroupBlock(PrefetchRenditions, CachedRender, FlattenValueContext, StructBlock):
 
     column = ChoiceBlock([
         ('', 'Full-width'),
@@ -358,9 +568,11 @@ class CardGroupBlock(FlattenValueContext, StructBlock):
     class Meta:
         icon = 'doc-full'
         template = 'wagtailnhsukfrontend/card_collection.html'
+        # Chosen pages and images for each card type, renditions, site root paths
+        query_budget = 5
 
 
-class DetailsBlock(FlattenValueContext, StructBlock):
+class DetailsBlock(PrefetchRenditions, CachedRender, FlattenValueContext, StructBlock):
 
     # Define a BodyStreamBlock class in this way to make it easier to subclass and add extra body blocks
     class BodyStreamBlock(StreamBlock):
@@ -401,7 +613,7 @@ class ExpanderBlock(DetailsBlock):
         template = 'wagtailnhsukfrontend/expander.html'
 
 
-class ExpanderGroupBlock(FlattenValueContext, StructBlock):
+class ExpanderGroupBlock(PrefetchRenditions, CachedRender, FlattenValueContext, StructBlock):
 
     expanders = ListBlock(ExpanderBlock)
 
@@ -410,7 +622,7 @@ class ExpanderGroupBlock(FlattenValueContext, StructBlock):
         template = 'wagtailnhsukfrontend/expander_group.html'
 
 
-class CareCardBlock(FlattenValueContext, StructBlock):
+class CareCardBlock(PrefetchRenditions, CachedRender, FlattenValueContext, StructBlock):
 
     type = ChoiceBlock([
         ('primary', 'Non-urgent'),
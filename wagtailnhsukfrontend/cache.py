@@ -0,0 +1,40 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+
+KEY_PREFIX = 'wagtailnhsukfrontend'
+
+
+def get_cache():
+    """
+    Return the django cache used by wagtailnhsukfrontend.
+    Set `WAGTAILNHSUKFRONTEND_CACHE` to the alias of a configured cache to use something other than 'default'.
+    """
+    return caches[getattr(settings, 'WAGTAILNHSUKFRONTEND_CACHE', 'default')]
+
+
+def get_timeout():
+    return getattr(settings, 'WAGTAILNHSUKFRONTEND_CACHE_TIMEOUT', 60 * 60 * 24)
+
+
+def make_key(*parts):
+    return ':'.join([KEY_PREFIX] + [str(part) for part in parts])
+
+
+def get_generation(name):
+    """
+    Return the current generation for a group of cache entries.
+    Cache keys that include the generation are invalidated all at once by calling `bump_generation`.
+    """
+    cache = get_cache()
+    key = make_key('generation', name)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(name):
+    get_cache().set(make_key('generation', name), uuid4().hex, None)
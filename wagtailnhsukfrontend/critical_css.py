@@ -0,0 +1,201 @@
+"""
+Extract the CSS rules needed to render the above-the-fold templates, so they can be inlined in the page <head>.
+
+The extractor is deliberately simple: it collects the element names, classes and ids written in the templates (and
+the templates they include), and keeps each selector whose elements, classes and ids all appear there. State classes
+added by JavaScript, such as `is-active`, are left to the full stylesheet.
+This module doesn't import django, so that `setup.py build` can use it.
+"""
+import os
+import re
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+CRITICAL_TEMPLATES = [
+    'wagtailnhsukfrontend/skip_link.html',
+    'wagtailnhsukfrontend/header.html',
+    'wagtailnhsukfrontend/breadcrumb.html',
+    'wagtailnhsukfrontend/hero.html',
+]
+
+# Page layout classes which are used in the project's base template rather than ours
+CRITICAL_CLASSES = [
+    'nhsuk-width-container',
+    'nhsuk-main-wrapper',
+    'nhsuk-grid-row',
+    'nhsuk-grid-column-full',
+    'nhsuk-grid-column-two-thirds',
+]
+
+# Elements which are always on the page
+CRITICAL_ELEMENTS = ['html', 'body']
+
+TEMPLATE_SYNTAX = re.compile(r'{%.*?%}|{{.*?}}|{#.*?#}', re.DOTALL)
+INCLUDE = re.compile(r'{%\s*include\s+["\']([^"\']+)["\']')
+ICON = re.compile(r'{%\s*nhsuk_icon\s+["\']([\w-]+)["\']')
+CLASS_ATTRIBUTE = re.compile(r'\bclass="([^"]*)"')
+ID_ATTRIBUTE = re.compile(r'\bid="([^"]*)"')
+ELEMENT = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)')
+COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+SELECTOR_CLASS = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+SELECTOR_ID = re.compile(r'#(-?[_a-zA-Z][\w-]*)')
+SELECTOR_ELEMENT = re.compile(r'(?:^|[\s>+~])([a-zA-Z][a-zA-Z0-9]*)')
+# Functional pseudo-classes like :not() and attribute selectors don't stop an element from being styled
+SELECTOR_IGNORED = re.compile(r'::?[\w-]+\([^)]*\)|\[[^\]]*\]|::?[\w-]+')
+
+# At-rules whose contents are more rules, which are filtered in turn
+NESTED_AT_RULES = ('@media', '@supports')
+
+
+class UsedSelectors:
+    """The element names, classes and ids used in a set of templates."""
+
+    def __init__(self, elements=(), classes=(), ids=()):
+        self.elements = set(elements)
+        self.classes = set(classes)
+        self.ids = set(ids)
+
+    @classmethod
+    def from_templates(cls, template_names, templates_dir=TEMPLATES_DIR):
+        used = cls(elements=CRITICAL_ELEMENTS, classes=CRITICAL_CLASSES)
+        seen = set()
+        template_names = list(template_names)
+        while template_names:
+            name = template_names.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+
+            with open(os.path.join(templates_dir, name)) as f:
+                source = f.read()
+            template_names.extend(
+                included for included in INCLUDE.findall(source)
+                if os.path.exists(os.path.join(templates_dir, included))
+            )
+            for icon in ICON.findall(source):
+                used.add_icon(icon)
+            used.add_markup(TEMPLATE_SYNTAX.sub(' ', source))
+        return used
+
+    def add_icon(self, name):
+        """Add the markup output by `{% nhsuk_icon name %}`."""
+        self.elements.update(['svg', 'use'])
+        self.classes.update(['nhsuk-icon', 'nhsuk-icon__{}'.format(name)])
+
+    def add_markup(self, markup):
+        self.elements.update(element.lower() for element in ELEMENT.findall(markup))
+        for value in CLASS_ATTRIBUTE.findall(markup):
+            self.classes.update(value.split())
+        for value in ID_ATTRIBUTE.findall(markup):
+            self.ids.update(value.split())
+
+    def matches(self, selector):
+        """
+        Return True if every element, class and id in `selector` is used.
+        """
+        selector = SELECTOR_IGNORED.sub('', selector)
+        classes = set(SELECTOR_CLASS.findall(selector))
+        ids = set(SELECTOR_ID.findall(selector))
+        elements = {element.lower() for element in SELECTOR_ELEMENT.findall(selector)}
+        return classes <= self.classes and ids <= self.ids and elements <= self.elements
+
+
+def skip_string(css, i):
+    """Return the index after the string starting at `css[i]`."""
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == '\\' else 1
+    return i + 1
+
+
+def parse_css(css, i=0):
+    """
+    Parse a stylesheet into a list of `(prelude, body)` rules, returning the rules and the index after them.
+    `body` is a declaration string for style rules and @font-face, a list of rules for nested at-rules, and None for
+    statements like `@charset`.
+    """
+    rules = []
+    start = i
+    while i < len(css):
+        char = css[i]
+        if char in '"\'':
+            i = skip_string(css, i)
+        elif char == ';' and css[start:i].lstrip().startswith('@'):
+            rules.append((css[start:i].strip(), None))
+            i += 1
+            start = i
+        elif char == '{':
+            prelude = css[start:i].strip()
+            if prelude.startswith('@') and not prelude.startswith(('@font-face', '@page')):
+                body, i = parse_css(css, i + 1)
+            else:
+                end = i + 1
+                while css[end] != '}':
+                    end = skip_string(css, end) if css[end] in '"\'' else end + 1
+                body, i = css[i + 1:end].strip(), end + 1
+            rules.append((prelude, body))
+            start = i
+        elif char == '}':
+            return rules, i + 1
+        else:
+            i += 1
+    return rules, i
+
+
+def split_selectors(prelude):
+    """Split a selector list on commas which aren't inside brackets or strings."""
+    selectors = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(prelude):
+        char = prelude[i]
+        if char in '"\'':
+            i = skip_string(prelude, i)
+            continue
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+        i += 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def filter_rules(rules, used):
+    critical = []
+    for prelude, body in rules:
+        if prelude.startswith('@'):
+            if prelude.startswith('@font-face'):
+                critical.append((prelude, body))
+            elif prelude.startswith(NESTED_AT_RULES) and prelude != '@media print':
+                body = filter_rules(body, used)
+                if body:
+                    critical.append((prelude, body))
+            # Other at-rules, like @charset and @keyframes, are left to the full stylesheet
+            continue
+
+        selectors = [selector for selector in split_selectors(prelude) if used.matches(selector)]
+        if selectors:
+            critical.append((','.join(selectors), body))
+    return critical
+
+
+def serialize(rules):
+    return ''.join(
+        '{}{{{}}}'.format(prelude, body if isinstance(body, str) else serialize(body))
+        for prelude, body in rules
+    )
+
+
+def extract_critical_css(css, used):
+    """
+    Return the rules from the stylesheet `css` which match a `UsedSelectors`.
+    """
+    rules, _ = parse_css(COMMENT.sub('', css))
+    return serialize(filter_rules(rules, used))
@@ -0,0 +1,124 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from wagtail.images.image_operations import FormatOperation
+from wagtail.images.models import Filter
+from wagtail.images.shortcuts import get_rendition_or_not_found
+
+# The widths each image is rendered at in the srcset of the image, card and promo templates
+SRCSET_WIDTHS = [320, 510, 640, 767, 1019, 1125, 1534]
+SRCSET_FILTER_SPECS = ['width-{}'.format(width) for width in SRCSET_WIDTHS]
+
+# How wide the image, card and promo templates show an image, for the browser to choose a srcset width
+SRCSET_SIZES = '(min-width: 1020px) 320px, (min-width: 768px) 50vw, 100vw'
+
+# The filter spec operation which converts a rendition to another format
+FORMAT_OPERATION = '|format-{}'
+
+# The rendition used as the background of the hero template by browsers which don't support image-set()
+HERO_FILTER_SPEC = 'width-1000'
+
+# The hero background's image-set() for narrow and wide screens, by name: `(media query, [(filter spec, resolution)])`.
+# The media queries are repeated in fixes.css
+HERO_IMAGE_SETS = {
+    'small': ('(max-width: 640px)', [('width-640', '1x'), ('width-1280', '2x')]),
+    'large': ('(min-width: 641px)', [(HERO_FILTER_SPEC, '1x'), ('width-2000', '2x')]),
+}
+HERO_FILTER_SPECS = [
+    filter_spec for media, image_set in HERO_IMAGE_SETS.values() for filter_spec, resolution in image_set
+]
+
+
+def is_supported_format(image_format):
+    """Return True if the installed version of Wagtail's `format` image filter can convert images to `image_format`."""
+    try:
+        FormatOperation('format', image_format)
+    except ValueError:
+        return False
+    return True
+
+
+def get_image_formats():
+    """
+    Return the formats which images are offered in besides their original format, in order of preference.
+    """
+    image_formats = getattr(settings, 'WAGTAILNHSUKFRONTEND_IMAGE_FORMATS', [])
+    unsupported = [image_format for image_format in image_formats if not is_supported_format(image_format)]
+    if unsupported:
+        raise ImproperlyConfigured(
+            "WAGTAILNHSUKFRONTEND_IMAGE_FORMATS contains formats which this version of Wagtail can't convert images "
+            "to: {}".format(', '.join(unsupported))
+        )
+    return image_formats
+
+
+def get_srcset_filter_specs(image_format=None):
+    """Return the srcset filter specs, converting the renditions to `image_format` if it's given."""
+    if image_format is None:
+        return SRCSET_FILTER_SPECS
+    return [spec + FORMAT_OPERATION.format(image_format) for spec in SRCSET_FILTER_SPECS]
+
+
+def get_filter_spec_format(filter_spec):
+    """Return the format a filter spec converts its rendition to, or None if it keeps the original format."""
+    for operation in filter_spec.split('|')[1:]:
+        if operation.startswith('format-'):
+            return operation[len('format-'):]
+    return None
+
+
+def prefetch_renditions(images_and_filter_specs):
+    """
+    Fetch the existing renditions for a list of `(image, filter_specs)` pairs with one query per rendition model,
+    and keep them on the image instances for `get_rendition` to use.
+    """
+    wanted = defaultdict(list)
+    for image, filter_specs in images_and_filter_specs:
+        prefetched = getattr(image, '_prefetched_renditions', {})
+        missing_filter_specs = [spec for spec in filter_specs if spec not in prefetched]
+        if missing_filter_specs:
+            wanted[image.get_rendition_model()].append((image, missing_filter_specs))
+
+    for rendition_model, images in wanted.items():
+        renditions = rendition_model.objects.filter(
+            image_id__in={image.pk for image, filter_specs in images},
+            filter_spec__in={spec for image, filter_specs in images for spec in filter_specs},
+        )
+        renditions_by_key = {
+            (rendition.image_id, rendition.filter_spec, rendition.focal_point_key): rendition
+            for rendition in renditions
+        }
+
+        for image, filter_specs in images:
+            prefetched = getattr(image, '_prefetched_renditions', {})
+            for spec in filter_specs:
+                rendition = renditions_by_key.get((image.pk, spec, Filter(spec=spec).get_cache_key(image)))
+                if rendition:
+                    rendition.image = image
+                    prefetched[spec] = rendition
+            image._prefetched_renditions = prefetched
+
+
+def get_rendition(image, filter_spec):
+    """
+    Return a rendition of `image`, using a prefetched rendition if there is one.
+    """
+    try:
+        return image._prefetched_renditions[filter_spec]
+    except (AttributeError, KeyError):
+        rendition = get_rendition_or_not_found(image, filter_spec)
+        image._prefetched_renditions = {**getattr(image, '_prefetched_renditions', {}), filter_spec: rendition}
+        return rendition
+
+
+def get_hero_image_sets(image):
+    """
+    Return a dict of the hero image-set() names to `(media query, [(rendition, resolution)])`, fetching the
+    renditions in one query.
+    """
+    prefetch_renditions([(image, HERO_FILTER_SPECS)])
+    return {
+        name: (media, [(get_rendition(image, filter_spec), resolution) for filter_spec, resolution in image_set])
+        for name, (media, image_set) in HERO_IMAGE_SETS.items()
+    }
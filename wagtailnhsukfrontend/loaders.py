@@ -0,0 +1,136 @@
+"""
+A template loader which collapses the whitespace in the wagtailnhsukfrontend templates as they are loaded.
+
+The templates are indented for reading, and that indentation is repeated in the HTML for every block on a page.
+Collapsing it must not change how a page looks, so the rules are conservative:
+
+- Every run of whitespace in the template text becomes a single newline or space. Browsers treat both the same
+  outside of preformatted text.
+- The whitespace after a tag which outputs nothing, like `{% load %}`, `{% if %}` or `{% endfor %}`, is removed when
+  the output before the tag always ends with whitespace. Words either side of an `{% if %}` are never joined.
+- `<pre>`, `<textarea>`, `<script>` and `<style>` elements and `{% verbatim %}` are left alone, and so is everything
+  output by variables and tags.
+"""
+import re
+
+from django.template.base import tag_re
+from django.template.loaders import app_directories
+
+PREFIX = 'wagtailnhsukfrontend/'
+
+PRESERVED = re.compile(
+    r'<(pre|textarea|script|style)\b.*?</\1\s*>|{%\s*verbatim\s*%}.*?{%\s*endverbatim\s*%}',
+    re.DOTALL | re.IGNORECASE,
+)
+WHITESPACE = re.compile(r'\s+')
+
+# Tags which output nothing themselves, by the tag that opens them and the tags which continue or close them
+STRUCTURES = {
+    'if': ({'elif', 'else'}, 'endif'),
+    'for': ({'empty'}, 'endfor'),
+    'with': (set(), 'endwith'),
+}
+CONTINUING_TAGS = {tag for middle, closing in STRUCTURES.values() for tag in middle | {closing}}
+SILENT_TAGS = {'load'}
+# `{% cycle ... as name %}` outputs the first value as well as storing it
+ASSIGNMENT = re.compile(r'\sas\s+\w+$')
+
+
+class Token:
+    def __init__(self, source, raw=False):
+        self.source = source
+        self.raw = raw
+        self.tag = None
+        if not raw and source.startswith('{%'):
+            contents = source[2:-2].split()
+            self.tag = contents[0] if contents else ''
+        self.follows_whitespace = False
+        self.trim_after = False
+
+    @property
+    def is_text(self):
+        return not self.raw and not self.source.startswith(('{%', '{{', '{#'))
+
+    @property
+    def is_silent(self):
+        if self.source.startswith('{#'):
+            return True
+        if self.tag in SILENT_TAGS:
+            return True
+        return self.tag not in (None, 'cycle') and ASSIGNMENT.search(self.source[2:-2].strip()) is not None
+
+
+def tokenize(source):
+    tokens = []
+    position = 0
+    for match in PRESERVED.finditer(source):
+        tokens.extend(Token(part) for part in tag_re.split(source[position:match.start()]) if part)
+        tokens.append(Token(match.group(), raw=True))
+        position = match.end()
+    tokens.extend(Token(part) for part in tag_re.split(source[position:]) if part)
+    return tokens
+
+
+def find_structures(tokens):
+    """
+    Return a list of the tokens that make up each `{% if %}`, `{% for %}` and `{% with %}`, or None if they don't
+    nest properly outside of the preserved elements.
+    """
+    structures = []
+    stack = []
+    for token in tokens:
+        if token.tag in STRUCTURES:
+            stack.append([token])
+        elif token.tag in CONTINUING_TAGS:
+            if not stack:
+                return None
+            opening = stack[-1][0].tag
+            middle, closing = STRUCTURES[opening]
+            if token.tag not in middle and token.tag != closing:
+                return None
+            stack[-1].append(token)
+            if token.tag == closing:
+                structures.append(stack.pop())
+    return None if stack else structures
+
+
+def collapse_whitespace(source):
+    """Return `source` with its whitespace collapsed, following the rules above."""
+    tokens = tokenize(source)
+    for previous, token in zip(tokens, tokens[1:]):
+        token.follows_whitespace = previous.is_text and previous.source[-1].isspace()
+
+    structures = find_structures(tokens)
+    if structures is not None:
+        for structure in structures:
+            if all(token.follows_whitespace for token in structure):
+                for token in structure:
+                    token.trim_after = True
+    for token in tokens:
+        if token.is_silent and token.follows_whitespace:
+            token.trim_after = True
+
+    output = []
+    trim = False
+    for token in tokens:
+        source = token.source
+        if token.is_text:
+            if trim:
+                source = source.lstrip()
+            source = WHITESPACE.sub(lambda match: '\n' if '\n' in match.group() else ' ', source)
+        output.append(source)
+        trim = token.trim_after
+    return ''.join(output)
+
+
+class Loader(app_directories.Loader):
+    """
+    Load templates from the installed apps, like django's `app_directories.Loader`, and collapse the whitespace in
+    the wagtailnhsukfrontend templates.
+    """
+
+    def get_contents(self, origin):
+        contents = super().get_contents(origin)
+        if origin.template_name.startswith(PREFIX):
+            return collapse_whitespace(contents)
+        return contents
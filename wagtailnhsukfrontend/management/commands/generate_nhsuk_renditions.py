@@ -0,0 +1,182 @@
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+from PIL import Image as PILImage
+from wagtail.core.fields import StreamField
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter
+
+from wagtailnhsukfrontend.images import FORMAT_OPERATION, HERO_FILTER_SPECS, get_filter_spec_format
+from wagtailnhsukfrontend.mixins import HeroMixin
+from wagtailnhsukfrontend.prefetch import walk_raw_blocks
+
+
+# The errors from an image file which is missing or corrupt, or which Pillow can't read or write in a format.
+# SourceImageIOError and Pillow's UnidentifiedImageError are OSErrors.
+RENDITION_ERRORS = (OSError, ValueError, KeyError, PILImage.DecompressionBombError)
+
+
+def setup_worker():
+    # Worker processes which are spawned rather than forked need django setting up again
+    django.setup()
+
+
+def generate_renditions(image_id, filter_specs):
+    """
+    Generate renditions of one image. Runs in a worker process.
+    Returns the image id and a list of errors.
+    """
+    image_model = get_image_model()
+    try:
+        image = image_model.objects.get(pk=image_id)
+    except image_model.DoesNotExist:
+        return image_id, ['The image has been deleted']
+
+    errors = []
+    for filter_spec in filter_specs:
+        try:
+            image.get_rendition(filter_spec)
+        except RENDITION_ERRORS as e:
+            errors.append('{}: {}'.format(filter_spec, e))
+    return image_id, errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the renditions used by wagtailnhsukfrontend blocks and hero images. "
+        "Renditions which already exist are skipped, so the command can be interrupted and run again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=os.cpu_count(),
+            help="Number of worker processes to generate renditions with. Defaults to the number of CPUs.",
+        )
+        parser.add_argument(
+            '--report',
+            action='store_true',
+            help="Afterwards, compare the total size of the renditions in each format.",
+        )
+
+    def handle(self, *args, **options):
+        wanted = self.find_wanted_renditions()
+        missing = self.find_missing_renditions(wanted)
+
+        if missing:
+            self.generate(missing, options['processes'])
+        else:
+            self.stdout.write("All renditions have already been generated.")
+
+        if options['report']:
+            self.report(wanted)
+
+    def generate(self, missing, processes):
+        total = len(missing)
+        self.stdout.write("Generating renditions for {} images".format(total))
+
+        if processes > 1:
+            results = self.generate_in_pool(missing, processes)
+        else:
+            results = (generate_renditions(image_id, filter_specs) for image_id, filter_specs in missing.items())
+
+        for done, (image_id, errors) in enumerate(results, 1):
+            for error in errors:
+                self.stderr.write("Image {}: {}".format(image_id, error))
+            self.stdout.write("[{}/{}] image {}".format(done, total, image_id))
+
+        self.stdout.write(self.style.SUCCESS("Generated renditions for {} images".format(total)))
+
+    def report(self, wanted):
+        """
+        For each format images are converted to, write the total file size of the renditions in that format and of
+        the same renditions in the original format.
+        """
+        sizes = {}
+        renditions = get_image_model().get_rendition_model().objects.filter(image_id__in=wanted.keys())
+        for rendition in renditions.iterator():
+            if rendition.filter_spec in wanted[rendition.image_id]:
+                try:
+                    sizes[rendition.image_id, rendition.filter_spec] = rendition.file.size
+                except OSError:
+                    pass
+
+        totals = defaultdict(lambda: [0, 0, 0])
+        for (image_id, filter_spec), size in sizes.items():
+            image_format = get_filter_spec_format(filter_spec)
+            original_size = sizes.get((image_id, filter_spec.replace(FORMAT_OPERATION.format(image_format), '')))
+            if image_format and original_size is not None:
+                totals[image_format][0] += 1
+                totals[image_format][1] += original_size
+                totals[image_format][2] += size
+
+        if not totals:
+            self.stdout.write("No renditions have been converted to another format.")
+            return
+        self.stdout.write('{:<8} {:>10} {:>14} {:>14} {:>8}'.format('format', 'renditions', 'original bytes', 'bytes', 'change'))
+        for image_format, (count, original_size, size) in sorted(totals.items()):
+            self.stdout.write('{:<8} {:>10} {:>14} {:>14} {:>+7.1f}%'.format(
+                image_format, count, original_size, size, (size / original_size - 1) * 100 if original_size else 0,
+            ))
+
+    def generate_in_pool(self, missing, processes):
+        # Connections can't be shared with forked processes, so each worker opens its own
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=processes, initializer=setup_worker) as executor:
+            futures = [
+                executor.submit(generate_renditions, image_id, filter_specs)
+                for image_id, filter_specs in missing.items()
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def find_wanted_renditions(self):
+        """
+        Return a dict of image id to the set of filter specs that are used for it.
+        """
+        wanted = defaultdict(set)
+
+        for model in apps.get_models():
+            if issubclass(model, HeroMixin):
+                for image_id in model.objects.filter(hero_image__isnull=False).values_list('hero_image_id', flat=True):
+                    wanted[image_id].update(HERO_FILTER_SPECS)
+
+            for field in model._meta.get_fields():
+                if not isinstance(field, StreamField) or field.model is not model:
+                    continue
+                for value in model.objects.values_list(field.attname, flat=True).iterator():
+                    # Walk the raw JSON, so the images, pages and snippets chosen in the blocks aren't loaded
+                    for block, raw_value in walk_raw_blocks(field.stream_block, value.get_prep_value()):
+                        if raw_value is not None and hasattr(block, 'get_raw_prefetch_renditions'):
+                            for image_id, filter_specs in block.get_raw_prefetch_renditions(raw_value):
+                                wanted[image_id].update(filter_specs)
+
+        return wanted
+
+    def find_missing_renditions(self, wanted):
+        """
+        Return a dict of image id to a sorted list of the filter specs which haven't been generated yet.
+        """
+        image_model = get_image_model()
+        images = image_model.objects.in_bulk(wanted.keys())
+        existing = set(
+            image_model.get_rendition_model().objects.filter(
+                image_id__in=images.keys(),
+            ).values_list('image_id', 'filter_spec', 'focal_point_key')
+        )
+
+        missing = {}
+        for image_id, image in images.items():
+            filter_specs = sorted(
+                spec for spec in wanted[image_id]
+                if (image_id, spec, Filter(spec=spec).get_cache_key(image)) not in existing
+            )
+            if filter_specs:
+                missing[image_id] = filter_specs
+        return missing
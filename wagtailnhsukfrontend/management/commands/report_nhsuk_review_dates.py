@@ -0,0 +1,47 @@
+import csv
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from wagtailnhsukfrontend.review_dates import DEFAULT_DUE_WITHIN, get_review_dates_report, is_overdue
+
+HEADINGS = ['Status', 'Next review', 'Last review', 'Type', 'Title', 'URL path', 'ID']
+
+
+class Command(BaseCommand):
+    help = (
+        "List the live pages using ReviewDateMixin which are overdue for review or due soon, as CSV, most overdue "
+        "first. Rows are streamed from the database, so the report can be as large as the site."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=DEFAULT_DUE_WITHIN.days,
+            help="Include pages due for review within this many days. Defaults to {}.".format(DEFAULT_DUE_WITHIN.days),
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help="Number of rows to fetch from the database at a time.",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        report = get_review_dates_report(timedelta(days=options['days']), now=now)
+
+        writer = csv.writer(self.stdout, lineterminator='\n')
+        writer.writerow(HEADINGS)
+        for row in report.iterator(chunk_size=options['chunk_size']):
+            writer.writerow([
+                'Overdue' if is_overdue(row['next_review_date'], now) else 'Due',
+                row['next_review_date'].isoformat(),
+                row['last_review_date'].isoformat() if row['last_review_date'] else '',
+                row['page_type'],
+                row['title'],
+                row['url_path'],
+                row['id'],
+            ])
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from wagtailnhsukfrontend.warmup import uses_cached_loader, warm_up
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the wagtailnhsukfrontend templates and block definitions, and report how long each step took. "
+        "With --prime-settings, also fill the shared header, footer and site caches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prime-settings',
+            action='store_true',
+            help="Prime the header, footer and site caches. These are shared between processes by a shared cache backend.",
+        )
+
+    def handle(self, *args, **options):
+        if not uses_cached_loader():
+            self.stderr.write(
+                "Templates aren't cached by any template engine (is DEBUG on?), so only the timings are useful."
+            )
+
+        timings = warm_up(prime_settings=options['prime_settings'])
+        for name, seconds in timings.items():
+            self.stdout.write('{:<10} {:>8.1f}ms'.format(name, seconds * 1e3))
+        self.stdout.write('{:<10} {:>8.1f}ms'.format('total', sum(timings.values()) * 1e3))
@@ -0,0 +1,118 @@
+import asyncio
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.asgi import ASGIRequest
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from wagtail.core.models import Page
+
+from wagtailnhsukfrontend.preload import add_link_header, get_asset_preload_links
+from wagtailnhsukfrontend.streaming import StreamingTemplateResponse, stream_sessions, uses_csrf_token
+from wagtailnhsukfrontend.tag_contexts import TAG_CONTEXTS, load_tag_contexts
+
+
+def is_page_response(response):
+    return response.status_code == 200 and isinstance((response.context_data or {}).get('page'), Page)
+
+
+class PreloadMiddleware:
+    """
+    Add `Link` headers which preload the NHS.UK frontend CSS and JS to Wagtail page responses.
+
+    The headers are added before the page's template is rendered, so a streamed response sends them before any of
+    the page, and a CDN or proxy which supports 103 Early Hints can send them on while the page is being built.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_template_response(self, request, response):
+        if is_page_response(response):
+            add_link_header(response, get_asset_preload_links(), first=True)
+        return response
+
+
+class StreamingPageMiddleware(MiddlewareMixin):
+    """
+    Stream Wagtail page responses, so that the <head> and header are sent before the page's StreamField blocks are
+    rendered. See `wagtailnhsukfrontend.streaming`.
+
+    Under ASGI, django iterates a streaming response in the event loop, where the template can't query the database,
+    so the middleware is only used under WSGI.
+    """
+
+    def __init__(self, get_response):
+        if asyncio.iscoroutinefunction(get_response):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def process_template_response(self, request, response):
+        # Post-render callbacks expect the rendered content, which a streaming response doesn't have
+        if getattr(response, '_post_render_callbacks', None):
+            return response
+        # Sync middleware further in can still be handed an ASGI request
+        if isinstance(request, ASGIRequest):
+            return response
+        if is_page_response(response) and not isinstance(response, StreamingTemplateResponse):
+            if self.can_stream(request, response):
+                if stream_sessions():
+                    self.prepare_request(request, response)
+                return StreamingTemplateResponse.from_template_response(response)
+        return response
+
+    def can_stream(self, request, response):
+        """
+        Return True if a page can be streamed. The template is rendered after every middleware's `process_response`,
+        so by default only pages which don't need a session or a CSRF cookie are streamed: anonymous visitors without a
+        session, and templates which don't output `{% csrf_token %}`.
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        # Messages shown while streaming would be rendered after the message middleware has stored them as unread
+        messages = getattr(request, '_messages', None)
+        if messages is not None and len(messages):
+            return False
+        if stream_sessions():
+            return True
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            return False
+        return not uses_csrf_token(response.resolve_template(response.template_name))
+
+    def prepare_request(self, request, response):
+        """
+        With WAGTAILNHSUKFRONTEND_STREAM_SESSIONS, use whatever the template might before the other middleware's
+        `process_response` runs: the user and session, which make the response vary on the session cookie, and the
+        CSRF token, which sets the CSRF cookie.
+        """
+        user = getattr(request, 'user', None)
+        if user is not None:
+            user.is_authenticated
+        session = getattr(request, 'session', None)
+        if session is not None:
+            session.accessed = True
+            patch_vary_headers(response, ['Cookie'])
+        get_token(request)
+
+
+class TagContextMiddleware(MiddlewareMixin):
+    """
+    Load the contexts of the header, footer and navigation tags for Wagtail page responses concurrently, before the
+    page's template is rendered. See `wagtailnhsukfrontend.tag_contexts`.
+
+    The contexts are loaded while the request is handled asynchronously, so the middleware is only used under ASGI.
+    """
+
+    def __init__(self, get_response):
+        if not asyncio.iscoroutinefunction(get_response):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    async def process_template_response(self, request, response):
+        if is_page_response(response) and TAG_CONTEXTS not in response.context_data:
+            response.context_data[TAG_CONTEXTS] = await load_tag_contexts(request, response.context_data['page'])
+        return response
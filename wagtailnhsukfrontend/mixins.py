@@ -4,11 +4,14 @@ from wagtail.images.models import Image
 from wagtail.images.edit_handlers import ImageChooserPanel
 from django.core.exceptions import ValidationError
 
+from wagtailnhsukfrontend.images import get_hero_image_sets
+from wagtailnhsukfrontend.preload import add_link_header, format_preload_link
+
 
 class ReviewDateMixin(models.Model):
 
-    last_review_date = models.DateTimeField(blank=True, null=True)
-    next_review_date = models.DateTimeField(blank=True, null=True)
+    last_review_date = models.DateTimeField(blank=True, null=True, db_index=True)
+    next_review_date = models.DateTimeField(blank=True, null=True, db_index=True)
 
     last_review_label = 'Page last reviewed:'
     next_review_label = 'Next review due:'
@@ -52,5 +55,29 @@ class HeroMixin(models.Model):
         else:
             pass
 
+    def get_hero_preloads(self):
+        """
+        Return `(href, imagesrcset, media)` for each of the hero image's image-sets, to preload the hero image with.
+        """
+        if not self.hero_image:
+            return []
+        return [
+            (
+                image_set[0][0].url,
+                ', '.join('{} {}'.format(rendition.url, resolution) for rendition, resolution in image_set),
+                media,
+            )
+            for media, image_set in get_hero_image_sets(self.hero_image).values()
+        ]
+
+    def serve(self, request, *args, **kwargs):
+        # Browsers can't find a CSS background image until the stylesheet has loaded, so say which one to preload
+        response = super().serve(request, *args, **kwargs)
+        add_link_header(response, (
+            format_preload_link(href, 'image', imagesrcset=imagesrcset, media=media)
+            for href, imagesrcset, media in self.get_hero_preloads()
+        ))
+        return response
+
     class Meta:
         abstract = True
@@ -0,0 +1,74 @@
+from wagtailnhsukfrontend import page_tree
+from wagtailnhsukfrontend.page_urls import get_page_urls
+
+
+def get_breadcrumb_context(page, site=None):
+    """
+    Return the breadcrumb template context for a page: its ancestors, limited to pages under the site root.
+    """
+    breadcrumb_pages = None
+    if page_tree.is_enabled():
+        breadcrumb_pages = page_tree.get_page_tree().get_breadcrumb_pages(page)
+
+    if breadcrumb_pages is None:
+        site = site or page.get_site()
+        # Get pages which are an ancestor of the current page, but limited to pages under the site root (a.k.a the homepage)
+        breadcrumb_pages = page.get_ancestors(inclusive=False).descendant_of(site.root_page, inclusive=True).order_by("depth")
+
+    return {
+        'breadcrumb_pages': list(breadcrumb_pages),
+    }
+
+
+def get_pagination_context(page, request):
+    """
+    Return the pagination template context for a page: the labels and URLs of its previous and next live siblings.
+    """
+    siblings = None
+    if page_tree.is_enabled():
+        siblings = page_tree.get_page_tree().get_prev_next_siblings(page)
+
+    if siblings is None:
+        prev = page.get_prev_siblings().live().first()
+        next = page.get_next_siblings().live().first()
+    else:
+        prev, next = siblings
+
+    template_context = {}
+    urls = get_page_urls([sibling for sibling in [prev, next] if sibling], request)
+
+    if prev:
+        template_context['prev_label'] = prev.title
+        template_context['prev_url'] = urls[prev.pk]
+    if next:
+        template_context['next_label'] = next.title
+        template_context['next_url'] = urls[next.pk]
+
+    return template_context
+
+
+def get_contents_list_context(page, request):
+    """
+    Return the contents list template context for a page: links to its live siblings, including itself.
+    """
+    sibling_pages = None
+    if page_tree.is_enabled():
+        sibling_pages = page_tree.get_page_tree().get_live_siblings(page)
+
+    if sibling_pages is None:
+        sibling_pages = page.get_siblings().live()
+
+    sibling_pages = list(sibling_pages)
+    urls = get_page_urls(sibling_pages, request)
+    links = [
+        {
+            'label': sibling.title,
+            'href': urls[sibling.pk],
+            'is_current': sibling.id == page.id,
+        }
+        for sibling in sibling_pages
+    ]
+
+    return {
+        'links': links,
+    }
@@ -0,0 +1,136 @@
+from django.conf import settings
+from wagtail.core.models import Page, Site
+
+from wagtailnhsukfrontend.cache import get_generation
+
+PAGE_TREE_CACHE = 'page-tree'
+
+# Page fields held in the index. Saving a page without changing any of these doesn't invalidate it.
+INDEXED_FIELDS = ['id', 'path', 'depth', 'title', 'url_path', 'live']
+
+_page_tree = None
+
+
+def is_enabled():
+    return getattr(settings, 'WAGTAILNHSUKFRONTEND_PAGE_TREE_INDEX', False)
+
+
+class PageTreeNode:
+
+    __slots__ = INDEXED_FIELDS + ['parent', 'children']
+
+    def __init__(self, id, path, depth, title, url_path, live):
+        self.id = id
+        self.path = path
+        self.depth = depth
+        self.title = title
+        self.url_path = url_path
+        self.live = live
+        self.parent = None
+        self.children = []
+
+    def get_page(self):
+        """
+        Return an unsaved-looking Page instance for this node, with enough fields to compare it with other pages and
+        to generate its URL.
+        A new instance is returned each time, because wagtail caches site information on page instances.
+        """
+        return Page(
+            id=self.id,
+            path=self.path,
+            depth=self.depth,
+            title=self.title,
+            url_path=self.url_path,
+            live=self.live,
+        )
+
+
+class PageTree:
+    """
+    An in-memory index of the page tree, holding just enough to answer the navigation templatetags.
+    """
+
+    def __init__(self, rows, generation=None):
+        self.generation = generation
+        self.nodes = {}
+        self.roots = []
+
+        nodes_by_path = {}
+        # Rows are ordered by path, so parents are always seen before their children,
+        # and children are appended in tree order.
+        for row in rows:
+            node = PageTreeNode(*row)
+            self.nodes[node.id] = node
+            nodes_by_path[node.path] = node
+            node.parent = nodes_by_path.get(node.path[:-Page.steplen])
+            if node.parent:
+                node.parent.children.append(node)
+            else:
+                self.roots.append(node)
+
+    @classmethod
+    def load(cls, generation=None):
+        return cls(Page.objects.order_by('path').values_list(*INDEXED_FIELDS), generation)
+
+    def get_siblings(self, page):
+        """Return the nodes sharing a parent with `page` (including its own), or None if the page isn't indexed."""
+        node = self.nodes.get(page.id)
+        if node is None:
+            return None
+        return node.parent.children if node.parent else self.roots
+
+    def get_breadcrumb_pages(self, page):
+        """
+        Return the ancestors of `page` up to and including its site root, or None if the page isn't indexed.
+        """
+        node = self.nodes.get(page.id)
+        if node is None:
+            return None
+
+        root_paths = [
+            root_path.root_path for root_path in Site.get_site_root_paths()
+            if node.url_path.startswith(root_path.root_path)
+        ]
+        if not root_paths:
+            return None
+
+        ancestors = []
+        node = node.parent
+        while node is not None and node.url_path.startswith(root_paths[0]):
+            ancestors.append(node.get_page())
+            node = node.parent
+        return ancestors[::-1]
+
+    def get_live_siblings(self, page):
+        siblings = self.get_siblings(page)
+        if siblings is None:
+            return None
+        return [sibling.get_page() for sibling in siblings if sibling.live]
+
+    def get_prev_next_siblings(self, page):
+        """
+        Return the closest live siblings before and after `page`, or None if the page isn't indexed.
+        """
+        siblings = self.get_siblings(page)
+        if siblings is None:
+            return None
+
+        position = next(i for i, sibling in enumerate(siblings) if sibling.id == page.id)
+        prev = next((sibling for sibling in reversed(siblings[:position]) if sibling.live), None)
+        next_ = next((sibling for sibling in siblings[position + 1:] if sibling.live), None)
+
+        return (
+            prev.get_page() if prev else None,
+            next_.get_page() if next_ else None,
+        )
+
+
+def get_page_tree():
+    """
+    Return the page tree index for this process, reloading it if any process has invalidated it since it was loaded.
+    """
+    global _page_tree
+    generation = get_generation(PAGE_TREE_CACHE)
+    if _page_tree is None or _page_tree.generation != generation:
+        _page_tree = PageTree.load(generation)
+    return _page_tree
@@ -0,0 +1,37 @@
+from wagtail.core.models import Site
+
+from wagtailnhsukfrontend.cache import get_cache, get_generation, get_timeout, make_key
+
+PAGE_URL_CACHE = 'page-url'
+
+
+def get_page_urls(pages, request=None):
+    """
+    Return a dict of page id to URL for `pages`, as `page.get_url(request)` would return them.
+    URLs are cached per page and per site, so a request on one site gets the relative URLs for that site.
+    """
+    site = Site.find_for_request(request)
+    generation = get_generation(PAGE_URL_CACHE)
+    pages_by_key = {
+        make_key(PAGE_URL_CACHE, generation, site.pk if site else None, page.pk): page
+        for page in pages
+    }
+
+    cache = get_cache()
+    cached_urls = cache.get_many(pages_by_key.keys())
+    missing_urls = {
+        key: page.get_url(request)
+        for key, page in pages_by_key.items()
+        if key not in cached_urls
+    }
+    if missing_urls:
+        cache.set_many(missing_urls, get_timeout())
+
+    return {
+        page.pk: cached_urls[key] if key in cached_urls else missing_urls[key]
+        for key, page in pages_by_key.items()
+    }
+
+
+def get_page_url(page, request=None):
+    return get_page_urls([page], request)[page.pk]
@@ -0,0 +1,131 @@
+from collections import defaultdict
+from contextvars import ContextVar
+
+from wagtail.core.blocks import ListBlock, StreamBlock, StreamValue, StructBlock
+
+from wagtailnhsukfrontend import images
+
+# The objects loaded by `prefetch_chosen_objects`, by model and pk, while it converts a StreamField value
+_prefetched_objects = ContextVar('prefetched_objects', default=None)
+
+
+def walk_blocks(block, value):
+    """
+    Yield `(block, value)` for a block value and every block value nested inside it.
+    """
+    yield block, value
+
+    if value is None:
+        return
+    if isinstance(block, StreamBlock):
+        for child in value:
+            yield from walk_blocks(child.block, child.value)
+    elif isinstance(block, StructBlock):
+        for name, child_block in block.child_blocks.items():
+            yield from walk_blocks(child_block, value.get(name))
+    elif isinstance(block, ListBlock):
+        for child_value in value:
+            yield from walk_blocks(block.child_block, child_value)
+
+
+def walk_raw_blocks(block, raw_value):
+    """
+    Yield `(block, raw_value)` for a block's raw JSON value, as stored in the database, and every raw value nested
+    inside it.
+    """
+    yield block, raw_value
+
+    if raw_value is None:
+        return
+    if isinstance(block, StreamBlock):
+        for raw_child in raw_value:
+            child_block = block.child_blocks.get(raw_child['type'])
+            if child_block is not None:
+                yield from walk_raw_blocks(child_block, raw_child.get('value'))
+    elif isinstance(block, StructBlock):
+        for name, child_block in block.child_blocks.items():
+            if name in raw_value:
+                yield from walk_raw_blocks(child_block, raw_value[name])
+    elif isinstance(block, ListBlock):
+        for raw_child in raw_value:
+            yield from walk_raw_blocks(block.child_block, raw_child)
+
+
+class PrefetchChooserBlock:
+    """
+    ChooserBlock mixin for blocks whose chosen objects are loaded in bulk by `prefetch_chosen_objects`.
+    Outside of it, objects are loaded as usual.
+    """
+
+    def get_prefetched_objects(self):
+        prefetched_objects = _prefetched_objects.get()
+        if prefetched_objects is None:
+            return None
+        return prefetched_objects.get(self.target_model)
+
+    def to_python(self, value):
+        objects = self.get_prefetched_objects()
+        if objects is None or value is None:
+            return super().to_python(value)
+        return objects.get(value)
+
+    def bulk_to_python(self, values):
+        objects = self.get_prefetched_objects()
+        if objects is None:
+            return super().bulk_to_python(values)
+        return [objects.get(value) for value in values]
+
+
+def prefetch_chosen_objects(value):
+    """
+    Load the objects chosen in every `PrefetchChooserBlock` in a StreamField value, at any depth, with one query per
+    model, and convert the value's blocks using them.
+
+    `value` is a StreamField value which hasn't been rendered yet, such as `page.body`. Its blocks are converted from
+    JSON as they are first used, so any which already have been are skipped.
+    """
+    if not isinstance(value, StreamValue) or not value.is_lazy:
+        return
+
+    ids = defaultdict(set)
+    for raw_child, bound_block in zip(value._raw_data, value._bound_blocks):
+        child_block = value.stream_block.child_blocks.get(raw_child['type'])
+        if bound_block is not None or child_block is None:
+            continue
+        for block, raw_value in walk_raw_blocks(child_block, raw_child.get('value')):
+            if isinstance(block, PrefetchChooserBlock) and raw_value is not None:
+                ids[block.target_model].add(raw_value)
+    if not ids:
+        return
+
+    token = _prefetched_objects.set({
+        model: model.objects.in_bulk(model_ids)
+        for model, model_ids in ids.items()
+    })
+    try:
+        # Getting each child converts it, and the others of its type
+        for child in value:
+            pass
+    finally:
+        _prefetched_objects.reset(token)
+
+
+def prefetch_renditions(value, block=None):
+    """
+    Fetch every image rendition that the NHS.UK block templates will need to render `value` in one query.
+
+    `value` is usually a StreamField value, such as `page.body`. Any other block value needs its `block`.
+    Blocks say which renditions they need with a `get_prefetch_renditions(value)` method.
+
+    The objects chosen in a StreamField value's blocks are loaded first, with `prefetch_chosen_objects`.
+    """
+    if block is None:
+        block = value.stream_block
+        prefetch_chosen_objects(value)
+
+    images.prefetch_renditions(
+        image_and_filter_specs
+        for child_block, child_value in walk_blocks(block, value)
+        if child_value is not None and hasattr(child_block, 'get_prefetch_renditions')
+        for image_and_filter_specs in child_block.get_prefetch_renditions(child_value)
+    )
@@ -0,0 +1,44 @@
+"""
+`Link` headers which tell browsers, and CDNs which send them on as 103 Early Hints, what a page will need.
+"""
+from django.conf import settings
+from django.templatetags.static import static
+
+from wagtailnhsukfrontend.assets import get_manifest
+
+# The static files every page needs, relative to the wagtailnhsukfrontend static directory, and what they are loaded as
+PRELOAD_ASSETS = [
+    ('css/wagtail-nhsuk-frontend.min.css', 'style'),
+    ('js/wagtail-nhsuk-frontend.min.js', 'script'),
+]
+
+
+def format_preload_link(url, as_, **params):
+    """
+    Return a `Link` header value which preloads `url`, e.g. `</style.css>; rel=preload; as=style`.
+    `params` are added as quoted parameters, e.g. `media="(max-width: 640px)"`.
+    """
+    parts = ['<{}>'.format(url), 'rel=preload', 'as={}'.format(as_)]
+    parts.extend('{}="{}"'.format(name, value) for name, value in params.items())
+    return '; '.join(parts)
+
+
+def add_link_header(response, links, first=False):
+    """Add `links` to the response's `Link` header, before any links already in it if `first` is set."""
+    links = list(links)
+    if response.has_header('Link'):
+        links = links + [response['Link']] if first else [response['Link']] + links
+    if links:
+        response['Link'] = ', '.join(links)
+
+
+def get_asset_preload_links():
+    """
+    Return a `Link` header value for each of the `WAGTAILNHSUKFRONTEND_PRELOAD_ASSETS`, which defaults to the NHS.UK
+    frontend CSS and JS, using their content-hashed names if the assets have been built.
+    """
+    assets = getattr(settings, 'WAGTAILNHSUKFRONTEND_PRELOAD_ASSETS', PRELOAD_ASSETS)
+    return [
+        format_preload_link(static('wagtailnhsukfrontend/' + get_manifest().get(path, path)), as_)
+        for path, as_ in assets
+    ]
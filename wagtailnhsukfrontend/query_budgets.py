@@ -0,0 +1,29 @@
+"""
+The maximum number of SQL queries each component may make to render, with an empty cache and default settings.
+
+Budgets are declared next to the components: templatetags use the `query_budget` decorator, and blocks set
+`query_budget` on their Meta. `tests/test_query_budgets.py` renders each component and fails if it goes over budget,
+so that an N+1 query can't slip in unnoticed. A budget should only be raised along with an explanation of where the
+new queries come from.
+"""
+from wagtail.core.blocks import Block
+
+
+def query_budget(queries):
+    """
+    Declare the query budget for a templatetag function.
+    Apply it below the `register` decorator, which returns the function unchanged.
+    """
+    def decorator(func):
+        func.query_budget = queries
+        return func
+    return decorator
+
+
+def get_query_budget(component):
+    """
+    Return the query budget for a templatetag function or a block instance, or None if it doesn't have one.
+    """
+    if isinstance(component, Block):
+        return getattr(component.meta, 'query_budget', None)
+    return getattr(component, 'query_budget', None)
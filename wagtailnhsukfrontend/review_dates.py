@@ -0,0 +1,63 @@
+"""
+Find pages which are overdue for review, or due soon, across every page model using `ReviewDateMixin`.
+
+Each page model has its own table, so the report queries each one with its `next_review_date` index and combines
+them with `UNION ALL`, ordered by the database. Rows are values rather than model instances, and can be iterated
+without caching them, so a report of any size is listed a page at a time or streamed in constant memory.
+"""
+from datetime import timedelta
+
+from django.apps import apps
+from django.db.models import CharField, Value
+from django.utils import timezone
+from wagtail.core.models import Page
+
+from wagtailnhsukfrontend.mixins import ReviewDateMixin
+
+DEFAULT_DUE_WITHIN = timedelta(days=30)
+
+REPORT_FIELDS = ['id', 'title', 'url_path', 'last_review_date', 'next_review_date']
+
+
+def get_review_date_models():
+    """
+    Return the registry of page models which use `ReviewDateMixin`, from the installed apps.
+    Proxy models, and models inheriting from another listed model, are left out, as their pages are in the table of
+    the model they extend.
+    """
+    models = [
+        model for model in apps.get_models()
+        if issubclass(model, ReviewDateMixin) and issubclass(model, Page) and not model._meta.proxy
+    ]
+    return [
+        model for model in models
+        if not any(parent in models for parent in model._meta.get_parent_list())
+    ]
+
+
+def is_overdue(next_review_date, now=None):
+    return next_review_date < (now or timezone.now())
+
+
+def get_review_dates_report(due_within=DEFAULT_DUE_WITHIN, pages=None, now=None):
+    """
+    Return a queryset of the live pages due for review within `due_within` of now, including overdue pages, as
+    dicts of `REPORT_FIELDS` and the page's `page_type`. The most overdue pages come first.
+    `pages` is an optional queryset of pages to limit the report to.
+    """
+    cutoff = (now or timezone.now()) + due_within
+    querysets = []
+    for model in get_review_date_models():
+        queryset = model.objects.live().filter(next_review_date__lte=cutoff)
+        if pages is not None:
+            queryset = queryset.filter(pk__in=pages.values('pk'))
+        querysets.append(
+            queryset.annotate(
+                page_type=Value(str(model._meta.verbose_name), output_field=CharField()),
+            ).values(*REPORT_FIELDS, 'page_type').order_by()
+        )
+
+    if not querysets:
+        return Page.objects.none().values(*REPORT_FIELDS)
+
+    return querysets[0].union(*querysets[1:], all=True).order_by('next_review_date', 'id')
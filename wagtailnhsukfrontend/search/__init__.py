@@ -0,0 +1 @@
+default_app_config = 'wagtailnhsukfrontend.search.apps.SearchAppConfig'
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class SearchAppConfig(AppConfig):
+    name = 'wagtailnhsukfrontend.search'
+    label = 'wagtailnhsukfrontendsearch'
+    verbose_name = "Wagtail NHSUK Frontend Search"
+
+    def ready(self):
+        from wagtailnhsukfrontend.search.signal_handlers import register_signal_handlers
+        register_signal_handlers()
@@ -0,0 +1,303 @@
+"""
+A full-text search index of the live pages, kept in two tables so that searching doesn't need an external service.
+
+Text is extracted from the raw JSON of each of a page's StreamFields, so the text of every NHS.UK block is indexed
+however deeply it is nested, without loading any chosen pages or images. Each term is stored with the pages it
+appears in and a weight, and a search finds the pages containing every term of the query through the term index,
+starting from the rarest term.
+
+Pages are indexed when they are published, and removed when they are unpublished or deleted. A page and its
+descendants are updated when it's moved, or its view restrictions change, so private pages are never searchable.
+"""
+from collections import Counter
+import html
+import math
+import re
+
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, Sum, Value, When
+from django.utils.text import Truncator
+from wagtail.core.blocks import CharBlock, RichTextBlock, StreamValue, TextBlock
+from wagtail.core.fields import StreamField
+from wagtail.core.models import Page, PageViewRestriction
+from wagtail.search.index import SearchField
+
+from wagtailnhsukfrontend.cache import get_cache, get_generation, get_timeout, make_key
+from wagtailnhsukfrontend.page_tree import PAGE_TREE_CACHE
+from wagtailnhsukfrontend.prefetch import walk_raw_blocks
+from wagtailnhsukfrontend.search.models import IndexedPage, IndexEntry
+
+TERM_RE = re.compile(r'\w+')
+TAG_RE = re.compile(r'<[^>]*>')
+
+MAX_TERM_LENGTH = IndexEntry._meta.get_field('term').max_length
+
+# Common words which would match almost every page, and so aren't indexed
+STOP_WORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'if', 'in', 'into', 'is', 'it', 'its',
+    'no', 'not', 'of', 'on', 'or', 'so', 'such', 'that', 'the', 'their', 'then', 'there', 'these', 'they', 'this',
+    'to', 'was', 'will', 'with', 'you', 'your',
+])
+
+# Weights of the text which isn't given one by a page's `search_fields`
+DESCRIPTION_WEIGHT = 2
+BODY_WEIGHT = 1
+
+SUMMARY_WORDS = 40
+
+BATCH_SIZE = 500
+
+
+def tokenize(text):
+    """Return the terms in `text`, in order, without stop words."""
+    return [
+        term[:MAX_TERM_LENGTH]
+        for term in TERM_RE.findall(text.casefold())
+        if term not in STOP_WORDS
+    ]
+
+
+def get_stream_texts(value):
+    """
+    Yield the text of every CharBlock, TextBlock and RichTextBlock in a StreamField value.
+    """
+    for block, raw_value in walk_raw_blocks(value.stream_block, value.get_prep_value()):
+        if not isinstance(raw_value, str) or not raw_value:
+            continue
+        if isinstance(block, RichTextBlock):
+            yield html.unescape(TAG_RE.sub(' ', raw_value))
+        elif isinstance(block, (CharBlock, TextBlock)):
+            yield raw_value
+
+
+def get_page_texts(page):
+    """
+    Return `(text, weight)` for the text of a specific page to index: its `search_fields`, its search description
+    and every StreamField.
+    """
+    texts = []
+    field_names = set()
+    for search_field in page.search_fields:
+        if not isinstance(search_field, SearchField):
+            continue
+        field_names.add(search_field.field_name)
+        value = getattr(page, search_field.field_name, None)
+        if callable(value):
+            value = value()
+        weight = search_field.boost or BODY_WEIGHT
+        if isinstance(value, StreamValue):
+            texts.extend((text, weight) for text in get_stream_texts(value))
+        elif value:
+            texts.append((str(value), weight))
+
+    if page.search_description:
+        texts.append((page.search_description, DESCRIPTION_WEIGHT))
+
+    for field in page._meta.get_fields():
+        if isinstance(field, StreamField) and field.name not in field_names:
+            texts.extend((text, BODY_WEIGHT) for text in get_stream_texts(getattr(page, field.name)))
+
+    return texts
+
+
+def get_summary(page, texts):
+    """Return the text shown under a page's search result: its search description, or the start of its body."""
+    if page.search_description:
+        return page.search_description
+    body = ' '.join(text for text, weight in texts if weight == BODY_WEIGHT)
+    return Truncator(' '.join(body.split())).words(SUMMARY_WORDS)
+
+
+def get_entries(indexed_page, texts):
+    """
+    Return the IndexEntries for a page's texts. Weights grow with the log of how often a term appears, so long pages
+    don't outweigh short ones by repetition alone.
+    """
+    weights = Counter()
+    for text, weight in texts:
+        for term in tokenize(text):
+            weights[term] += weight
+    return [
+        IndexEntry(term=term, page=indexed_page, weight=1 + math.log(weight))
+        for term, weight in weights.items()
+    ]
+
+
+def get_restricted_paths():
+    """Return the paths of the pages with view restrictions. Their descendants are restricted too."""
+    return list(PageViewRestriction.objects.values_list('page__path', flat=True))
+
+
+def is_searchable(page, restricted_paths):
+    return page.live and not any(page.path.startswith(path) for path in restricted_paths)
+
+
+def update_index(pages, restricted_paths=None):
+    """
+    Replace the index entries of a list of specific pages. Pages which aren't live, or are private, are removed.
+    """
+    if restricted_paths is None:
+        restricted_paths = get_restricted_paths()
+
+    indexed_pages = []
+    entries = []
+    for page in pages:
+        if not is_searchable(page, restricted_paths):
+            continue
+        texts = get_page_texts(page)
+        indexed_page = IndexedPage(page_id=page.pk, title=page.title, summary=get_summary(page, texts))
+        indexed_pages.append(indexed_page)
+        entries.extend(get_entries(indexed_page, texts))
+
+    with transaction.atomic():
+        IndexEntry.objects.filter(page_id__in=[page.pk for page in pages]).delete()
+        IndexedPage.objects.filter(page_id__in=[page.pk for page in pages]).delete()
+        IndexedPage.objects.bulk_create(indexed_pages)
+        IndexEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+
+
+def index_page(page):
+    """Add a page to the index, or update it."""
+    update_index([page.specific])
+
+
+def remove_page(page):
+    IndexedPage.objects.filter(page_id=page.pk).delete()
+
+
+def update_pages(pages, batch_size=BATCH_SIZE):
+    """Update the index entries of every page in a queryset, `batch_size` pages at a time."""
+    restricted_paths = get_restricted_paths()
+    page_ids = list(pages.order_by('path').values_list('id', flat=True))
+    for start in range(0, len(page_ids), batch_size):
+        batch = Page.objects.filter(id__in=page_ids[start:start + batch_size]).specific()
+        update_index(list(batch), restricted_paths)
+
+
+def index_subtree(page):
+    """
+    Update a page and its descendants, which may have become private or public because the page was restricted, or
+    moved.
+    """
+    update_pages(Page.objects.descendant_of(page, inclusive=True))
+
+
+def rebuild_index(batch_size=BATCH_SIZE):
+    """
+    Index every live page from scratch, `batch_size` pages at a time. Searches see the old index until it's done.
+    Returns the number of pages indexed.
+    """
+    with transaction.atomic():
+        IndexEntry.objects.all().delete()
+        IndexedPage.objects.all().delete()
+        update_pages(Page.objects.live().filter(depth__gt=1), batch_size)
+
+    return IndexedPage.objects.count()
+
+
+class SearchResults:
+    """
+    The pages matching a search, best match first. Results are looked up a slice at a time, so it can be paginated
+    with django's Paginator. Each result is an IndexedPage with its `score`.
+    """
+
+    def __init__(self, scores, count=None):
+        self.scores = scores
+        self._count = count
+
+    def count(self):
+        if self._count is None:
+            self._count = self.scores.count()
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+
+        rows = list(self.scores[index])
+        indexed_pages = IndexedPage.objects.select_related('page').in_bulk([row['page'] for row in rows])
+        results = []
+        for row in rows:
+            indexed_page = indexed_pages[row['page']]
+            indexed_page.score = row['score']
+            results.append(indexed_page)
+        return results
+
+
+def contains_every_page(root_page):
+    """
+    Return True if every indexed page is `root_page` or one of its descendants, as on a site whose root page is the
+    only child of the tree's root. Searches of the whole index don't need to filter pages by their path.
+    """
+    if root_page.is_root():
+        return True
+    if root_page.depth != 2:
+        return False
+
+    # Page.depth isn't indexed, so the answer is kept until pages are added, moved or deleted
+    cache = get_cache()
+    key = make_key('search-root', get_generation(PAGE_TREE_CACHE), root_page.pk)
+    contains = cache.get(key)
+    if contains is None:
+        contains = not Page.objects.filter(depth=2).exclude(pk=root_page.pk).exists()
+        cache.set(key, contains, get_timeout())
+    return contains
+
+
+def search(query, root_page=None):
+    """
+    Return the SearchResults for the indexed pages containing every term in `query`, limited to `root_page` and its
+    descendants if it's given.
+
+    Pages are scored by the weight of each term on the page, times how rare the term is across all of the pages.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return SearchResults(IndexEntry.objects.none())
+
+    page_counts = dict(
+        IndexEntry.objects.filter(term__in=terms).values_list('term').annotate(Count('page')).order_by()
+    )
+    if len(page_counts) < len(terms):
+        return SearchResults(IndexEntry.objects.none())
+
+    if root_page is not None and contains_every_page(root_page):
+        root_page = None
+
+    total = IndexedPage.objects.count()
+    if len(terms) == 1:
+        # Every entry for the term is a result, already in order in the term's index
+        term = terms[0]
+        entries = IndexEntry.objects.filter(term=term)
+        count = page_counts[term]
+        if root_page is not None:
+            entries = entries.filter(page__page__path__startswith=root_page.path)
+            count = None
+        scores = entries.annotate(
+            score=F('weight') * Value(math.log(1 + total / page_counts[term]), output_field=FloatField()),
+        ).values('page', 'score').order_by('-weight', 'page')
+        return SearchResults(scores, count=count)
+
+    # Only pages with the rarest term can match, so start from the fewest
+    rarest_term = min(terms, key=page_counts.get)
+    entries = IndexEntry.objects.filter(
+        term__in=terms,
+        page__in=IndexEntry.objects.filter(term=rarest_term).values('page'),
+    )
+    if root_page is not None:
+        entries = entries.filter(page__page__path__startswith=root_page.path)
+
+    scores = entries.values('page').annotate(
+        matched=Count('term'),
+        score=Sum(
+            Case(
+                *[When(term=term, then=F('weight') * Value(math.log(1 + total / page_counts[term]))) for term in terms],
+                output_field=FloatField(),
+            ),
+        ),
+    ).filter(matched=len(terms)).order_by('-score', 'page')
+
+    return SearchResults(scores)
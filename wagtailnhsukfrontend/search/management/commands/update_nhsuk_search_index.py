@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from wagtailnhsukfrontend.search.index import BATCH_SIZE, rebuild_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the wagtailnhsukfrontend search index from every live page. Pages are indexed as they are "
+        "published, so this is only needed when the search app is added, or after changing page privacy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help="Number of pages to load and index at a time.",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_index(batch_size=options['batch_size'])
+        self.stdout.write("Indexed {} pages".format(count))
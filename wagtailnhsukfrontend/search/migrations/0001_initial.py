@@ -0,0 +1,44 @@
+# Generated by Django 3.1.14 on 2026-10-17 00:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('wagtailcore', '0060_fix_workflow_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexedPage',
+            fields=[
+                ('page', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='wagtailcore.page')),
+                ('title', models.CharField(max_length=255)),
+                ('summary', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='IndexEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('weight', models.FloatField()),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='wagtailnhsukfrontendsearch.indexedpage')),
+            ],
+            options={
+                'verbose_name_plural': 'index entries',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='indexentry',
+            index=models.Index(fields=['term', '-weight', 'page'], name='nhsuk_search_term_weight'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='indexentry',
+            unique_together={('term', 'page')},
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class IndexedPage(models.Model):
+    """
+    A live page in the search index, with what its search result shows.
+    """
+    page = models.OneToOneField(
+        'wagtailcore.Page',
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    title = models.CharField(max_length=255)
+    summary = models.TextField(blank=True)
+
+    def __str__(self):
+        return self.title
+
+
+class IndexEntry(models.Model):
+    """
+    A term in the text of an indexed page, weighted by how often and where it appears.
+    """
+    term = models.CharField(max_length=100)
+    page = models.ForeignKey(IndexedPage, on_delete=models.CASCADE, related_name='entries')
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = [('term', 'page')]
+        # A single-term search reads a term's pages in the order they're ranked
+        indexes = [models.Index(fields=['term', '-weight', 'page'], name='nhsuk_search_term_weight')]
+        verbose_name_plural = 'index entries'
+
+    def __str__(self):
+        return self.term
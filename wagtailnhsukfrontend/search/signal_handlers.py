@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save
+from wagtail.core.models import Page, PageViewRestriction
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+
+from wagtailnhsukfrontend.search.index import index_page, index_subtree, remove_page
+
+
+def update_index_on_publish(instance, **kwargs):
+    index_page(instance)
+
+
+def remove_from_index_on_unpublish(instance, **kwargs):
+    remove_page(instance)
+
+
+def update_subtree_on_move(instance, **kwargs):
+    index_subtree(instance)
+
+
+def update_subtree_on_restriction_change(instance, **kwargs):
+    # The page is gone when its restrictions are deleted along with it
+    page = Page.objects.filter(id=instance.page_id).first()
+    if page is not None:
+        index_subtree(page)
+
+
+def register_signal_handlers():
+    # Deleted pages are removed from the index by the cascade from IndexedPage.page
+    page_published.connect(update_index_on_publish)
+    page_unpublished.connect(remove_from_index_on_unpublish)
+    post_page_move.connect(update_subtree_on_move)
+    post_save.connect(update_subtree_on_restriction_change, sender=PageViewRestriction)
+    post_delete.connect(update_subtree_on_restriction_change, sender=PageViewRestriction)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from wagtailnhsukfrontend.search import views
+
+urlpatterns = [
+    path('', views.search, name='nhsuk_search'),
+]
@@ -0,0 +1,55 @@
+from django.core.paginator import Paginator
+from django.http import QueryDict
+from django.template.response import TemplateResponse
+from wagtail.core.models import Site
+
+from wagtailnhsukfrontend.page_urls import get_page_urls
+from wagtailnhsukfrontend.search import index
+
+RESULTS_PER_PAGE = 10
+
+# `q` is the usual name for the search field, and `search-field` is the header search form's default
+QUERY_PARAMS = ['q', 'search-field']
+
+
+def get_query(request):
+    for param in QUERY_PARAMS:
+        if request.GET.get(param):
+            return request.GET[param].strip()
+    return ''
+
+
+def get_page_link(query, number):
+    params = QueryDict(mutable=True)
+    params['q'] = query
+    params['p'] = number
+    return '?' + params.urlencode()
+
+
+def search(request):
+    """
+    Show the pages on the request's site which match the search query, a page of results at a time.
+    """
+    query = get_query(request)
+    site = Site.find_for_request(request)
+    results = index.search(query, root_page=site.root_page if site else None)
+
+    paginator = Paginator(results, RESULTS_PER_PAGE)
+    results_page = paginator.get_page(request.GET.get('p'))
+    urls = get_page_urls([result.page for result in results_page], request)
+    for result in results_page:
+        result.url = urls[result.page_id]
+
+    context = {
+        'query': query,
+        'results': results_page,
+        'paginator': paginator,
+    }
+    if results_page.has_previous():
+        context['prev_url'] = get_page_link(query, results_page.previous_page_number())
+        context['prev_label'] = '{} of {}'.format(results_page.previous_page_number(), paginator.num_pages)
+    if results_page.has_next():
+        context['next_url'] = get_page_link(query, results_page.next_page_number())
+        context['next_label'] = '{} of {}'.format(results_page.next_page_number(), paginator.num_pages)
+
+    return TemplateResponse(request, 'wagtailnhsukfrontend/search/results.html', context)
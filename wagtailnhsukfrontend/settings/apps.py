@@ -5,3 +5,7 @@ class SettingsAppConfig(AppConfig):
     name = 'wagtailnhsukfrontend.settings'
     label = 'wagtailnhsukfrontendsettings'
     verbose_name = "Wagtail NHSUK Frontend Settings"
+
+    def ready(self):
+        from wagtailnhsukfrontend.settings.signal_handlers import register_signal_handlers
+        register_signal_handlers()
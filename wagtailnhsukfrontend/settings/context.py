@@ -0,0 +1,76 @@
+from wagtailnhsukfrontend.cache import get_cache, get_generation, get_timeout, make_key
+from wagtailnhsukfrontend.settings.models import FooterSettings, HeaderSettings
+
+HEADER_CACHE = 'header'
+FOOTER_CACHE = 'footer'
+
+
+def build_header_context(site):
+    """
+    Build the header template context for a site from the HeaderSettings.
+    """
+    header = HeaderSettings.base_queryset().select_related(
+        'service_link',
+        'logo_link',
+    ).get_or_create(site=site)[0]
+
+    return {
+        'service_name': header.service_name,
+        'service_href': header.service_link.relative_url(site) if header.service_link else '',
+        'service_long_name': header.service_long_name,
+        'transactional': header.transactional,
+        'logo_href': header.logo_link.relative_url(site) if header.logo_link else '',
+        'logo_aria': header.logo_aria,
+        'show_search': header.show_search,
+        'primary_links': [
+            {
+                'label': link.label,
+                'url': link.page.relative_url(site)
+            }
+            for link in header.navigation_links.select_related('page')
+        ],
+    }
+
+
+def get_header_context(site):
+    """
+    Return the header template context for a site, building it if it isn't already cached.
+    The cache is invalidated by the signal handlers in `wagtailnhsukfrontend.settings.signal_handlers`.
+    """
+    cache = get_cache()
+    key = make_key(HEADER_CACHE, get_generation(HEADER_CACHE), site.pk)
+    context = cache.get(key)
+    if context is None:
+        context = build_header_context(site)
+        cache.set(key, context, get_timeout())
+    return context
+
+
+def build_footer_context(site):
+    """
+    Build the footer template context for a site from the FooterSettings.
+    """
+    footer = FooterSettings.for_site(site)
+
+    return {
+        'primary_links': [
+            {
+                'label': link.link_label,
+                'url': link.link_url
+            }
+            for link in footer.footer_links.all()
+        ],
+    }
+
+
+def get_footer_context(site):
+    """
+    Return the footer template context for a site, building it if it isn't already cached.
+    """
+    cache = get_cache()
+    key = make_key(FOOTER_CACHE, get_generation(FOOTER_CACHE), site.pk)
+    context = cache.get(key)
+    if context is None:
+        context = build_footer_context(site)
+        cache.set(key, context, get_timeout())
+    return context
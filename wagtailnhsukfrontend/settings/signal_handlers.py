@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save
+from wagtail.core.models import Page, Site
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+
+from wagtailnhsukfrontend.cache import bump_generation
+from wagtailnhsukfrontend.settings.context import FOOTER_CACHE, HEADER_CACHE
+from wagtailnhsukfrontend.settings.models import (
+    FooterLinks,
+    FooterSettings,
+    HeaderSettings,
+    NavigationLink,
+)
+
+
+def invalidate_header_cache(**kwargs):
+    bump_generation(HEADER_CACHE)
+
+
+def invalidate_footer_cache(**kwargs):
+    bump_generation(FOOTER_CACHE)
+
+
+def invalidate_header_cache_for_page(instance, **kwargs):
+    # Moving or renaming any page can change the URL of a linked page (or its descendants),
+    # so every cached header is dropped rather than looking for affected links.
+    if isinstance(instance, Page):
+        bump_generation(HEADER_CACHE)
+
+
+def register_signal_handlers():
+    # NavigationLinks are saved after their HeaderSettings, so both need to invalidate the cache
+    for model in [HeaderSettings, NavigationLink, Site]:
+        post_save.connect(invalidate_header_cache, sender=model)
+        post_delete.connect(invalidate_header_cache, sender=model)
+
+    for model in [FooterSettings, FooterLinks, Site]:
+        post_save.connect(invalidate_footer_cache, sender=model)
+        post_delete.connect(invalidate_footer_cache, sender=model)
+
+    page_published.connect(invalidate_header_cache_for_page)
+    page_unpublished.connect(invalidate_header_cache_for_page)
+    post_page_move.connect(invalidate_header_cache_for_page)
+    post_delete.connect(invalidate_header_cache_for_page)
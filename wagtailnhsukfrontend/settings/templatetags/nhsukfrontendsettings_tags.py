@@ -1,48 +1,99 @@
+import functools
+import hashlib
+from inspect import getfullargspec, unwrap
+
 from django import template
+from django.conf import settings
+from django.template.library import InclusionNode, parse_bits
+from django.utils.safestring import mark_safe
 from wagtail.core.models import Site
-from wagtailnhsukfrontend.settings.models import HeaderSettings, FooterSettings
+from wagtailnhsukfrontend.assets import get_manifest_version
+from wagtailnhsukfrontend.cache import get_cache, get_generation, get_timeout, make_key
+from wagtailnhsukfrontend.query_budgets import query_budget
+from wagtailnhsukfrontend.settings.context import (
+    FOOTER_CACHE,
+    HEADER_CACHE,
+    get_footer_context,
+    get_header_context,
+)
+from wagtailnhsukfrontend.tag_contexts import get_loaded_context
 
 register = template.Library()
 
 
-@register.inclusion_tag('wagtailnhsukfrontend/header.html', takes_context=True)
+class FragmentCacheInclusionNode(InclusionNode):
+    """
+    An InclusionNode which keeps its rendered output in the cache, when `WAGTAILNHSUKFRONTEND_FRAGMENT_CACHE` is enabled.
+    The output is cached per site, per generation of `cache_name`, per asset build and per tag argument.
+    """
+
+    def __init__(self, cache_name, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_name = cache_name
+
+    def render(self, context):
+        if not getattr(settings, 'WAGTAILNHSUKFRONTEND_FRAGMENT_CACHE', False):
+            return super().render(context)
+
+        site = Site.find_for_request(context['request'])
+        resolved_args, resolved_kwargs = self.get_resolved_arguments(context)
+        cache = get_cache()
+        key = make_key(
+            'fragment',
+            self.cache_name,
+            get_generation(self.cache_name),
+            # Icons link to the hashed sprite
+            get_manifest_version(),
+            site.pk,
+            hashlib.md5(repr(sorted(resolved_kwargs.items())).encode()).hexdigest(),
+        )
+        html = cache.get(key)
+        if html is None:
+            html = super().render(context)
+            cache.set(key, html, get_timeout())
+        return mark_safe(html)
+
+
+def fragment_cached_inclusion_tag(filename, cache_name):
+    """
+    Register an inclusion tag which renders through a FragmentCacheInclusionNode.
+    The tag must take the template context as its first argument.
+    """
+    def dec(func):
+        params, varargs, varkw, defaults, kwonly, kwonly_defaults, _ = getfullargspec(unwrap(func))
+
+        @functools.wraps(func)
+        def compile_func(parser, token):
+            bits = token.split_contents()[1:]
+            args, kwargs = parse_bits(
+                parser, bits, params, varargs, varkw, defaults,
+                kwonly, kwonly_defaults, True, func.__name__,
+            )
+            return FragmentCacheInclusionNode(cache_name, func, True, args, kwargs, filename)
+
+        register.tag(func.__name__, compile_func)
+        return func
+    return dec
+
+
+@fragment_cached_inclusion_tag('wagtailnhsukfrontend/header.html', HEADER_CACHE)
+@query_budget(3)  # site, header settings, navigation links with their pages
 def header(context, **kwargs):
-    request = context['request']
-    site = Site.find_for_request(request)
-    header = HeaderSettings.for_site(site)
+    header_context = get_loaded_context(context, 'header')
+    if header_context is None:
+        header_context = get_header_context(Site.find_for_request(context['request']))
 
     return {
-        'service_name': header.service_name,
-        'service_href': header.service_link.relative_url(site) if header.service_link else '',
-        'service_long_name': header.service_long_name,
-        'transactional': header.transactional,
-        'logo_href': header.logo_link.relative_url(site) if header.logo_link else '',
-        'logo_aria': header.logo_aria,
-        'show_search': header.show_search,
+        **header_context,
         'search_action': kwargs.get('search_action', None),
         'search_field_name': kwargs.get('search_field_name', None),
-        'primary_links': [
-            {
-                'label': link.label,
-                'url': link.page.relative_url(site)
-            }
-            for link in header.navigation_links.all()
-        ],
     }
 
 
-@register.inclusion_tag("wagtailnhsukfrontend/footer.html", takes_context=True)
+@fragment_cached_inclusion_tag("wagtailnhsukfrontend/footer.html", FOOTER_CACHE)
+@query_budget(3)  # site, footer settings, footer links
 def footer(context):
-    request = context['request']
-    site = Site.find_for_request(request)
-    footer = FooterSettings.for_site(site)
-
-    return {
-        'primary_links': [
-            {
-                'label': link.link_label,
-                'url': link.link_url
-            }
-            for link in footer.footer_links.all()
-        ],
-    }
+    footer_context = get_loaded_context(context, 'footer')
+    if footer_context is None:
+        footer_context = get_footer_context(Site.find_for_request(context['request']))
+    return footer_context
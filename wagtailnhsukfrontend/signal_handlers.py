@@ -0,0 +1,40 @@
+from django.db.models.signals import post_delete, post_save
+from wagtail.core.models import Page, Site
+from wagtail.core.signals import page_published, page_unpublished, post_page_move
+
+from wagtailnhsukfrontend.cache import bump_generation
+from wagtailnhsukfrontend.page_tree import INDEXED_FIELDS, PAGE_TREE_CACHE
+from wagtailnhsukfrontend.page_urls import PAGE_URL_CACHE
+
+
+def invalidate_page_tree(instance, **kwargs):
+    if isinstance(instance, Page):
+        bump_generation(PAGE_TREE_CACHE)
+
+
+def invalidate_page_tree_on_save(instance, update_fields=None, **kwargs):
+    # Saving a draft revision only updates fields we don't index
+    if update_fields is not None and not set(update_fields) & set(INDEXED_FIELDS):
+        return
+    invalidate_page_tree(instance)
+
+
+def invalidate_page_urls(**kwargs):
+    # A new slug or parent changes the URL of every descendant too, so all URLs are dropped
+    bump_generation(PAGE_URL_CACHE)
+
+
+def register_signal_handlers():
+    page_published.connect(invalidate_page_tree)
+    page_unpublished.connect(invalidate_page_tree)
+    post_page_move.connect(invalidate_page_tree)
+    post_save.connect(invalidate_page_tree_on_save)
+    post_delete.connect(invalidate_page_tree)
+
+    # Rich text links to an unpublished or deleted page are no longer rendered as links
+    page_published.connect(invalidate_page_urls)
+    page_unpublished.connect(invalidate_page_urls)
+    post_page_move.connect(invalidate_page_urls)
+    post_delete.connect(invalidate_page_urls, sender=Page)
+    post_save.connect(invalidate_page_urls, sender=Site)
+    post_delete.connect(invalidate_page_urls, sender=Site)
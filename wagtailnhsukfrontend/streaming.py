@@ -0,0 +1,205 @@
+"""
+Stream a page template, so that the <head> and header are sent before the page's StreamField blocks are rendered.
+
+`stream_template` renders a template like django does, except that it follows `{% extends %}` and `{% block %}`
+itself, and renders StreamField values output with `{{ page.body }}` or `{% include_block page.body %}` one block at a
+time. Everything rendered so far is sent before each StreamField block, and the rest after the last one.
+"""
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.template import VariableDoesNotExist, loader
+from django.template.base import TextNode, VariableNode, render_value_in_context
+from django.template.context import make_context
+from django.template.defaulttags import CsrfTokenNode
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, BlockContext, BlockNode, ExtendsNode
+from django.utils.html import format_html
+from wagtail.core.blocks import StreamValue
+from wagtail.core.templatetags.wagtailcore_tags import IncludeBlockNode
+
+from wagtailnhsukfrontend.blocks import get_template_names
+
+# Yielded by the node renderers below where the output so far should be sent
+FLUSH = object()
+
+# Whether each page template outputs a CSRF token, by name
+_csrf_templates = {}
+
+
+def stream_sessions():
+    """
+    Return True if pages are streamed to visitors with a session too, with WAGTAILNHSUKFRONTEND_STREAM_SESSIONS.
+    Every streamed page then loads the session and sets the CSRF cookie, so it varies on the `Cookie` header.
+    """
+    return getattr(settings, 'WAGTAILNHSUKFRONTEND_STREAM_SESSIONS', False)
+
+
+def uses_csrf_token(template):
+    """Return True if a template from `django.template.loader`, or one it includes or extends, outputs a CSRF token."""
+    name = template.template.name
+    if name not in _csrf_templates:
+        _csrf_templates[name] = any(
+            loader.get_template(template_name).template.nodelist.get_nodes_by_type(CsrfTokenNode)
+            for template_name in get_template_names(name)
+        )
+    return _csrf_templates[name]
+
+
+def stream_nodelist(nodelist, context):
+    for node in nodelist:
+        if isinstance(node, ExtendsNode):
+            yield from stream_extends(node, context)
+        elif isinstance(node, BlockNode):
+            yield from stream_block(node, context)
+        elif isinstance(node, VariableNode):
+            yield from stream_variable(node, context)
+        elif isinstance(node, IncludeBlockNode):
+            yield from stream_include_block(node, context)
+        else:
+            yield node.render_annotated(context)
+
+
+def stream_extends(node, context):
+    """Equivalent to `ExtendsNode.render`."""
+    compiled_parent = node.get_parent(context)
+
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(node.blocks)
+
+    for parent_node in compiled_parent.nodelist:
+        if not isinstance(parent_node, TextNode):
+            if not isinstance(parent_node, ExtendsNode):
+                block_context.add_blocks({n.name: n for n in compiled_parent.nodelist.get_nodes_by_type(BlockNode)})
+            break
+
+    with context.render_context.push_state(compiled_parent, isolated_context=False):
+        yield from stream_nodelist(compiled_parent.nodelist, context)
+
+
+def stream_block(node, context):
+    """Equivalent to `BlockNode.render`."""
+    block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
+    with context.push():
+        if block_context is None:
+            context['block'] = node
+            yield from stream_nodelist(node.nodelist, context)
+        else:
+            push = block = block_context.pop(node.name)
+            if block is None:
+                block = node
+            block = type(node)(block.name, block.nodelist)
+            block.context = context
+            context['block'] = block
+            yield from stream_nodelist(block.nodelist, context)
+            if push is not None:
+                block_context.push(node.name, push)
+
+
+def stream_variable(node, context):
+    """Equivalent to `VariableNode.render`."""
+    try:
+        value = node.filter_expression.resolve(context)
+    except UnicodeDecodeError:
+        return
+    if is_streamable(value):
+        # Like `StreamValue.__html__`, which doesn't pass the template context on
+        yield from stream_value(value, None)
+    else:
+        yield render_value_in_context(value, context)
+
+
+def stream_include_block(node, context):
+    """Equivalent to `IncludeBlockNode.render`."""
+    try:
+        value = node.block_var.resolve(context)
+    except VariableDoesNotExist:
+        return
+    if not is_streamable(value):
+        yield node.render_annotated(context)
+        return
+
+    new_context = context.flatten() if node.use_parent_context else {}
+    for name, extra_value in (node.extra_context or {}).items():
+        new_context[name] = extra_value.resolve(context)
+    yield from stream_value(value, new_context)
+
+
+def is_streamable(value):
+    """Return True for a StreamField value whose blocks are rendered one after another, without a template."""
+    return isinstance(value, StreamValue) and not value.stream_block.get_template(context=None)
+
+
+def stream_value(value, context):
+    """Equivalent to `StreamBlock.render_basic`, flushing before each block."""
+    for i, child in enumerate(value):
+        yield FLUSH
+        if i:
+            yield '\n'
+        yield format_html('<div class="block-{}">{}</div>', child.block_type, child.render(context=context))
+    yield FLUSH
+
+
+def stream_template(template, context=None, request=None):
+    """
+    Render a template from `django.template.loader`, yielding the output in chunks.
+    Equivalent to `template.render(context, request)`.
+    """
+    context = make_context(context, request, autoescape=template.backend.engine.autoescape)
+    template = template.template
+    chunk = []
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            context.template_name = template.name
+            for output in stream_nodelist(template.nodelist, context):
+                if output is not FLUSH:
+                    chunk.append(str(output))
+                elif chunk:
+                    yield ''.join(chunk)
+                    chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+class StreamingTemplateResponse(StreamingHttpResponse):
+    """
+    A streaming equivalent of `TemplateResponse`, which renders the template with `stream_template`.
+    Like a TemplateResponse, its template and context can be changed by template response middleware until it is
+    rendered.
+    """
+
+    def __init__(self, request, template, context=None, content_type=None, status=None, charset=None):
+        super().__init__(content_type=content_type, status=status, charset=charset)
+        self._request = request
+        self.template_name = template
+        self.context_data = context
+        self.is_rendered = False
+
+    @classmethod
+    def from_template_response(cls, response):
+        """Return a StreamingTemplateResponse with the template, context, status and headers of a TemplateResponse."""
+        streaming_response = cls(
+            response._request,
+            response.template_name,
+            response.context_data,
+            status=response.status_code,
+            charset=response.charset,
+        )
+        for header, value in response.items():
+            streaming_response[header] = value
+        streaming_response.cookies = response.cookies
+        return streaming_response
+
+    def resolve_template(self, template):
+        if isinstance(template, (list, tuple)):
+            return loader.select_template(template)
+        if isinstance(template, str):
+            return loader.get_template(template)
+        return template
+
+    def render(self):
+        if not self.is_rendered:
+            template = self.resolve_template(self.template_name)
+            self.streaming_content = stream_template(template, self.context_data, self._request)
+            self.is_rendered = True
+        return self
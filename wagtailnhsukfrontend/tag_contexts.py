@@ -0,0 +1,91 @@
+"""
+Load the template contexts of the `header`, `footer`, `breadcrumb`, `pagination` and `contents_list` tags
+concurrently, for ASGI deployments.
+
+Each tag makes its database queries one after another while the template is rendered. `load_tag_contexts` runs the
+same queries for each tag in its own thread before rendering, so their round-trips overlap, and the tags then render
+the contexts it loaded instead of querying again. `TagContextMiddleware` does this for Wagtail page responses.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from wagtail.core.models import Site
+
+from wagtailnhsukfrontend.navigation import get_breadcrumb_context, get_contents_list_context, get_pagination_context
+from wagtailnhsukfrontend.settings.context import get_footer_context, get_header_context
+
+# Template context variable holding the loaded TagContexts
+TAG_CONTEXTS = 'nhsuk_tag_contexts'
+
+DEFAULT_TAGS = ['header', 'footer', 'breadcrumb']
+
+LOADERS = {
+    'header': lambda page, site, request: get_header_context(site),
+    'footer': lambda page, site, request: get_footer_context(site),
+    'breadcrumb': lambda page, site, request: get_breadcrumb_context(page, site),
+    'pagination': lambda page, site, request: get_pagination_context(page, request),
+    'contents_list': lambda page, site, request: get_contents_list_context(page, request),
+}
+
+
+def get_async_tags():
+    return getattr(settings, 'WAGTAILNHSUKFRONTEND_ASYNC_TAGS', DEFAULT_TAGS)
+
+
+class TagContexts:
+    """
+    The template contexts loaded for a page, by tag name.
+    """
+
+    def __init__(self, page, contexts):
+        self.page_id = page.pk
+        self.contexts = contexts
+
+    def get(self, tag, page=None):
+        """
+        Return the context loaded for `tag`, or None if it wasn't loaded, or was loaded for a different page.
+        """
+        if page is not None and page.pk != self.page_id:
+            return None
+        return self.contexts.get(tag)
+
+
+def get_loaded_context(context, tag, page=None):
+    """
+    Return the context loaded for `tag` from a template context, or None if the tag should build its own.
+    """
+    tag_contexts = context.get(TAG_CONTEXTS)
+    if tag_contexts is None:
+        return None
+    return tag_contexts.get(tag, page)
+
+
+def run_in_thread(func, *args):
+    """
+    Run `func` in a thread of its own, with the database connection handled as django handles a request's.
+    """
+    def run():
+        close_old_connections()
+        try:
+            return func(*args)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(run, thread_sensitive=False)()
+
+
+async def load_tag_contexts(request, page, tags=None):
+    """
+    Load the template contexts of `tags` for a page concurrently, returning them as a TagContexts.
+    `tags` defaults to the `WAGTAILNHSUKFRONTEND_ASYNC_TAGS` setting.
+    """
+    if tags is None:
+        tags = get_async_tags()
+
+    # Every tag needs the site, and looking it up caches it on the request for the tags and the page's URLs
+    site = await run_in_thread(Site.find_for_request, request)
+    contexts = await asyncio.gather(*(run_in_thread(LOADERS[tag], page, site, request) for tag in tags))
+
+    return TagContexts(page, dict(zip(tags, contexts)))
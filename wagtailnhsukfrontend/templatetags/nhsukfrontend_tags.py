@@ -1,10 +1,31 @@
 from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
 from wagtail.core.models import Page
 
+from wagtailnhsukfrontend.assets import ICON_SPRITE, get_critical_css, get_icon_sprite, get_manifest
+from wagtailnhsukfrontend.images import (
+    HERO_FILTER_SPEC,
+    SRCSET_SIZES,
+    SRCSET_WIDTHS,
+    get_hero_image_sets,
+    get_image_formats,
+    get_rendition,
+    get_srcset_filter_specs,
+)
+from wagtailnhsukfrontend.mixins import HeroMixin
+from wagtailnhsukfrontend.navigation import get_breadcrumb_context, get_contents_list_context, get_pagination_context
+from wagtailnhsukfrontend.page_urls import get_page_url
+from wagtailnhsukfrontend.query_budgets import query_budget
+from wagtailnhsukfrontend.tag_contexts import get_loaded_context
+
 register = template.Library()
 
 
 @register.inclusion_tag('wagtailnhsukfrontend/breadcrumb.html', takes_context=True)
+@query_budget(3)  # site, ancestors, site root paths
 def breadcrumb(context):
     """
     Generates an array of pages which are passed to the breadcrumb template.
@@ -12,17 +33,15 @@ def breadcrumb(context):
     page = context.get('page', None)
     if not isinstance(page, Page):
         raise Exception("'page' not found in template context")
-    site = page.get_site()
-
-    # Get pages which are an ancestor of the current page, but limited to pages under the site root (a.k.a the homepage)
-    breadcrumb_pages = page.get_ancestors(inclusive=False).descendant_of(site.root_page, inclusive=True).order_by("depth")
 
-    return {
-        'breadcrumb_pages': list(breadcrumb_pages),
-    }
+    breadcrumb_context = get_loaded_context(context, 'breadcrumb', page)
+    if breadcrumb_context is None:
+        breadcrumb_context = get_breadcrumb_context(page)
+    return breadcrumb_context
 
 
 @register.inclusion_tag('wagtailnhsukfrontend/pagination.html', takes_context=True)
+@query_budget(3)  # previous sibling, next sibling, site root paths
 def pagination(context):
     """
     Calculates previous and next page values which are passed to the pagination template.
@@ -30,24 +49,15 @@ def pagination(context):
     page = context.get('page', None)
     if not isinstance(page, Page):
         raise Exception("'page' not found in template context")
-    request = context['request']
-
-    prev = page.get_prev_siblings().live().first()
-    next = page.get_next_siblings().live().first()
-
-    template_context = {}
 
-    if prev:
-        template_context['prev_label'] = prev.title
-        template_context['prev_url'] = prev.get_url(request)
-    if next:
-        template_context['next_label'] = next.title
-        template_context['next_url'] = next.get_url(request)
-
-    return template_context
+    pagination_context = get_loaded_context(context, 'pagination', page)
+    if pagination_context is None:
+        pagination_context = get_pagination_context(page, context['request'])
+    return pagination_context
 
 
 @register.inclusion_tag('wagtailnhsukfrontend/contents_list.html', takes_context=True)
+@query_budget(2)  # siblings, site root paths
 def contents_list(context):
     """
     Generates a queryset of sibling pages which are passed to the contents_list template
@@ -55,21 +65,148 @@ def contents_list(context):
     page = context.get('page', None)
     if not isinstance(page, Page):
         raise Exception("'page' not found in template context")
-    request = context['request']
-
-    sibling_pages = page.get_siblings().live()
-    links = [
-        {
-            'label': sibling.title,
-            'href': sibling.get_url(request),
-            'is_current': sibling.id == page.id,
-        }
-        for sibling in sibling_pages
+
+    contents_list_context = get_loaded_context(context, 'contents_list', page)
+    if contents_list_context is None:
+        contents_list_context = get_contents_list_context(page, context['request'])
+    return contents_list_context
+
+
+@register.simple_tag(takes_context=True)
+def nhsuk_pageurl(context, page):
+    """
+    A cached equivalent of wagtail's `pageurl` tag.
+    """
+    if not hasattr(page, 'relative_url'):
+        raise ValueError("nhsuk_pageurl tag expected a Page object, got %r" % page)
+    return get_page_url(page, context.get('request'))
+
+
+@register.simple_tag
+def nhsuk_rendition(image, filter_spec):
+    """
+    Equivalent to `{% image image filter_spec as rendition %}`, using renditions fetched by `prefetch_renditions`.
+    """
+    if not image:
+        return None
+    return get_rendition(image, filter_spec)
+
+
+@register.simple_tag
+def nhsuk_picture_sources(image):
+    """
+    Output a `<source>` with `image` at each of the srcset widths for each of the WAGTAILNHSUKFRONTEND_IMAGE_FORMATS,
+    for a `<picture>` around the image's `<img>`. Outputs nothing if no formats are configured.
+    """
+    if not image:
+        return ''
+    return format_html_join('', '<source type="image/{}" srcset="{}" sizes="{}">', (
+        (image_format, ', '.join(
+            '{} {}w'.format(get_rendition(image, filter_spec).url, width)
+            for filter_spec, width in zip(get_srcset_filter_specs(image_format), SRCSET_WIDTHS)
+        ), SRCSET_SIZES)
+        for image_format in get_image_formats()
+    ))
+
+
+@register.simple_tag
+def nhsuk_srcset_sizes():
+    """
+    Output the `sizes` of the image, card and promo templates' `<img>`, which their `<picture>` sources share.
+    """
+    return SRCSET_SIZES
+
+
+@register.simple_tag
+def nhsuk_hero_style(image):
+    """
+    Return the inline style for a hero with `image` as its background. Browsers which support image-set() are given
+    one for each screen width to choose from, see fixes.css, and other browsers get a single rendition.
+    """
+    fallback = "url('{}')".format(get_rendition(image, HERO_FILTER_SPEC).url)
+    declarations = [
+        'background-image: {}'.format(fallback),
+        'background-image: var(--nhsuk-hero-image, {})'.format(fallback),
     ]
+    for name, (media, image_set) in get_hero_image_sets(image).items():
+        declarations.append('--nhsuk-hero-image-{}: image-set({})'.format(name, ', '.join(
+            "url('{}') {}".format(rendition.url, resolution) for rendition, resolution in image_set
+        )))
+    return '; '.join(declarations) + ';'
+
+
+@register.simple_tag(takes_context=True)
+def nhsuk_hero_preload(context):
+    """
+    Preload the hero image of a HeroMixin page, from the page's <head>.
+    Browsers can't otherwise find a CSS background image until the stylesheet has loaded.
+    """
+    page = context.get('page')
+    if not isinstance(page, HeroMixin):
+        return ''
+    return format_html_join(
+        '', '<link rel="preload" as="image" href="{}" imagesrcset="{}" media="{}">', page.get_hero_preloads(),
+    )
+
 
-    return {
-        'links': links,
-    }
+@register.simple_tag
+def nhsuk_static(path):
+    """
+    Return the URL of a wagtailnhsukfrontend static file, using its content-hashed name if the assets have been built.
+    `path` is relative to the wagtailnhsukfrontend static directory, e.g. 'css/wagtail-nhsuk-frontend.min.css'.
+    """
+    return static('wagtailnhsukfrontend/' + get_manifest().get(path, path))
+
+
+@register.simple_tag
+def nhsuk_critical_css(path='css/wagtail-nhsuk-frontend.min.css'):
+    """
+    Inline the critical CSS for a stylesheet and load the full stylesheet without blocking rendering.
+    Falls back to an ordinary stylesheet link if the assets haven't been built.
+    """
+    href = nhsuk_static(path)
+    critical_css = get_critical_css(path)
+    if critical_css is None:
+        return format_html('<link rel="stylesheet" type="text/css" href="{}">', href)
+
+    return format_html(
+        '<style>{}</style>'
+        '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        '<noscript><link rel="stylesheet" type="text/css" href="{}"></noscript>',
+        # Built from our own stylesheet, so it's safe to include as it is
+        mark_safe(critical_css),
+        href,
+        href,
+    )
+
+
+@register.simple_tag
+def nhsuk_icon(name):
+    """
+    Output an icon from the NHS.UK icon sprite, e.g. `{% nhsuk_icon 'search' %}`.
+    The sprite is a separate static file, unless WAGTAILNHSUKFRONTEND_INLINE_ICONS is set, in which case it must be
+    included in the page with `{% nhsuk_icon_sprite %}`.
+    """
+    if getattr(settings, 'WAGTAILNHSUKFRONTEND_INLINE_ICONS', False):
+        sprite_url = ''
+    else:
+        sprite_url = nhsuk_static(ICON_SPRITE)
+
+    return format_html(
+        '<svg class="nhsuk-icon nhsuk-icon__{}" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" '
+        'aria-hidden="true" focusable="false"><use href="{}#nhsuk-icon-{}"></use></svg>',
+        name,
+        sprite_url,
+        name,
+    )
+
+
+@register.simple_tag
+def nhsuk_icon_sprite():
+    """
+    Include the icon sprite in the page, for use with WAGTAILNHSUKFRONTEND_INLINE_ICONS.
+    """
+    return format_html('<div hidden>{}</div>', mark_safe(get_icon_sprite()))
 
 
 @register.filter
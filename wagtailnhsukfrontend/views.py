@@ -0,0 +1,61 @@
+import datetime
+from collections import OrderedDict
+
+from django.core.exceptions import PermissionDenied
+from django.utils import timezone
+from wagtail.admin.views.reports import ReportView
+from wagtail.core.models import UserPagePermissionsProxy
+
+from wagtailnhsukfrontend.review_dates import DEFAULT_DUE_WITHIN, get_review_dates_report, is_overdue
+
+
+class ReviewDatesReportView(ReportView):
+    """
+    An admin report of the pages the user can edit which are overdue for review or due soon.
+    See `wagtailnhsukfrontend.review_dates`.
+    """
+    template_name = 'wagtailnhsukfrontend/reports/review_dates.html'
+    title = 'Review dates'
+    header_icon = 'date'
+
+    list_export = ['status', 'next_review_date', 'last_review_date', 'page_type', 'title', 'url_path', 'id']
+    export_headings = {
+        'status': 'Status',
+        'next_review_date': 'Next review',
+        'last_review_date': 'Last review',
+        'page_type': 'Type',
+        'title': 'Title',
+        'url_path': 'URL path',
+        'id': 'ID',
+    }
+
+    def dispatch(self, request, *args, **kwargs):
+        if not UserPagePermissionsProxy(request.user).explorable_pages().exists():
+            raise PermissionDenied
+        self.now = timezone.now()
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_filename(self):
+        return 'review-dates-report-{}'.format(datetime.datetime.today().strftime('%Y-%m-%d'))
+
+    def get_queryset(self):
+        pages = None
+        if not self.request.user.is_superuser:
+            pages = UserPagePermissionsProxy(self.request.user).editable_pages()
+        return get_review_dates_report(DEFAULT_DUE_WITHIN, pages=pages, now=self.now)
+
+    def get_context_data(self, *args, **kwargs):
+        context = super().get_context_data(*args, **kwargs)
+        context['rows'] = [
+            dict(row, overdue=is_overdue(row['next_review_date'], self.now))
+            for row in context['object_list']
+        ]
+        return context
+
+    def to_row_dict(self, item):
+        row = dict(item, status='Overdue' if is_overdue(item['next_review_date'], self.now) else 'Due')
+        return OrderedDict((field, row[field]) for field in self.list_export)
+
+    def stream_csv(self, queryset):
+        # Iterate without caching the rows on the queryset, so a large report is streamed in constant memory
+        return super().stream_csv(queryset.iterator())
@@ -0,0 +1,28 @@
+from django.urls import path, reverse
+from wagtail.admin.menu import MenuItem
+from wagtail.core import hooks
+from wagtail.core.models import UserPagePermissionsProxy
+
+from wagtailnhsukfrontend.views import ReviewDatesReportView
+
+
+class ReviewDatesReportMenuItem(MenuItem):
+    def is_shown(self, request):
+        return UserPagePermissionsProxy(request.user).explorable_pages().exists()
+
+
+@hooks.register('register_admin_urls')
+def register_review_dates_report_url():
+    return [
+        path('reports/review-dates/', ReviewDatesReportView.as_view(), name='wagtailnhsukfrontend_review_dates'),
+    ]
+
+
+@hooks.register('register_reports_menu_item')
+def register_review_dates_report_menu_item():
+    return ReviewDatesReportMenuItem(
+        'Review dates',
+        reverse('wagtailnhsukfrontend_review_dates'),
+        icon_name='date',
+        order=1100,
+    )
@@ -0,0 +1,121 @@
+"""
+Warm up a process before it serves requests, so that the first requests don't pay to compile templates and prime
+caches.
+
+Call `warm_up()` once the app registry is ready, e.g. from a gunicorn `post_worker_init` hook, or set
+`WAGTAILNHSUKFRONTEND_WARM_UP = True` to warm up templates and blocks when the app is loaded.
+"""
+import inspect
+import os
+import time
+from collections import OrderedDict
+
+from django.apps import apps
+from django.template import engines
+from django.template.loader import get_template
+from django.template.loaders.cached import Loader as CachedLoader
+from wagtail.core.blocks import Block, ListBlock, StreamBlock, StructBlock
+from wagtail.core.fields import StreamField
+from wagtail.core.models import Site
+from wagtail.core.rich_text import expand_db_html
+
+from wagtailnhsukfrontend import blocks, page_tree
+from wagtailnhsukfrontend.blocks import CachedRender, get_template_version
+from wagtailnhsukfrontend.settings.context import get_footer_context, get_header_context
+
+TEMPLATE_PREFIX = 'wagtailnhsukfrontend/'
+
+
+def get_template_names():
+    """Return the name of every template in the wagtailnhsukfrontend apps."""
+    names = set()
+    for app_config in apps.get_app_configs():
+        if not app_config.name.startswith('wagtailnhsukfrontend'):
+            continue
+        templates_dir = os.path.join(app_config.path, 'templates')
+        for directory, _, filenames in os.walk(os.path.join(templates_dir, TEMPLATE_PREFIX)):
+            for filename in filenames:
+                if filename.endswith('.html'):
+                    names.add(os.path.relpath(os.path.join(directory, filename), templates_dir).replace(os.sep, '/'))
+    return sorted(names)
+
+
+def uses_cached_loader():
+    """Return True if any template engine caches compiled templates, which warming up templates relies on."""
+    return any(
+        isinstance(loader, CachedLoader)
+        for backend in engines.all()
+        if hasattr(backend, 'engine')
+        for loader in backend.engine.template_loaders
+    )
+
+
+def walk_block_definitions(block):
+    """Yield a block definition and every block definition nested inside it."""
+    yield block
+    if isinstance(block, (StreamBlock, StructBlock)):
+        for child_block in block.child_blocks.values():
+            yield from walk_block_definitions(child_block)
+    elif isinstance(block, ListBlock):
+        yield from walk_block_definitions(block.child_block)
+
+
+def get_block_definitions():
+    """
+    Return every NHS.UK block class instantiated on its own, and every block in a StreamField on a concrete model.
+    """
+    definitions = [
+        block_class()
+        for _, block_class in inspect.getmembers(blocks, inspect.isclass)
+        if issubclass(block_class, Block) and block_class.__module__ == blocks.__name__
+    ]
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, StreamField):
+                definitions.append(field.stream_block)
+    return definitions
+
+
+def warm_up_templates():
+    for name in get_template_names():
+        get_template(name)
+
+
+def warm_up_blocks():
+    for definition in get_block_definitions():
+        for block in walk_block_definitions(definition):
+            template_name = block.get_template()
+            if template_name:
+                get_template(template_name)
+                if isinstance(block, CachedRender):
+                    get_template_version(template_name)
+    # Wagtail builds its rich text rewriters the first time rich text is rendered
+    expand_db_html('')
+
+
+def warm_up_settings():
+    """Prime the shared caches for the header, footer and site root paths."""
+    Site.get_site_root_paths()
+    for site in Site.objects.all():
+        get_header_context(site)
+        get_footer_context(site)
+    if page_tree.is_enabled():
+        page_tree.get_page_tree()
+
+
+def warm_up(prime_settings=False):
+    """
+    Compile every wagtailnhsukfrontend template, walk the NHS.UK block definitions, and, if `prime_settings` is set,
+    prime the settings caches, which queries the database.
+    Returns the time taken by each step, in seconds.
+    """
+    steps = [('templates', warm_up_templates), ('blocks', warm_up_blocks)]
+    if prime_settings:
+        steps.append(('settings', warm_up_settings))
+
+    timings = OrderedDict()
+    for name, step in steps:
+        start = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - start
+    return timings